@@ -15,9 +15,9 @@ from ..db.conn import SessionLocal, get_db
 from ..model.companynews import CompanyNews
 from ..model.company import Company
 from ..util.embedding import generate_embedding
+from ..util.openai_provider import openai_provider
 
 from dotenv import load_dotenv
-from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import PGVector
 from langchain.schema import Document
 
@@ -39,9 +39,6 @@ if not DATABASE_URL:
 # PGVector 컬렉션 이름
 COLLECTION_NAME = "company_news_vectors"
 
-# OpenAI 임베딩 (PGVector 초기화에 필요)
-embeddings = OpenAIEmbeddings()
-
 async def insert_company_news_and_vectors(db: Session):
     """
     회사 뉴스 데이터를 CSV 파일에서 읽어 데이터베이스에 삽입하고,
@@ -166,7 +163,7 @@ async def insert_company_news_and_vectors(db: Session):
             vector_store = PGVector(
                 collection_name=COLLECTION_NAME,
                 connection_string=DATABASE_URL,
-                embedding_function=embeddings, # PGVector 초기화에 필요
+                embedding_function=openai_provider.embeddings(), # PGVector 초기화에 필요 (공유 HTTP 연결 풀 사용)
                 pre_delete_collection=True,
                 async_mode=True,
             )
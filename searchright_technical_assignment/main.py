@@ -2,6 +2,7 @@
 import os
 from dotenv import load_dotenv
 import logging
+from contextlib import asynccontextmanager
 
 # FastAPI 관련 모듈 임포트
 import uvicorn
@@ -14,6 +15,10 @@ from pydantic import BaseModel
 # 라우터 모듈 임포트
 from searchright_technical_assignment.router import company_router, companynews_router, profilling_router
 from searchright_technical_assignment.util.colored_formatter import ColoredFormatter
+from searchright_technical_assignment.workflows.graph_registry import init_graph_registry, clear_graph_registry
+from searchright_technical_assignment.util.checkpointer import open_checkpointer, close_checkpointer
+from searchright_technical_assignment.workflows.profiling_jobs import job_queue
+from searchright_technical_assignment.util.openai_provider import openai_provider
 
 # 로깅 설정
 # 기본 로거를 가져옵니다.
@@ -38,8 +43,24 @@ logger.addHandler(ch)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 load_dotenv(os.path.join(BASE_DIR, ".env"))
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 수명 주기 동안 공유 자원을 관리합니다.
+    시작 시 체크포인터를 열고 프로파일링 그래프를 한 번 컴파일한 뒤 작업 워커를 시작하며, 종료 시 모두 정리합니다.
+    OpenAI 연결 풀은 첫 LLM/임베딩 호출 시 생성되고, 종료 시 keep-alive 연결을 닫습니다.
+    """
+    checkpointer = await open_checkpointer()
+    init_graph_registry(checkpointer)
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    clear_graph_registry()
+    await close_checkpointer()
+    await openai_provider.aclose()
+
 # FastAPI 애플리케이션 인스턴스 생성
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # 미들웨어 설정
 # CORS 정책
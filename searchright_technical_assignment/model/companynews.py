@@ -25,7 +25,9 @@ class CompanyNews(Base):
 
     __table_args__ = (
         Index('idx_combined_embedding_hnsw', combined_embedding, postgresql_using='hnsw', postgresql_ops={'combined_embedding': 'vector_cosine_ops'}),
-        Index('idx_company_news_unique', 'company_id', 'title', 'news_date', 'chunk_index', unique=True)
+        Index('idx_company_news_unique', 'company_id', 'title', 'news_date', 'chunk_index', unique=True),
+        # 회사/기간 조건 벡터 검색용 (임베딩이 있는 행만 대상으로 하는 부분 인덱스)
+        Index('idx_company_news_company_date', 'company_id', 'news_date', postgresql_where=combined_embedding.is_not(None)),
     )
 
     def __init__(self, **kwargs):
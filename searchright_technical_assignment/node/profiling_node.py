@@ -3,13 +3,13 @@
 import os
 import sys
 import time
+import functools
 import openai
 import asyncio
 import logging
 from dotenv import load_dotenv
 
 # LangChain 체인 관련 모듈 임포트
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
@@ -17,13 +17,23 @@ from langchain_core.output_parsers import StrOutputParser
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.insert(0, project_root)
 
-from searchright_technical_assignment.schema.response_dto import LeadershipResponse, CompanySizeResponse, ExperienceResponse
+from searchright_technical_assignment.schema.response_dto import LeadershipResponse, CompanySizeResponse, ExperienceResponse, CombinedProfileResponse
 from searchright_technical_assignment.crud.company_dao import CompanyDAO
 from searchright_technical_assignment.db.conn import get_db
 from searchright_technical_assignment.model.company import Company
 from searchright_technical_assignment.retriever.pgvector import search_by_keyword
 from searchright_technical_assignment.state.profiling_state import ProfilingState
 from searchright_technical_assignment.util.grouped_data_util import get_grouped_company_data
+from searchright_technical_assignment.util.batch_dedup import dedup, canonical_key
+from searchright_technical_assignment.util.timing import timed
+from searchright_technical_assignment.util.llm_cache import cached_llm_call
+from searchright_technical_assignment.util.school_tier_index import school_tier_index
+from searchright_technical_assignment.util.leadership_rules import match_leadership
+from searchright_technical_assignment.util.llm_router import model_router
+from searchright_technical_assignment.util.llm_cascade import llm_cascade
+from searchright_technical_assignment.util.llm_resilience import llm_resilience
+from searchright_technical_assignment.util.llm_cassette import llm_cassette
+from searchright_technical_assignment.util.prompt_budget import compact_company_size_inputs, compact_experience_inputs
 
 # 경고 무시 설정
 import warnings
@@ -36,17 +46,170 @@ logger = logging.getLogger(__name__)
 # 환경 변수 로드
 load_dotenv()
 
-# OpenAI API 키 설정 및 임베딩 모델 초기화
+# OpenAI API 키 설정
 openai.api_key = os.getenv('OPENAI_API_KEY')
-embeddings = OpenAIEmbeddings()
 
  # --- LLM 모델 및 구조화된 출력 객체 전역 초기화 (재사용) ---
-# ChatOpenAI 모델은 한 번만 초기화
-_global_chat_llm = ChatOpenAI(model='gpt-4o', streaming=True, temperature=0)
+# 노드별 모델(LLM_MODEL_<노드>)과 대체 모델(LLM_FALLBACK_MODEL_<노드>)은 모델 라우터가 결정하며, 모델별 ChatOpenAI는 첫 호출 시 한 번만 초기화
+_global_college_llm = model_router.chat('college_level')
 # 각 DTO에 바인딩된 LLM 객체도 한 번만 초기화
-_global_leadership_llm_with_tool = _global_chat_llm.with_structured_output(LeadershipResponse)
-_global_company_size_llm_with_tool = _global_chat_llm.with_structured_output(CompanySizeResponse)
-_global_experience_llm_with_tool = _global_chat_llm.with_structured_output(ExperienceResponse)
+_global_leadership_llm_with_tool = model_router.structured('leadership', LeadershipResponse)
+_global_company_size_llm_with_tool = model_router.structured('company_size', CompanySizeResponse)
+_global_experience_llm_with_tool = model_router.structured('experience', ExperienceResponse)
+_global_combined_llm_with_tool = model_router.structured('combined_profile', CombinedProfileResponse)
+
+
+async def _get_company_data(companynames_and_dates: list):
+    """
+    근무 회사 이름으로 DB에서 회사 데이터를 조회합니다.
+    배치(요청) 범위 안에서는 같은 회사 목록에 대한 조회를 한 번만 수행하고 결과를 공유합니다.
+
+    Args:
+        companynames_and_dates (list): 회사 이름과 근무 기간 정보를 포함하는 딕셔너리 리스트.
+
+    Returns:
+        list: (회사 이름, 회사 데이터) 튜플의 리스트.
+    """
+    company_names = sorted({item['companyName'] for item in companynames_and_dates if 'companyName' in item})
+
+    async def _fetch():
+        async with timed("db.get_data_by_names"), get_db() as db_session:
+            company_dao = CompanyDAO(db_session)
+            return await company_dao.get_data_by_names(companynames_and_dates)
+
+    return await dedup('company_data', canonical_key(company_names), _fetch)
+
+
+async def _search_company_news(company_name: str, key_word: str, start_date: dict, end_date: dict):
+    """
+    근무 기간 내 회사 뉴스 벡터 검색을 수행하고 소요 시간을 기록합니다.
+    """
+    async with timed("vector.search_by_keyword"):
+        return await search_by_keyword(key_word, k=3, start_date_obj=start_date, end_date_obj=end_date,
+                                       company_name=company_name)
+
+
+async def _ainvoke_chain(node: str, prompt: PromptTemplate, chain, inputs: dict, response_model=None):
+    """
+    LLM 체인을 시도별 타임아웃, 재시도, 헤징을 적용하여 실행하고 소요 시간을 기록합니다.
+    카세트 모드에서는 호출을 기록하거나 기록된 응답을 재생합니다.
+    """
+    async with timed("llm"):
+        return await llm_cassette.llm_call(node, model_router.model_name(node), prompt, inputs,
+                                           lambda: llm_resilience.ainvoke(node, lambda: chain.ainvoke(inputs)),
+                                           response_model)
+
+
+async def _ainvoke_cascade(node: str, prompt: PromptTemplate, inputs: dict, response_model):
+    """
+    저비용 모델 → 상위 모델 캐스케이드로 LLM을 실행하고 소요 시간을 기록합니다.
+    """
+    async with timed("llm"):
+        return await llm_cassette.llm_call(
+            node, llm_cascade.model_label, prompt, inputs,
+            lambda: llm_resilience.ainvoke(node, lambda: llm_cascade.ainvoke(node, prompt, inputs, response_model)),
+            response_model)
+
+
+async def _cached_ainvoke_chain(node: str, prompt: PromptTemplate, chain, inputs: dict, response_model=None):
+    """
+    LLM 응답 캐시를 거쳐 체인을 실행합니다. (모델, 프롬프트, 입력)이 같은 호출은 LLM을 다시 호출하지 않습니다.
+    모델 캐스케이드가 켜진 노드는 체인 대신 캐스케이드로 실행합니다.
+    """
+    if response_model is not None and llm_cascade.applies_to(node):
+        return await cached_llm_call(node, llm_cascade.model_label, prompt, inputs,
+                                     lambda: _ainvoke_cascade(node, prompt, inputs, response_model), response_model)
+    return await cached_llm_call(node, model_router.model_name(node), prompt, inputs,
+                                 lambda: _ainvoke_chain(node, prompt, chain, inputs, response_model), response_model)
+
+
+async def _gather_company_size_context(companynames_and_dates: list):
+    """
+    회사 규모 판단에 필요한 DB 회사 정보와, 근무 기간의 투자/조직 정보가 부족한 회사의 뉴스 검색 결과를 조회합니다.
+    뉴스는 company 행이 있는 회사에만 저장되므로(db/insert_company_news_vector.py), DB에 없는 회사는 뉴스를 검색하지 않습니다.
+
+    Args:
+        companynames_and_dates (list): 회사 이름과 근무 기간 정보를 포함하는 딕셔너리 리스트.
+
+    Returns:
+        tuple: (근무 기간별로 묶인 회사 데이터 리스트, {회사 이름: 뉴스 문서 리스트}).
+    """
+    matched_companies_results = await _get_company_data(companynames_and_dates)
+
+    grouped_company_data = get_grouped_company_data(companynames_and_dates, matched_companies_results)
+
+    # logger.info(f"[Company Size Node] grouped_company_data (simplified): {grouped_company_data}")
+    companynames_and_dates_set = {item['companyName'] for item in companynames_and_dates if 'companyName' in item}
+    grouped_company_data_names_set = {company_info['name'] for company_info in grouped_company_data}
+
+    # 회사 이력에는 있지만 DB에 회사 정보가 없는 기업명 리스트 (저장된 뉴스도 없으므로 검색하지 않음)
+    companies_missing_db_info = list(companynames_and_dates_set - grouped_company_data_names_set)
+    if companies_missing_db_info:
+        logger.info(f"DB에 정보가 없어 뉴스 검색을 건너뛰는 회사: {companies_missing_db_info}")
+
+    # DB에는 있지만 근무 기간의 투자 또는 조직 정보가 없는 기업명 리스트
+    companies_missing_period_info = [company_info['name'] for company_info in grouped_company_data
+                                     if company_info['investment'] is None or company_info['organization'] is None]
+
+    # companies_missing_period_info에 있는 기업명에 대해 해당 회사의 뉴스만 벡터 검색 수행
+    # (배치 내 같은 회사+근무기간 검색은 한 번만 수행)
+    company_news_contents = {}
+    search_companies = []
+    tasks = []
+    for company_name in companies_missing_period_info:
+        start_end_dates_for_company = []
+        for item in companynames_and_dates:
+            if item.get('companyName') == company_name:
+                start_end_dates_for_company = item.get('startEndDates', [])
+                break
+
+        for date_range in start_end_dates_for_company:
+            start_date = date_range.get('start')
+            end_date = date_range.get('end')
+            key_word = f"{company_name}의 투자 규모, 조직 규모"
+            search_key = canonical_key([company_name, start_date, end_date])
+            search_companies.append(company_name)
+            tasks.append(dedup('company_news', search_key,
+                               functools.partial(_search_company_news, company_name, key_word, start_date, end_date)))
+
+    # 모든 PGVector 검색을 병렬로 실행
+    all_relevant_docs = await asyncio.gather(*tasks)
+
+    # 결과를 검색한 회사별로 company_news_contents에 취합
+    for company_name, relevant_docs in zip(search_companies, all_relevant_docs):
+        # 각 태스크의 결과는 리스트이므로, 이를 확장하여 추가
+        company_news_contents.setdefault(company_name, []).extend(relevant_docs)
+
+    return grouped_company_data, company_news_contents
+
+
+async def _gather_experience_context(companynames_and_dates: list):
+    """
+    경험 판단에 필요한 회사별 제품 정보를 DB에서 조회합니다.
+
+    Args:
+        companynames_and_dates (list): 회사 이름과 근무 기간 정보를 포함하는 딕셔너리 리스트.
+
+    Returns:
+        list: 회사 이름과 제품 이름 리스트를 포함하는 딕셔너리 리스트.
+    """
+    matched_companies_results = await _get_company_data(companynames_and_dates)
+
+    # 각 회사별로 정보를 묶어서 리스트로 반환합니다.
+    grouped_company_data = []
+    for company_name, company_data in matched_companies_results:
+        products = None
+        if isinstance(company_data, dict):
+            # products 정보를 제품 이름만 포함하도록 간소화
+            raw_products = company_data.get('products', [])
+            products = [p.get('name') for p in raw_products if p.get('name')]
+
+        grouped_company_data.append({
+            "name": company_name,
+            "products": products,
+        })
+
+    return grouped_company_data
 
 
 def input(state: ProfilingState):
@@ -68,6 +231,7 @@ def input(state: ProfilingState):
 async def college_level(state: ProfilingState, prompt: PromptTemplate):
     """
     지원자의 학력 정보를 기반으로 대학 수준을 판단하는 노드입니다.
+    로컬 학교 수준 색인을 먼저 조회하고, 색인에 없는 학교만 LLM으로 판단합니다.
 
     Args:
         state (ProfilingState): 현재 프로파일링 상태 정보를 포함하는 객체.
@@ -82,15 +246,23 @@ async def college_level(state: ProfilingState, prompt: PromptTemplate):
     logger.info("대학 수준 노드 실행 중.")
     # 상태 변수에서 대학 정보 추출
     college = state['college']
+
+    # 0. 로컬 학교 수준 색인에 있는 학교는 LLM 호출 없이 바로 반환
+    answer = school_tier_index.lookup(college)
+    if answer is not None:
+        logger.info(f"학교 수준 색인에서 판단된 대학 수준: {answer}")
+        logger.info(f"<== (1/4) college_level 노드 종료 (소요 시간: {time.time() - start_time:.2f}초)")
+        return {'college_level': answer}
     
-    # 1. 모델 선언 (GPT-4o 사용)
-    model = _global_chat_llm
+    # 1. 모델 선언 (노드별 라우팅 모델 사용)
+    model = _global_college_llm
     
     # 2. LLM과 문자열 출력 파서를 바인딩하여 체인 생성
     chain = prompt | model | StrOutputParser()
 
-    # 3. 대학 수준 생성 LLM 실행
-    answer = await chain.ainvoke({'college' : college})
+    # 3. 대학 수준 생성 LLM 실행 (배치 내 같은 학교는 한 번만 판단)
+    answer = await dedup('college_level', college,
+                         lambda: _cached_ainvoke_chain('college_level', prompt, chain, {'college' : college}))
     logger.info(f"판단된 대학 수준: {answer}")
     
     end_time = time.time()
@@ -102,6 +274,7 @@ async def college_level(state: ProfilingState, prompt: PromptTemplate):
 async def leadership(state: ProfilingState, prompt: PromptTemplate):
     """
     지원자의 기술 및 직책 정보를 기반으로 리더십 유무를 판단하는 노드입니다.
+    직책만으로 판단이 명확한 경우 규칙으로 바로 판단하고, 애매한 경우에만 LLM을 호출합니다.
 
     Args:
         state (ProfilingState): 현재 프로파일링 상태 정보를 포함하는 객체.
@@ -117,10 +290,19 @@ async def leadership(state: ProfilingState, prompt: PromptTemplate):
     # 상태 변수에서 기술 및 직책 정보 추출
     skills = state['skills']
     titles = state['titles']
+
+    # 0. 직책/기술 용어 규칙으로 명확하게 판단되면 LLM 호출 없이 반환
+    answer = match_leadership(skills, titles)
+    if answer is not None:
+        logger.info(f"규칙으로 판단된 리더십: {answer.leadership}")
+        logger.info(f"<== (2/4) leadership 노드 종료 (소요 시간: {time.time() - start_time:.2f}초)")
+        return {
+            'leadership': answer.leadership,
+            'leadership_reason': answer.reason
+        }
     
-    # 1. 모델 선언 (GPT-4o 사용)
-    # model = _global_chat_llm
-    
+    # 1. 모델 선언 (노드별 라우팅 모델 사용, model_router)
+
     # 2. 구조화된 출력을 위한 LLM 설정 (LeadershipResponse DTO 사용)
     llm_with_tool = _global_leadership_llm_with_tool
     
@@ -128,7 +310,7 @@ async def leadership(state: ProfilingState, prompt: PromptTemplate):
     chain = prompt | llm_with_tool
 
     # 3. 리더십 판단 LLM 실행
-    answer = await chain.ainvoke({'skills' : skills, 'titles': titles})
+    answer = await _cached_ainvoke_chain('leadership', prompt, chain, {'skills' : skills, 'titles': titles}, LeadershipResponse)
     logger.info(f"판단된 리더십: {answer.leadership}")
     
     end_time = time.time()
@@ -158,74 +340,39 @@ async def company_size(state: ProfilingState, prompt: PromptTemplate):
     
     # 상태 변수에서 회사 이름 및 근무 기간 정보 추출
     companynames_and_dates = state['companynames_and_dates']
-    
-    async with get_db() as db_session:
-        try:
-            company_dao = CompanyDAO(db_session)
-            matched_companies_results = await company_dao.get_data_by_names(companynames_and_dates)
-            
-            grouped_company_data = get_grouped_company_data(companynames_and_dates, matched_companies_results)
-
-            # logger.info(f"[Company Size Node] grouped_company_data (simplified): {grouped_company_data}")
-            companynames_and_dates_set = {item['companyName'] for item in companynames_and_dates if 'companyName' in item}
-            grouped_company_data_names_set = {company_info['name'] for company_info in grouped_company_data}
-
-            # 회사 이력에는 있지만 DB에 상세 정보가 없는 기업명 리스트
-            companies_missing_db_info = list(companynames_and_dates_set - grouped_company_data_names_set)
-
-            # companies_missing_db_info에 있는 기업명에 대해 PGVector 검색 수행
-            company_news_contents = {}
-            tasks = []
-            for company_name in companies_missing_db_info:
-                start_end_dates_for_company = []
-                for item in companynames_and_dates:
-                    if item.get('companyName') == company_name:
-                        start_end_dates_for_company = item.get('startEndDates', [])
-                        break
-                
-                for date_range in start_end_dates_for_company:
-                    start_date = date_range.get('start')
-                    end_date = date_range.get('end')
-                    key_word = f"{company_name}의 투자 규모, 조직 규모"
-                    tasks.append(search_by_keyword(key_word, k=3, start_date_obj=start_date, end_date_obj=end_date))
-            
-            # 모든 PGVector 검색을 병렬로 실행
-            all_relevant_docs = await asyncio.gather(*tasks)
-
-            # 결과를 company_news_contents에 취합
-            for i, company_name in enumerate(companies_missing_db_info):
-                if company_name not in company_news_contents:
-                    company_news_contents[company_name] = []
-                # 각 태스크의 결과는 리스트이므로, 이를 확장하여 추가
-                company_news_contents[company_name].extend(all_relevant_docs[i])
-            
-
-            # 1. 모델 선언 (GPT-4o 사용)
-            # model = _global_chat_llm
-            
-            # 2. 구조화된 출력을 위한 LLM 설정 (CompanySizeResponse DTO 사용)
-            llm_with_tool = _global_company_size_llm_with_tool
-            
-            # 3. LLM과 구조화된 출력 파서를 바인딩하여 체인 생성
-            chain = prompt | llm_with_tool
-
-        
-            # 4. 기업 경험 LLM 실행
-            # logger.info(f"[Company Size Node] Company News Contents length: {sum(len(c) for c_list in company_news_contents.values() for c in c_list) if company_news_contents else 0}")
-            # logger.info(f"[Company Size Node] companynames_and_dates: {companynames_and_dates}")
-            # logger.info(f"[Company Size Node] grouped_company_data: {grouped_company_data}")
-            # logger.info(f"[Company Size Node] Company News Contents: {company_news_contents}")
-            
-            
-            answer = await chain.ainvoke({'companynames_and_dates' : companynames_and_dates, 'grouped_company_data' : grouped_company_data, 'company_news_contents': company_news_contents})
-            logger.info(f"판단된 회사 규모: {answer.company_size_and_reason}")
-        
-            end_time = time.time()
-            logger.info(f"<== (3/4) company_size 노드 종료 (소요 시간: {end_time - start_time:.2f}초)")   
-        
-            return {'company_size_and_reason':answer.company_size_and_reason}
-        finally:
-            await db_session.close()
+
+    # DB 회사 정보와 근무 기간 정보가 부족한 회사의 뉴스 검색 결과 조회
+    grouped_company_data, company_news_contents = await _gather_company_size_context(companynames_and_dates)
+
+    # 1. 모델 선언 (노드별 라우팅 모델 사용, model_router)
+
+    # 2. 구조화된 출력을 위한 LLM 설정 (CompanySizeResponse DTO 사용)
+    llm_with_tool = _global_company_size_llm_with_tool
+
+    # 3. LLM과 구조화된 출력 파서를 바인딩하여 체인 생성
+    chain = prompt | llm_with_tool
+
+
+    # 4. 기업 경험 LLM 실행 (입력은 회사+근무기간으로 결정되므로 배치 내 같은 이력은 한 번만 판단)
+    # logger.info(f"[Company Size Node] Company News Contents length: {sum(len(c) for c_list in company_news_contents.values() for c in c_list) if company_news_contents else 0}")
+    # logger.info(f"[Company Size Node] companynames_and_dates: {companynames_and_dates}")
+    # logger.info(f"[Company Size Node] grouped_company_data: {grouped_company_data}")
+    # logger.info(f"[Company Size Node] Company News Contents: {company_news_contents}")
+
+
+    # 뉴스 기사가 많은 경우 노드 토큰 예산에 맞게 중복 제거/순위별 압축 후 실행
+    async def _judge():
+        inputs = compact_company_size_inputs({'companynames_and_dates' : companynames_and_dates, 'grouped_company_data' : grouped_company_data, 'company_news_contents': company_news_contents},
+                                             model_router.model_name('company_size'))
+        return await _cached_ainvoke_chain('company_size', prompt, chain, inputs, CompanySizeResponse)
+
+    answer = await dedup('company_size', canonical_key(companynames_and_dates), _judge)
+    logger.info(f"판단된 회사 규모: {answer.company_size_and_reason}")
+
+    end_time = time.time()
+    logger.info(f"<== (3/4) company_size 노드 종료 (소요 시간: {end_time - start_time:.2f}초)")
+
+    return {'company_size_and_reason':answer.company_size_and_reason}
     
 # 4. 지원자 경험 판단 노드
 async def experience(state: ProfilingState, prompt: PromptTemplate):
@@ -248,71 +395,117 @@ async def experience(state: ProfilingState, prompt: PromptTemplate):
     descriptions = state['descriptions']
     companynames_and_dates = state['companynames_and_dates']
     
-    async with get_db() as db_session:
-        try:
-            company_dao = CompanyDAO(db_session)
-            matched_companies_results = await company_dao.get_data_by_names(companynames_and_dates)
-            
-            # 각 회사별로 정보를 묶어서 리스트로 반환합니다.
-            grouped_company_data = []
-            for company_name, company_data in matched_companies_results:
-                products = None
-                if isinstance(company_data, dict):
-                    # products 정보를 제품 이름만 포함하도록 간소화
-                    raw_products = company_data.get('products', [])
-                    products = [p.get('name') for p in raw_products if p.get('name')]
-                
-                grouped_company_data.append({
-                    "name": company_name,
-                    "products": products,
-                })
-
-            # 1. 모델 선언 (GPT-4o 사용)
-            # model = _global_chat_llm
-            
-            # 2. 구조화된 출력을 위한 LLM 설정 (ExperienceResponse DTO 사용)
-            llm_with_tool = _global_experience_llm_with_tool
-            
-            # 3. LLM과 구조화된 출력 파서를 바인딩하여 체인 생성
-            chain = prompt | llm_with_tool
-
-            # 4. 기업 경험 LLM 실행
-            answer = await chain.ainvoke({'descriptions' : descriptions, 'grouped_company_data' : grouped_company_data})
-            # logger.info(f"판단된 경험: {answer.experience_and_reason}")
-            
-            end_time = time.time()
-            logger.info(f"<== (4/4) experience 노드 종료 (소요 시간: {end_time - start_time:.2f}초)")
-
-            return {'experience_and_reason':answer.experience_and_reason}
-        finally:
-            await db_session.close()
+    # DB에서 회사별 제품 정보 조회
+    grouped_company_data = await _gather_experience_context(companynames_and_dates)
 
+    # 1. 모델 선언 (노드별 라우팅 모델 사용, model_router)
 
-def combine(state: ProfilingState):
+    # 2. 구조화된 출력을 위한 LLM 설정 (ExperienceResponse DTO 사용)
+    llm_with_tool = _global_experience_llm_with_tool
+
+    # 3. LLM과 구조화된 출력 파서를 바인딩하여 체인 생성
+    chain = prompt | llm_with_tool
+
+    # 4. 기업 경험 LLM 실행
+    # 경력 설명이 긴 경우 노드 토큰 예산에 맞게 중복 제거/압축
+    inputs = compact_experience_inputs({'descriptions' : descriptions, 'grouped_company_data' : grouped_company_data},
+                                       model_router.model_name('experience'))
+    answer = await dedup('experience', canonical_key(inputs),
+                         lambda: _cached_ainvoke_chain('experience', prompt, chain, inputs, ExperienceResponse))
+    # logger.info(f"판단된 경험: {answer.experience_and_reason}")
+
+    end_time = time.time()
+    logger.info(f"<== (4/4) experience 노드 종료 (소요 시간: {end_time - start_time:.2f}초)")
+
+    return {'experience_and_reason':answer.experience_and_reason}
+
+
+# 5. 통합 판단 노드 (네 가지 항목을 한 번의 LLM 호출로 판단)
+async def combined_profile(state: ProfilingState, prompt: PromptTemplate):
     """
-    다양한 노드에서 생성된 프로파일링 정보를 결합하여 최종 프로파일을 생성하는 노드입니다.
+    대학 수준, 리더십, 회사 규모, 경험을 하나의 구조화된 출력 호출로 판단하는 노드입니다.
+    DB 조회와 뉴스 검색을 먼저 병렬로 수행한 뒤, 모든 입력을 합친 프롬프트로 LLM을 한 번만 호출합니다.
+    (PROFILING_WORKFLOW_MODE=combined에서 사용)
 
     Args:
         state (ProfilingState): 현재 프로파일링 상태 정보를 포함하는 객체.
+        prompt (PromptTemplate): 통합 판단에 사용될 프롬프트 템플릿.
 
     Returns:
-        dict: 'profile' 키에 결합된 최종 프로파일을 포함하는 딕셔너리.
+        dict: 'college_level', 'leadership', 'leadership_reason', 'company_size_and_reason', 'experience_and_reason'을 포함하는 딕셔너리.
+    """
+    start_time = time.time()
+    logger.info("==> combined_profile 노드 시작")
+
+    companynames_and_dates = state['companynames_and_dates']
+
+    # 1. 회사 규모/경험 판단에 필요한 DB 조회와 뉴스 검색을 병렬로 수행
+    (grouped_company_data, company_news_contents), company_products = await asyncio.gather(
+        _gather_company_size_context(companynames_and_dates),
+        _gather_experience_context(companynames_and_dates),
+    )
+
+    # 2. 통합 출력 스키마(CombinedProfileResponse)에 바인딩된 LLM으로 체인 생성
+    chain = prompt | _global_combined_llm_with_tool
+
+    # 3. 통합 판단 LLM 실행
+    # 회사 규모/경험 컨텍스트를 각 노드의 토큰 예산에 맞게 압축
+    company_size_inputs = compact_company_size_inputs({'companynames_and_dates': companynames_and_dates, 'grouped_company_data': grouped_company_data, 'company_news_contents': company_news_contents},
+                                                      model_router.model_name('combined_profile'))
+    experience_inputs = compact_experience_inputs({'descriptions': state['descriptions'], 'grouped_company_data': company_products},
+                                                  model_router.model_name('combined_profile'))
+
+    inputs = {
+        'college': state['college'],
+        'skills': state['skills'],
+        'titles': state['titles'],
+        'descriptions': experience_inputs['descriptions'],
+        'companynames_and_dates': companynames_and_dates,
+        'grouped_company_data': grouped_company_data,
+        'company_news_contents': company_size_inputs['company_news_contents'],
+        'company_products': experience_inputs['grouped_company_data'],
+    }
+    answer = await dedup('combined_profile', canonical_key(inputs),
+                         lambda: _cached_ainvoke_chain('combined_profile', prompt, chain, inputs, CombinedProfileResponse))
+    logger.info(f"판단된 대학 수준: {answer.college_level}, 리더십: {answer.leadership}")
+
+    end_time = time.time()
+    logger.info(f"<== combined_profile 노드 종료 (소요 시간: {end_time - start_time:.2f}초)")
+
+    return {
+        'college_level': answer.college_level,
+        'leadership': answer.leadership,
+        'leadership_reason': answer.leadership_reason,
+        'company_size_and_reason': answer.company_size_and_reason,
+        'experience_and_reason': answer.experience_and_reason,
+    }
+
+
+def build_profile(state: dict) -> dict:
+    """
+    상태에 존재하는 판단 결과만으로 프로파일을 구성합니다.
+    아직 완료되지 않은 노드의 결과는 건너뛰므로, 스트리밍 중 부분 프로파일 생성에도 사용됩니다.
+
+    Args:
+        state (dict): 프로파일링 상태 또는 노드가 반환한 부분 상태.
+
+    Returns:
+        dict: 구성된 프로파일.
     """
-    logger.info("결합 노드 실행 중.")
     profile = {}
     
     college_level = state.get('college_level')
     leadership = state.get('leadership')
     leadership_reason = state.get('leadership_reason')
-    company_size_and_reason = state.get('company_size_and_reason')
-    experience_and_reason = state.get('experience_and_reason')
+    company_size_and_reason = state.get('company_size_and_reason') or []
+    experience_and_reason = state.get('experience_and_reason') or []
     
     # college_level 처리
-    if college_level != '최종학력없음':
+    if college_level and college_level != '최종학력없음':
         profile[college_level] = state.get('college')
 
     # leadership 처리
-    if leadership != '리더쉽경험없음':
+    if leadership and leadership != '리더쉽경험없음':
         profile[leadership] = leadership_reason
     
     # company_size 처리
@@ -323,5 +516,25 @@ def combine(state: ProfilingState):
     for experience in experience_and_reason:
         profile[experience.experience] = experience.reasons
 
+    return profile
+
+
+def combine(state: ProfilingState):
+    """
+    다양한 노드에서 생성된 프로파일링 정보를 결합하여 최종 프로파일을 생성하는 노드입니다.
+    지연 시간 예산 안에 완료되지 못한 노드가 있으면 완료된 결과만으로 프로파일을 구성합니다.
+
+    Args:
+        state (ProfilingState): 현재 프로파일링 상태 정보를 포함하는 객체.
+
+    Returns:
+        dict: 'profile' 키에 결합된 최종 프로파일을 포함하는 딕셔너리.
+    """
+    logger.info("결합 노드 실행 중.")
+    profile = build_profile(state)
+    missing_dimensions = state.get('missing_dimensions') or []
+    if missing_dimensions:
+        logger.warning(f"시간 초과로 제외된 항목: {missing_dimensions}")
+
     # logger.info(f"결합된 프로파일: {profile}")
     return {'profile': profile}
\ No newline at end of file
@@ -175,4 +175,58 @@ experience_prompt = PromptTemplate(
     ]
     """,
     input_variables=['descriptions','grouped_company_data']
-)
\ No newline at end of file
+)
+
+# 통합 프로파일링 Prompt (네 가지 판단을 한 번의 호출로 수행)
+combined_profile_prompt = PromptTemplate(
+    template="""
+    # 역할
+    당신은 수많은 이력서와 커리어 데이터를 분석해온 채용 분석 전문가입니다.
+
+    # 배경 및 임무
+    한 인재의 학력, 기술, 직책, 경력, 근무 회사 정보가 주어집니다.
+    아래 네 가지 항목을 각각의 기준에 따라 판단하세요.
+
+    # 입력 데이터
+    college (최종 학력 학교):
+    {college}
+    skills:
+    {skills}
+    titles:
+    {titles}
+    descriptions (경력 설명):
+    {descriptions}
+    companynames_and_dates (근무회사명 companyName, 근무기간 startEndDates):
+    {companynames_and_dates}
+    grouped_company_data (회사명 name, 투자 단계 investment, 재직자 수 organiztion):
+    {grouped_company_data}
+    company_news_contents (회사 정보가 부족한 회사의 뉴스기사):
+    {company_news_contents}
+    company_products (회사별 제품/서비스 products):
+    {company_products}
+
+    # 1. college_level: 대학 수준
+    - 상위권대학교: 서울대, 연세대, 고려대, KAIST, POSTECH, UNIST / Harvard, MIT, Stanford, Princeton, Yale, Columbia, UC Berkeley, University of Chicago, Caltech 등
+    - 중위권대학교: 경희대, 성균관대, 한양대, 이화여대, 중앙대 등 주요 4년제 대학 / University of Wisconsin, Penn State, Ohio State 등 일반 주립대
+    - 하위권대학교: 지방 소재 일반대학, 전문대학, 사이버대학 / 커뮤니티 칼리지, 무명 사립대, 온라인 대학 등
+    - college가 "최종학력없음" 또는 "최종 학력 정보 없음"이면 "최종학력없음"
+
+    # 2. leadership, leadership_reason: 리더십 경험 (skills, titles 기준)
+    - 팀장, PM, 리드 등 팀 리더 역할, 의사결정 및 조율, 프로젝트 주도, 멘토링 경험이 있으면 "리더쉽"
+    - 없으면 "리더쉽경험없음", ["없음"]
+    - 예시: "리더쉽", ["챕터 리드", "테크 리드"] / "리더쉽", ["CPO 경험 다수", "창업"]
+    - 근거에 '역할 수행', '스킬 보유' 같은 단어를 붙이지 마세요.
+
+    # 3. company_size_and_reason: 회사 규모 경험
+    - '성장기스타트업 경험': 근무기간 중 investment가 Series A ~ C, organiztion이 10명 이상 300명 미만, 또는 이름에 스타트업/랩스/벤처/테크/소프트 등
+    - '대규모 회사 경험': investment가 None이거나 IPO/상장/Pre-IPO, organiztion이 300명 이상, 또는 삼성/LG/현대/SK/KT 등 대기업 계열
+    - '대규모 회사 경험'이면 해당 회사명을 근거 리스트에 넣으세요.
+    - '성장기스타트업 경험'이면 뉴스기사를 그대로 옮기지 말고 조직·투자 확대 내용만 근거 리스트에 넣으세요.
+
+    # 4. experience_and_reason: 실질적인 경험 (descriptions를 주로 판단, company_products 참고)
+    - 예시: ('IPO', '밀리의 서재 재직 중 상장'), ('M&A 경험', '밀리의 서재 재직 중 지니뮤직에 매각'), ('대용량데이터처리경험', '네이버 하이퍼클로바 개발')
+    - 서로 다른 경험을 하나씩 출력하고, 근거는 3단어로 '개발', '매각', '인수' 같은 동사로 끝내세요.
+    """,
+    input_variables=['college', 'skills', 'titles', 'descriptions', 'companynames_and_dates',
+                     'grouped_company_data', 'company_news_contents', 'company_products']
+)
@@ -1,14 +1,22 @@
 import os
 import openai
-import logging
 import asyncio
+import logging
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import date
+from typing import Optional, Tuple
 import calendar # calendar 모듈 임포트
 
-# LangChain 관련 모듈 임포트
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import PGVector
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+from langchain_core.documents import Document
+
+from ..db.conn import get_db
+from ..model.company import Company
+from ..model.companynews import CompanyNews
+from ..util.openai_provider import openai_provider, OPENAI_EMBEDDING_MODEL
+from ..util.llm_scheduler import llm_scheduler
+from ..util.prompt_budget import count_tokens
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -16,100 +24,132 @@ logger = logging.getLogger(__name__)
 # 환경 변수 로드
 load_dotenv()
 
-# OpenAI API 키 설정 및 임베딩 모델 초기화 (모듈 레벨에서 한 번만 초기화)
+# OpenAI API 키 설정 (임베딩 모델은 공유 HTTP 연결 풀과 함께 첫 검색 시 생성)
 openai.api_key = os.getenv('OPENAI_API_KEY')
-embeddings = OpenAIEmbeddings()
 
-# PGVector 인스턴스를 위한 싱글톤 변수
-_vectorstore_instance = None
+# HNSW 반복 스캔 모드 (pgvector 0.8 이상, 'strict_order' | 'relaxed_order' | 'off')
+# 회사/기간 조건으로 걸러진 뒤에도 k개를 채울 때까지 인덱스를 계속 탐색합니다.
+PGVECTOR_ITERATIVE_SCAN = os.getenv('PGVECTOR_ITERATIVE_SCAN', 'strict_order').lower()
+# HNSW 탐색 후보 수 (미설정 시 서버 기본값 40)
+PGVECTOR_EF_SEARCH = os.getenv('PGVECTOR_EF_SEARCH')
+
+# 동시에 열 수 있는 벡터 검색 DB 세션 수 (프로세스 전체 공유).
+# 지원자 한 명의 뉴스 검색은 회사×근무기간마다 병렬로 실행되므로, 상한이 없으면 요청 몇 개로도 연결 풀(15)을 모두 사용하게 됩니다.
+PGVECTOR_MAX_CONCURRENT_SEARCHES = int(os.getenv('PGVECTOR_MAX_CONCURRENT_SEARCHES', '5'))
+
+# 서버가 반복 스캔 설정을 지원하지 않으면 이후 검색에서는 설정하지 않습니다.
+_iterative_scan_supported = True
+# 벡터 검색 세션 상한 (첫 검색 시 실행 중인 이벤트 루프에서 생성)
+_search_semaphore: Optional[asyncio.Semaphore] = None
 
-def get_vectorstore_instance():
+
+def _news_document(news, distance: float) -> Document:
     """
-    PGVector 인스턴스를 싱글톤 패턴으로 반환합니다.
+    company_news 행을 검색 결과 Document로 변환합니다.
+    메타데이터는 기존 PGVector 컬렉션의 메타데이터(company_id, title, news_date, chunk_index, original_link)에
+    year/month/day와 코사인 거리를 더한 형태입니다.
     """
-    global _vectorstore_instance
-    if _vectorstore_instance is None:
-        logger.info("PGVector 인스턴스 초기화 중...")
-        _vectorstore_instance = PGVector(
-            connection_string=os.getenv('PGVECTOR_DATABASE_URL'),
-            embedding_function=embeddings,
-            collection_name="company_news_vectors",
-        )
-        logger.info("PGVector 인스턴스 초기화 완료.")
-    return _vectorstore_instance
-
-def retriever():
+    news_date = news.news_date
+    return Document(page_content=news.content or news.title, metadata={
+        "id": news.id,
+        "company_id": news.company_id,
+        "title": news.title,
+        "news_date": news_date.isoformat() if news_date else None,
+        "year": news_date.year if news_date else None,
+        "month": news_date.month if news_date else None,
+        "day": news_date.day if news_date else None,
+        "chunk_index": news.chunk_index,
+        "original_link": news.original_link,
+        "distance": float(distance),
+    })
+
+
+def date_window(start_date_obj: dict = None, end_date_obj: dict = None) -> Tuple[Optional[date], Optional[date]]:
     """
-    PGVector 기반의 문서 검색기(retriever)를 초기화하고 반환합니다.
+    근무 기간({'year', 'month'})을 뉴스 날짜 조건(시작 월의 1일 ~ 종료 월의 말일)으로 변환합니다.
+    월이 없으면 시작은 1월, 종료는 12월로 간주하며, 기간이 없는 쪽은 None (제한 없음).
     """
-    logger.info("PGVector 검색기 초기화 중.")
-    # 싱글톤 인스턴스를 사용하여 검색기 구성
-    retriever = get_vectorstore_instance().as_retriever(search_type="similarity", search_kwargs={"k": 5})
-    logger.info("PGVector 검색기 초기화 성공.")
-    return retriever
+    start_date = None
+    if start_date_obj and 'year' in start_date_obj:
+        start_date = date(start_date_obj['year'], start_date_obj.get('month') or 1, 1)
 
+    end_date = None
+    if end_date_obj and 'year' in end_date_obj:
+        end_year = end_date_obj['year']
+        end_month = end_date_obj.get('month') or 12
+        end_date = date(end_year, end_month, calendar.monthrange(end_year, end_month)[1])
+    return start_date, end_date
 
-def _blocking_search(keyword: str, k: int, start_date_obj: dict = None, end_date_obj: dict = None):
+
+async def _apply_search_settings(db_session):
     """
-    동기적으로 PGVector 검색을 수행하는 내부 함수입니다.
+    현재 트랜잭션에만 적용되는 HNSW 검색 설정(반복 스캔, ef_search)을 지정합니다.
     """
-    logger.info(f"[Blocking] 키워드 '{keyword}'로 검색 시작, 반환 개수 k={k}")
-    
-    initial_k = k * 3
-    # 싱글톤 인스턴스를 사용하여 검색기 구성
-    retriever = get_vectorstore_instance().as_retriever(search_type="similarity", search_kwargs={"k": initial_k})
-    logger.info(f"[Blocking] 초기 검색을 위해 키워드 '{keyword}'로 {initial_k}개 문서 검색 중.")
-    docs = retriever.get_relevant_documents(keyword)
-    logger.info(f"[Blocking] 키워드 '{keyword}'에 대해 초기 {len(docs)}개 문서 발견.")
-
-    filtered_docs = []
-    if start_date_obj or end_date_obj:
-        start_date = None
-        if start_date_obj and 'year' in start_date_obj:
-            start_year = start_date_obj['year']
-            start_month = start_date_obj.get('month', 1)
-            start_date = datetime(start_year, start_month, 1)
-
-        end_date = None
-        if end_date_obj and 'year' in end_date_obj:
-            end_year = end_date_obj['year']
-            end_month = end_date_obj.get('month', 12)
-            last_day_of_month = calendar.monthrange(end_year, end_month)[1]
-            end_date = datetime(end_year, end_month, last_day_of_month)
-        
-        logger.info(f"[Blocking] 날짜로 필터링: 시작일={start_date}, 종료일={end_date}")
-
-        for doc in docs:
-            doc_year = doc.metadata.get('year')
-            doc_month = doc.metadata.get('month')
-            doc_day = doc.metadata.get('day')
-
-            if doc_year and doc_month and doc_day:
-                doc_date = datetime(doc_year, doc_month, doc_day)
-                
-                is_within_range = True
-                if start_date and doc_date < start_date:
-                    is_within_range = False
-                if end_date and doc_date > end_date:
-                    is_within_range = False
-                
-                if is_within_range:
-                    filtered_docs.append(doc)
-    else:
-        filtered_docs = docs
-    
-    logger.info(f"[Blocking] 키워드 '{keyword}'에 대해 필터링된 문서: {len(filtered_docs)}개 문서.")
-    return filtered_docs[:k]
-
-async def search_by_keyword(keyword: str, k: int = 5, start_date_obj: dict = None, end_date_obj: dict = None):
+    global _iterative_scan_supported
+    if PGVECTOR_EF_SEARCH:
+        await db_session.execute(text("SELECT set_config('hnsw.ef_search', :value, true)"), {'value': PGVECTOR_EF_SEARCH})
+    if PGVECTOR_ITERATIVE_SCAN == 'off' or not _iterative_scan_supported:
+        return
+    try:
+        async with db_session.begin_nested():
+            await db_session.execute(text("SELECT set_config('hnsw.iterative_scan', :value, true)"),
+                                     {'value': PGVECTOR_ITERATIVE_SCAN})
+    except DBAPIError as e:
+        _iterative_scan_supported = False
+        logger.warning(f"hnsw.iterative_scan을 지원하지 않는 pgvector 버전입니다 (0.8 이상 필요). 반복 스캔 없이 검색합니다: {e}")
+
+
+async def search_by_embedding(query_embedding: list, limit: int, company_name: str = None,
+                              start_date: date = None, end_date: date = None) -> list:
     """
-    키워드를 사용하여 PGVector에서 코사인 유사도 검색을 수행하고,
-    주어진 기간 내의 문서만 필터링하여 반환합니다. (비동기 래퍼)
+    company_news.combined_embedding(HNSW, vector_cosine_ops)에 대해 코사인 거리가 가까운 순서로 limit개의 뉴스를 조회합니다.
+    회사와 뉴스 날짜 조건은 SQL 안에서 적용되므로, 조건을 만족하는 뉴스가 limit개 이상이면 정확히 limit개를 반환합니다.
+    공유 비동기 엔진(db/conn.py)의 세션에서 실행되며, 동시에 여는 세션 수는 PGVECTOR_MAX_CONCURRENT_SEARCHES로 제한됩니다.
+
+    Args:
+        query_embedding (list): 질의 임베딩 벡터.
+        limit (int): 반환할 최대 문서 수.
+        company_name (str, optional): 이 이름의 회사(company 테이블) 뉴스만 검색.
+        start_date (date, optional): 이 날짜 이후의 뉴스만 검색.
+        end_date (date, optional): 이 날짜 이전의 뉴스만 검색.
+
+    Returns:
+        list[Document]: 코사인 거리 오름차순의 뉴스 문서 리스트.
     """
-    return await asyncio.to_thread(
-        _blocking_search, 
-        keyword, 
-        k, 
-        start_date_obj=start_date_obj, 
-        end_date_obj=end_date_obj
-    )
\ No newline at end of file
+    distance = CompanyNews.combined_embedding.cosine_distance(query_embedding).label('distance')
+    # 임베딩 컬럼(1536차원)은 전송하지 않도록 필요한 컬럼만 조회합니다.
+    stmt = (select(CompanyNews.id, CompanyNews.company_id, CompanyNews.title, CompanyNews.content,
+                   CompanyNews.chunk_index, CompanyNews.original_link, CompanyNews.news_date, distance)
+            .where(CompanyNews.combined_embedding.is_not(None)))
+    if company_name is not None:
+        stmt = stmt.where(CompanyNews.company_id.in_(select(Company.id).where(Company.name == company_name)))
+    if start_date is not None:
+        stmt = stmt.where(CompanyNews.news_date >= start_date)
+    if end_date is not None:
+        stmt = stmt.where(CompanyNews.news_date <= end_date)
+    stmt = stmt.order_by(distance).limit(limit)
+
+    global _search_semaphore
+    if _search_semaphore is None:
+        _search_semaphore = asyncio.Semaphore(max(1, PGVECTOR_MAX_CONCURRENT_SEARCHES))
+    async with _search_semaphore, get_db() as db_session:
+        await _apply_search_settings(db_session)
+        result = await db_session.execute(stmt)
+        return [_news_document(row, row.distance) for row in result.all()]
+
+
+async def search_by_keyword(keyword: str, k: int = 5, start_date_obj: dict = None, end_date_obj: dict = None,
+                            company_name: str = None):
+    """
+    키워드를 사용하여 company_news에서 코사인 유사도 검색을 수행합니다.
+    회사(company_name)와 기간(근무 시작 월 ~ 종료 월) 조건은 SQL에서 적용됩니다.
+    질의 임베딩 호출은 전역 스케줄러의 임베딩 모델 한도 안에서 실행됩니다.
+    """
+    logger.info(f"키워드 '{keyword}'로 검색 시작, 반환 개수 k={k}, 회사={company_name}")
+    async with llm_scheduler.slot(OPENAI_EMBEDDING_MODEL, count_tokens(keyword, OPENAI_EMBEDDING_MODEL)):
+        query_embedding = await openai_provider.embeddings().aembed_query(keyword)
+
+    start_date, end_date = date_window(start_date_obj, end_date_obj)
+    docs = await search_by_embedding(query_embedding, k, company_name=company_name, start_date=start_date, end_date=end_date)
+    logger.info(f"키워드 '{keyword}'에 대해 {len(docs)}개 문서 발견 (기간: {start_date} ~ {end_date}).")
+    return docs
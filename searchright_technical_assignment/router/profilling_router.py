@@ -1,103 +1,350 @@
 #########################################################################################
 # 기본 모듈 임포트
 import os
-import pandas as pd
+import json
 import traceback
 import logging
+from datetime import datetime
+from typing import List, Optional, Union
 # FastAPI 관련 모듈 임포트
-from fastapi import APIRouter, status
-
-# LangChain 관련 모듈 임포트
-from langchain_core.runnables import RunnableConfig
-
-# LangGraph 관련 모듈 임포트
-from langgraph.graph import END, StateGraph
-from langgraph.checkpoint.memory import MemorySaver
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 ## 사용자 정의 모듈 임포트
-# 상태 정의 모듈
-from searchright_technical_assignment.state.profiling_state import ProfilingState
-
-# 워크플로우 정의 모듈
-from searchright_technical_assignment.workflows.profiling_workflow import profilling_stategraph
-# 기타 유틸리티 모듈
-from searchright_technical_assignment.util.graph import visualize_graph
-from searchright_technical_assignment.util.message import invoke_graph, random_uuid
-from searchright_technical_assignment.util.extract_school_name import get_final_school_name
-from searchright_technical_assignment.util.extract_titles import get_title
-from searchright_technical_assignment.util.extract_companynames_and_dates import get_companynames_and_dates
-from searchright_technical_assignment.util.extract_descriptions import get_descriptions
+# 워크플로우 실행 모듈 (컴파일된 그래프 재사용, 배치 중복 제거)
+from searchright_technical_assignment.workflows.profiling_runner import run_profiling, run_profiling_batch, stream_profiling, get_cached_profiling
+from searchright_technical_assignment.workflows.profiling_jobs import job_queue, JobQueueFull, ProfilingJob, JOB_SUCCEEDED
+# 실행 시간 측정 모듈
+from searchright_technical_assignment.util.timing import TimingRecorder, timing_scope, timing_stats
+from searchright_technical_assignment.util.llm_router import model_router, llm_usage
+from searchright_technical_assignment.util.llm_cascade import llm_cascade
+from searchright_technical_assignment.util.llm_scheduler import llm_scheduler
+from searchright_technical_assignment.util.llm_resilience import llm_resilience
+from searchright_technical_assignment.util.llm_cassette import llm_cassette
+# 과부하 시 요청 거절(수락 제어) 모듈
+from searchright_technical_assignment.util.admission import profiling_admission, AdmissionRejected
+from searchright_technical_assignment.util.deadline import deadline_scope, remaining_seconds, resolve_budget_ms
 # 데이터 전송 객체 (DTO) 모듈
 from searchright_technical_assignment.schema.talent_dto import TalentIn, TalentOut
+from searchright_technical_assignment.schema.job_dto import ProfilingJobOut
 #########################################################################################
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 배치 요청당 최대 지원자 수
+BATCH_MAX_SIZE = int(os.getenv('PROFILING_BATCH_MAX_SIZE', '500'))
+# 작업 결과 long-poll 최대 대기 시간(초). nginx proxy_read_timeout(60초)보다 짧게 유지합니다.
+JOB_MAX_WAIT_SECONDS = float(os.getenv('PROFILING_JOB_MAX_WAIT_SECONDS', '55'))
+
 # APIRouter 인스턴스 생성
 router = APIRouter()
 
+
+def _success_out(outputs: dict, recorder: Optional[TimingRecorder] = None) -> TalentOut:
+    """
+    그래프 최종 상태로 성공 응답을 생성합니다.
+    지연 시간 예산 안에 완료되지 못한 노드가 있으면 부분 프로파일(status="partial")로 응답합니다.
+    """
+    missing_dimensions = outputs.get('missing_dimensions') or None
+    return TalentOut(
+        status="partial" if missing_dimensions else "success",  # 응답 상태
+        code=200,  # HTTP 상태 코드
+        message="Profile 부분 생성 (지연 시간 예산 초과 항목 제외)" if missing_dimensions else "Profile 생성 완료",  # 응답 메시지
+        output=outputs['profile'],
+        node_timings=recorder.summary() if recorder else None,
+        missing_dimensions=missing_dimensions
+    )
+
+
+def _error_out(e: BaseException, recorder: Optional[TimingRecorder] = None) -> TalentOut:
+    """
+    예외로 실패 응답을 생성합니다.
+    """
+    return TalentOut(
+        status="error",
+        code=500,
+        message=f"에러 발생: {str(e)}",
+        output={},
+        node_timings=recorder.summary() if recorder else None
+    )
+
+
+def _job_out(job: ProfilingJob) -> ProfilingJobOut:
+    """
+    작업 상태 응답을 생성합니다.
+    """
+    to_datetime = lambda ts: datetime.fromtimestamp(ts) if ts is not None else None
+    return ProfilingJobOut(job_id=job.job_id,
+                           status=job.status,
+                           created_at=to_datetime(job.created_at),
+                           started_at=to_datetime(job.started_at),
+                           finished_at=to_datetime(job.finished_at),
+                           error=job.error)
+
+
+def _get_job_or_404(job_id: str) -> ProfilingJob:
+    """
+    작업을 조회하고, 없으면 404 에러를 발생시킵니다.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        logger.warning(f"ID가 {job_id}인 프로파일링 작업을 찾을 수 없습니다.")
+        raise HTTPException(status_code=404, detail="Profiling job not found")
+    return job
+
+
+def _apply_latency_budget(item: TalentIn, header_budget_ms: Optional[int]) -> TalentIn:
+    """
+    요청 본문에 지연 시간 예산이 없으면 X-Latency-Budget-Ms 헤더 값을 사용합니다.
+    """
+    if item.latency_budget_ms is None and header_budget_ms is not None:
+        item.latency_budget_ms = header_budget_ms
+    return item
+
+
+def _sse_event(event: str, data) -> str:
+    """
+    Server-Sent Events 형식의 이벤트 문자열을 생성합니다.
+    """
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data), ensure_ascii=False)}\n\n"
+
+
 # 프로파일링 엔드포인트
 @router.post("/profilling", status_code = status.HTTP_200_OK, tags=['profilling'], response_model=TalentOut)
-async def profilling(item: TalentIn):
+async def profilling(item: TalentIn,
+                     timings: bool = Query(default=False, description="응답에 노드별 실행 시간(node_timings)을 포함할지 여부"),
+                     x_latency_budget_ms: Optional[int] = Header(default=None, gt=0, description="지연 시간 예산(밀리초)")):
     """
     지원자 프로파일링을 수행하는 비동기 함수입니다.
 
     Args:
         item (TalentIn): 지원자의 학력, 기술, 경력 정보를 포함하는 입력 데이터.
+        timings (bool): True이면 노드별 실행 시간과 DB 조회, 벡터 검색, LLM 호출 시간을 응답에 포함합니다.
+        x_latency_budget_ms (int, optional): 지연 시간 예산(밀리초). 본문의 latency_budget_ms가 우선합니다.
+            예산 안에 완료되지 못한 항목은 제외하고 부분 프로파일(status="partial")을 반환합니다.
 
     Returns:
         TalentOut: 프로파일링 결과 및 상태 정보를 포함하는 출력 데이터.
+
+    Raises:
+        HTTPException: 동시 실행 수와 대기열이 모두 찼거나, 예상 대기 시간이 너무 길거나 남은 지연 시간 예산을 넘는 경우
+            429 에러 발생 (Retry-After 헤더 포함).
     """
     logger.info('\n\u001b[36m[AI-API] \u001b[32m 프로파일링 시작\u001b[0m')
+    recorder = TimingRecorder() if timings else None
+    _apply_latency_budget(item, x_latency_budget_ms)
     try:
-        # 워크플로우 그래프 생성
-        workflow = profilling_stategraph(StateGraph(ProfilingState))
-
-        # 체크포인터 설정
-        memory = MemorySaver()
-
-        # 그래프 컴파일
-        app = workflow.compile(checkpointer=memory)
-
-        # 그래프 시각화
-        visualize_graph(app,'tech_graph')
-        
-        # config 설정 (재귀 최대 횟수, thread_id)
-        config = RunnableConfig(recursion_limit=5, configurable={"thread_id": random_uuid()})
-
-        # 지원자 정보 추출
-        college = get_final_school_name(item.educations or [])
-        skills = item.skills or []
-        titles = get_title(item.positions or [])
-        companynames_and_dates = get_companynames_and_dates(item.positions or [])
-        descriptions = get_descriptions(item.positions or [])
-
-        # State에 저장
-        inputs = ProfilingState(college=college,
-                                skills = skills,
-                                titles = titles,
-                                companynames_and_dates = companynames_and_dates,
-                                descriptions = descriptions)
-
-        # 그래프 실행 및 최종 상태 확인
-        outputs = await app.ainvoke(inputs, config)
-        
+        # 지연 시간 예산은 요청이 들어온 시점부터 계산하여 수락 제어 대기 시간도 포함합니다.
+        with timing_scope(recorder), deadline_scope(resolve_budget_ms(item.latency_budget_ms)):
+            # 캐시 적중은 DB 세션과 LLM을 사용하지 않으므로 수락 제어를 거치지 않고 바로 응답합니다.
+            # (대기열을 차지하거나 Retry-After 계산에 쓰이는 처리 시간 평균을 낮추지 않도록)
+            outputs = await get_cached_profiling(item)
+            if outputs is None:
+                # 동시 실행 수를 제한하고(남은 예산 안에 슬롯을 얻지 못하면 거절), 애플리케이션 시작 시 한 번 컴파일된 stateless 그래프로 실행
+                async with profiling_admission.admit(max_wait_seconds=remaining_seconds()):
+                    outputs = await run_profiling(item)
+
         logger.info("프로파일 생성 성공")
-        return TalentOut(
-            status="success",  # 응답 상태
-            code=200,  # HTTP 상태 코드
-            message="Profile 생성 완료",  # 응답 메시지
-            output=outputs['profile'],
-            node_timings={}
-        )
+        return _success_out(outputs, recorder)
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e),
+                            headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
             logger.error(f"프로파일링 중 오류 발생: {e}")
             traceback.print_exc()
-            return TalentOut(
-                status="error",
-                code=500,
-                message=f"에러 발생: {str(e)}",
-                output={},
-                node_timings={}
-            )
\ No newline at end of file
+            return _error_out(e, recorder)
+
+
+# 실행 시간 집계 조회 엔드포인트
+@router.get("/profilling/timings", tags=['profilling'])
+async def profilling_timings():
+    """
+    프로세스 시작 이후 집계된 노드별/의존성별 실행 시간 통계를 반환합니다.
+
+    Returns:
+        dict: {노드: {의존성: {"count", "mean_ms", "p50_ms", "p95_ms", "max_ms"}}}
+    """
+    return timing_stats.snapshot()
+
+
+# LLM 모델 라우팅 및 사용량 조회 엔드포인트
+@router.get("/profilling/llm-usage", tags=['profilling'])
+async def profilling_llm_usage():
+    """
+    노드별 주 모델/대체 모델 설정과, 프로세스 시작 이후 집계된 노드별/모델별 LLM 호출 수, 토큰 수, 추정 비용,
+    모델 캐스케이드의 노드별 에스컬레이션 비율, 전역 속도 제한 스케줄러의 우선순위별 대기 시간과 모델별 한도,
+    노드별 LLM 호출 시간 초과/재시도/헤징 카운터, 카세트 기록/재생 현황을 반환합니다.
+    노드별/모델별 LLM 호출 시간은 /profilling/timings의 'llm.<모델>' 항목에서 확인할 수 있습니다.
+
+    Returns:
+        dict: {"routes": {노드: {"model", "fallback"}}, "usage": {노드: {모델: {"calls", "errors", "prompt_tokens", "completion_tokens", "cost_usd"}}},
+               "cascade": {"enabled", "models", "nodes": {노드: {"calls", "accepted", "escalated", "escalation_rate", "reasons"}}},
+               "scheduler": {"enabled", "queue_depth", "backoffs", "priorities": {우선순위: {"granted", "mean_wait_ms", "max_wait_ms"}},
+                             "limits": {모델: {"rpm", "tpm"}}},
+               "resilience": {노드: {"calls", "timeouts", "retries", "errors", "hedges_fired", "hedges_won", "hedge_delay_ms"}},
+               "cassette": {"mode", "path", "hits", "misses", "recorded"}}
+    """
+    return {"routes": model_router.routes(),
+            "usage": llm_usage.snapshot(),
+            "cascade": {"enabled": llm_cascade.enabled,
+                        "models": llm_cascade.model_label,
+                        "nodes": llm_cascade.stats.snapshot()},
+            "scheduler": llm_scheduler.stats(),
+            "resilience": llm_resilience.snapshot(),
+            "cassette": llm_cassette.stats()}
+
+
+# 수락 제어 상태 조회 엔드포인트
+@router.get("/profilling/admission", tags=['profilling'])
+async def profilling_admission_stats():
+    """
+    /profilling 엔드포인트의 실행/대기 중인 요청 수와 누적 수락/거절 수를 반환합니다.
+
+    Returns:
+        dict: {"in_flight", "queue_depth", "estimated_wait_seconds", "admitted", "rejected", ...}
+    """
+    return profiling_admission.stats()
+
+
+# 스트리밍 프로파일링 엔드포인트
+@router.post("/profilling/stream", status_code = status.HTTP_200_OK, tags=['profilling'])
+async def profilling_stream(item: TalentIn,
+                            x_latency_budget_ms: Optional[int] = Header(default=None, gt=0, description="지연 시간 예산(밀리초)")):
+    """
+    지원자 프로파일링을 수행하면서 각 노드의 부분 프로파일을 완료 즉시 Server-Sent Events로 전송합니다.
+
+    이벤트 종류:
+        - node: {"node": 노드 이름, "profile": 해당 노드의 부분 프로파일}
+        - profile: 최종 결합된 TalentOut
+        - error: 실패 시 에러 TalentOut
+
+    Args:
+        item (TalentIn): 지원자의 학력, 기술, 경력 정보를 포함하는 입력 데이터.
+        x_latency_budget_ms (int, optional): 지연 시간 예산(밀리초). 본문의 latency_budget_ms가 우선합니다.
+
+    Returns:
+        StreamingResponse: text/event-stream 응답.
+    """
+    logger.info('\n\u001b[36m[AI-API] \u001b[32m 스트리밍 프로파일링 시작\u001b[0m')
+    _apply_latency_budget(item, x_latency_budget_ms)
+
+    async def event_generator():
+        try:
+            async for update in stream_profiling(item):
+                if update["final"]:
+                    logger.info("프로파일 생성 성공")
+                    yield _sse_event("profile", _success_out({'profile': update["profile"],
+                                                              'missing_dimensions': update["missing_dimensions"]}))
+                else:
+                    yield _sse_event("node", {"node": update["node"], "profile": update["profile"]})
+        except Exception as e:
+            logger.error(f"스트리밍 프로파일링 중 오류 발생: {e}")
+            traceback.print_exc()
+            yield _sse_event("error", _error_out(e))
+
+    # nginx 등 프록시가 응답을 버퍼링하지 않도록 헤더를 설정합니다.
+    return StreamingResponse(event_generator(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+# 배치 프로파일링 엔드포인트
+@router.post("/profilling/batch", status_code = status.HTTP_200_OK, tags=['profilling'], response_model=List[TalentOut])
+async def profilling_batch(items: List[TalentIn]):
+    """
+    여러 지원자의 프로파일링을 제한된 동시성으로 수행합니다.
+    배치 안에서 같은 학교, 같은 회사+근무기간, 같은 회사 제품 조회는 한 번만 계산하여 공유합니다.
+
+    Args:
+        items (List[TalentIn]): 지원자 입력 데이터 리스트.
+
+    Returns:
+        List[TalentOut]: 입력 순서대로의 프로파일링 결과. 실패한 지원자는 에러 응답으로 채워집니다.
+
+    Raises:
+        HTTPException: 배치 크기가 최대 허용치를 초과한 경우 413 에러 발생.
+    """
+    logger.info(f'\n\u001b[36m[AI-API] \u001b[32m 배치 프로파일링 시작 ({len(items)}명)\u001b[0m')
+    if len(items) > BATCH_MAX_SIZE:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"배치 크기는 최대 {BATCH_MAX_SIZE}명입니다.")
+
+    results = await run_profiling_batch(items)
+
+    outs = []
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error(f"배치 프로파일링 중 오류 발생: {result}")
+            outs.append(_error_out(result))
+        else:
+            outs.append(_success_out(result))
+    return outs
+
+
+# 비동기 프로파일링 작업 제출 엔드포인트
+@router.post("/profilling/jobs", status_code = status.HTTP_202_ACCEPTED, tags=['profilling'], response_model=ProfilingJobOut)
+async def submit_profilling_job(item: TalentIn):
+    """
+    지원자 프로파일링 작업을 대기열에 등록하고 즉시 작업 ID를 반환합니다.
+    작업은 프로세스 내 워커 풀이 설정된 동시성(PROFILING_JOB_WORKERS)으로 처리합니다.
+
+    Args:
+        item (TalentIn): 지원자의 학력, 기술, 경력 정보를 포함하는 입력 데이터.
+
+    Returns:
+        ProfilingJobOut: 등록된 작업의 상태 정보.
+
+    Raises:
+        HTTPException: 작업 대기열이 가득 찬 경우 503 에러 발생.
+    """
+    try:
+        job = await job_queue.submit(item)
+    except JobQueueFull as e:
+        logger.warning(str(e))
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "5"})
+    return _job_out(job)
+
+
+# 비동기 프로파일링 작업 상태 조회 엔드포인트
+@router.get("/profilling/jobs/{job_id}", tags=['profilling'], response_model=ProfilingJobOut)
+async def get_profilling_job(job_id: str):
+    """
+    프로파일링 작업의 상태를 조회합니다.
+
+    Args:
+        job_id (str): 작업 ID.
+
+    Returns:
+        ProfilingJobOut: 작업 상태 정보.
+
+    Raises:
+        HTTPException: 작업을 찾을 수 없는 경우 404 에러 발생.
+    """
+    return _job_out(_get_job_or_404(job_id))
+
+
+# 비동기 프로파일링 작업 결과 조회 엔드포인트
+@router.get("/profilling/jobs/{job_id}/result", tags=['profilling'], response_model=Union[TalentOut, ProfilingJobOut])
+async def get_profilling_job_result(job_id: str, response: Response,
+                                    wait: float = Query(default=0, ge=0, description="결과를 기다릴 최대 시간(초, long-poll)")):
+    """
+    프로파일링 작업의 결과를 조회합니다. wait가 주어지면 작업이 완료될 때까지 최대 wait초 동안 기다립니다.
+
+    Args:
+        job_id (str): 작업 ID.
+        wait (float): 결과를 기다릴 최대 시간(초). JOB_MAX_WAIT_SECONDS를 넘지 않습니다.
+
+    Returns:
+        TalentOut | ProfilingJobOut: 완료된 경우 프로파일링 결과, 아직 진행 중인 경우 202 상태와 작업 상태 정보.
+
+    Raises:
+        HTTPException: 작업을 찾을 수 없는 경우 404 에러 발생.
+    """
+    job = _get_job_or_404(job_id)
+    if not await job_queue.wait(job, min(wait, JOB_MAX_WAIT_SECONDS)):
+        response.status_code = status.HTTP_202_ACCEPTED
+        return _job_out(job)
+    if job.status == JOB_SUCCEEDED:
+        return _success_out(job.outputs)
+    return _error_out(RuntimeError(job.error))
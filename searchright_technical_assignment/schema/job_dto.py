@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+class ProfilingJobOut(BaseModel):
+    job_id: str = Field(description="작업 ID")
+    status: str = Field(description="작업 상태 (queued, running, succeeded, failed)")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+    model_config = {"from_attributes": True}
@@ -19,3 +19,10 @@ class ExperienceItem(BaseModel):
 class ExperienceResponse(BaseModel):
     experience_and_reason: List[ExperienceItem] = Field(description="경험")
     
+
+class CombinedProfileResponse(BaseModel):
+    college_level: str = Field(description="대학 수준 (상위권대학교, 중위권대학교, 하위권대학교, 최종학력없음)")
+    leadership: str = Field(description="leadership 여부 (리더쉽 or 리더쉽경험없음)")
+    leadership_reason: List[str] = Field(description="리더쉽 근거 리스트")
+    company_size_and_reason: List[CompanySizeItem] = Field(description="회사경험, 조직,투자 규모 or 회사명")
+    experience_and_reason: List[ExperienceItem] = Field(description="경험")
@@ -2,14 +2,18 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 
 class TalentIn(BaseModel):
+    talent_id: Optional[str] = Field(default=None, description="지원자 ID. 체크포인터 설정 시 작업 큐 실행의 재개 단위(thread_id)로 사용")
     educations: Optional[List[Dict[str, Any]]] = Field(default=None)
     skills: Optional[List[str]] = Field(default=None)
     positions: Optional[List[Dict[str, Any]]] = Field(default=None)
+    latency_budget_ms: Optional[int] = Field(default=None, gt=0, description="지연 시간 예산(밀리초). 초과한 항목은 제외하고 부분 프로파일을 반환")
 
 class TalentOut(BaseModel):
     status: str
     code: int
     message: str
     output: Dict
+    node_timings: Optional[Dict[str, Any]] = Field(default=None, description="노드별 실행 시간 및 노드 내부 의존성 시간 (요청 시에만 포함)")
+    missing_dimensions: Optional[List[str]] = Field(default=None, description="지연 시간 예산 안에 완료되지 못해 프로파일에서 제외된 노드")
 
     model_config = {"from_attributes": True}
\ No newline at end of file
@@ -1,4 +1,5 @@
 # DB
+import operator
 from typing import TypedDict, Annotated, List, Dict
 
 class ProfilingState(TypedDict):
@@ -21,4 +22,6 @@ class ProfilingState(TypedDict):
     experience_and_reason: Annotated[List, "경험"]
     # Profile
     profile: Annotated[Dict, "프로파일"]
+    # 지연 시간 예산 안에 완료되지 못한 노드 (병렬 노드의 결과를 이어 붙입니다)
+    missing_dimensions: Annotated[List, operator.add]
     
\ No newline at end of file
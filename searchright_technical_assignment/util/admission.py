@@ -0,0 +1,153 @@
+import os
+import math
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from dotenv import load_dotenv
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 동시에 실행할 수 있는 프로파일링 요청 수.
+# 연결 풀(pool_size=10, max_overflow=5) 15개 중 5개는 프로세스 전체가 공유하는 뉴스 벡터 검색 세션 상한
+# (PGVECTOR_MAX_CONCURRENT_SEARCHES)이고, 요청 하나가 그 밖에 동시에 쓰는 세션은 회사 조회 1개
+# (company_size, experience가 요청 범위 중복 제거로 공유)이므로 나머지 10개를 요청 수로 허용합니다.
+# /profilling/batch, /profilling/stream, 작업 큐 워커는 수락 제어를 거치지 않으므로 함께 운영하면 이 값을 낮춥니다.
+ADMISSION_MAX_CONCURRENCY = int(os.getenv('PROFILING_MAX_CONCURRENCY', '10'))
+# 실행 슬롯을 기다릴 수 있는 최대 요청 수
+ADMISSION_MAX_QUEUE = int(os.getenv('PROFILING_MAX_QUEUE', '14'))
+# 예상 대기 시간이 이 값(초)을 넘으면 대기열에 넣지 않고 바로 거절합니다.
+ADMISSION_MAX_ESTIMATED_WAIT_SECONDS = float(os.getenv('PROFILING_MAX_ESTIMATED_WAIT_SECONDS', '20'))
+# 처리 시간 추정에 사용할 지수 이동 평균 가중치와 초기값(초)
+SERVICE_TIME_EWMA_ALPHA = 0.2
+INITIAL_SERVICE_TIME_SECONDS = float(os.getenv('PROFILING_INITIAL_SERVICE_TIME_SECONDS', '5'))
+
+# 거절 사유
+REJECT_QUEUE_FULL = "queue_full"
+REJECT_WAIT_TOO_LONG = "estimated_wait"
+REJECT_DEADLINE = "deadline"
+
+
+class AdmissionRejected(Exception):
+    """
+    과부하로 요청을 받을 수 없을 때 발생하는 예외입니다.
+    """
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"요청이 많아 처리할 수 없습니다. ({reason}, {retry_after}초 후 재시도)")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    동시 실행 수 제한과 길이가 제한된 대기열로 요청 수락 여부를 결정하는 클래스입니다.
+    대기열이 가득 찼거나 예상 대기 시간이 너무 길면 모든 요청이 함께 느려지는 대신 즉시 거절합니다.
+    """
+
+    def __init__(self, max_concurrency: int = ADMISSION_MAX_CONCURRENCY, max_queue: int = ADMISSION_MAX_QUEUE,
+                 max_estimated_wait_seconds: float = ADMISSION_MAX_ESTIMATED_WAIT_SECONDS,
+                 initial_service_time_seconds: float = INITIAL_SERVICE_TIME_SECONDS):
+        """
+        AdmissionController 객체를 초기화합니다.
+
+        Args:
+            max_concurrency (int): 동시에 실행할 수 있는 요청 수.
+            max_queue (int): 실행 슬롯을 기다릴 수 있는 최대 요청 수.
+            max_estimated_wait_seconds (float): 허용할 최대 예상 대기 시간(초).
+            initial_service_time_seconds (float): 처리 시간 측정값이 없을 때 사용할 요청당 처리 시간(초).
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max_queue
+        self.max_estimated_wait_seconds = max_estimated_wait_seconds
+        self.service_time = initial_service_time_seconds
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = {REJECT_QUEUE_FULL: 0, REJECT_WAIT_TOO_LONG: 0, REJECT_DEADLINE: 0}
+
+    def estimated_wait(self) -> float:
+        """
+        지금 들어온 요청이 실행 슬롯을 얻기까지의 예상 대기 시간(초)을 반환합니다.
+        """
+        if self.in_flight < self.max_concurrency:
+            return 0.0
+        # 앞선 대기 요청과 자신이 모두 슬롯을 얻으려면 슬롯마다 몇 번의 요청이 끝나야 하는지로 추정합니다.
+        return math.ceil((self.queued + 1) / self.max_concurrency) * self.service_time
+
+    def _reject(self, reason: str):
+        self.rejected[reason] += 1
+        retry_after = max(1, math.ceil(self.estimated_wait() or self.service_time))
+        logger.warning(f"[Admission] 요청 거절 ({reason}): 실행 {self.in_flight}, 대기 {self.queued}, 재시도 {retry_after}초 후")
+        raise AdmissionRejected(reason, retry_after)
+
+    @asynccontextmanager
+    async def admit(self, max_wait_seconds: Optional[float] = None):
+        """
+        실행 슬롯을 얻을 때까지 기다린 뒤 요청을 실행하는 비동기 컨텍스트 관리자입니다.
+
+        Args:
+            max_wait_seconds (float, optional): 이 요청이 슬롯을 기다릴 수 있는 최대 시간(초). 요청의 남은 지연 시간 예산을 전달합니다.
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나, 예상 대기 시간이 허용치 또는 max_wait_seconds를 넘거나,
+                max_wait_seconds 안에 슬롯을 얻지 못한 경우.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.in_flight >= self.max_concurrency:
+            if self.queued >= self.max_queue:
+                self._reject(REJECT_QUEUE_FULL)
+            if self.estimated_wait() > self.max_estimated_wait_seconds:
+                self._reject(REJECT_WAIT_TOO_LONG)
+            if max_wait_seconds is not None and self.estimated_wait() > max_wait_seconds:
+                self._reject(REJECT_DEADLINE)
+
+        self.queued += 1
+        try:
+            # 빈 슬롯이 있으면 남은 예산과 무관하게 바로 실행합니다.
+            if max_wait_seconds is None or not self._semaphore.locked():
+                await self._semaphore.acquire()
+            else:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=max_wait_seconds)
+            acquired = True
+        except asyncio.TimeoutError:
+            acquired = False
+        finally:
+            self.queued -= 1
+        if not acquired:
+            self._reject(REJECT_DEADLINE)
+        self.in_flight += 1
+        self.admitted += 1
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+            elapsed = time.perf_counter() - start_time
+            self.service_time += SERVICE_TIME_EWMA_ALPHA * (elapsed - self.service_time)
+
+    def stats(self) -> dict:
+        """
+        현재 실행/대기 중인 요청 수와 누적 수락/거절 수를 반환합니다.
+        """
+        return {"max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                "queue_depth": self.queued,
+                "estimated_wait_seconds": round(self.estimated_wait(), 2),
+                "service_time_seconds": round(self.service_time, 3),
+                "admitted": self.admitted,
+                "rejected": dict(self.rejected)}
+
+
+# /profilling 엔드포인트 앞단의 프로세스 단위 수락 제어기
+profiling_admission = AdmissionController()
@@ -0,0 +1,140 @@
+import json
+import asyncio
+import logging
+import functools
+import contextvars
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class BatchDeduplicator:
+    """
+    하나의 배치(또는 요청) 범위 안에서 동일한 하위 계산을 한 번만 수행하도록 하는 클래스입니다.
+
+    같은 (namespace, key)로 요청된 계산은 최초 호출에서 생성된 태스크를 공유하며,
+    실행 중에 함께 기다린 호출자는 같은 결과(또는 같은 예외)를 받습니다.
+    실패한 계산은 보관하지 않으므로, 일시적인 DB/임베딩 오류가 이후 호출자에게 재사용되지 않습니다.
+    max_entries를 지정하면 완료된 계산을 오래 사용되지 않은 순서(LRU)로 제거하여 장시간 실행에서도 메모리를 제한합니다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        BatchDeduplicator 객체를 초기화합니다.
+
+        Args:
+            max_entries (int, optional): 보관할 최대 계산 수. None이면 제한 없음 (요청/배치 범위용).
+        """
+        self._tasks: OrderedDict[Tuple[str, Hashable], asyncio.Future] = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def run(self, namespace: str, key: Hashable, factory: Callable[[], Awaitable[Any]]):
+        """
+        (namespace, key)에 해당하는 계산 결과를 반환합니다. 처음 요청된 경우에만 factory를 실행합니다.
+
+        Args:
+            namespace (str): 계산 종류 (예: 'college_level', 'company_data').
+            key (Hashable): 계산 입력을 나타내는 키.
+            factory (Callable[[], Awaitable[Any]]): 실제 계산을 수행하는 코루틴 팩토리.
+
+        Returns:
+            Any: 계산 결과.
+        """
+        task_key = (namespace, key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(factory())
+            self._tasks[task_key] = task
+            task.add_done_callback(functools.partial(self._forget_failed, task_key))
+            self._evict()
+        else:
+            self.hits += 1
+            self._tasks.move_to_end(task_key)
+            logger.debug(f"[BatchDedup] 중복 계산 재사용: {namespace}")
+        # 한 호출자가 취소되어도 공유 태스크는 다른 호출자를 위해 계속 실행됩니다.
+        return await asyncio.shield(task)
+
+    def _forget_failed(self, task_key: Tuple[str, Hashable], task: asyncio.Future):
+        """
+        실패하거나 취소된 계산을 제거하여 다음 호출에서 다시 실행되도록 합니다.
+        """
+        if (task.cancelled() or task.exception() is not None) and self._tasks.get(task_key) is task:
+            del self._tasks[task_key]
+
+    def _evict(self):
+        """
+        보관 수가 max_entries를 넘으면 완료된 계산을 오래 사용되지 않은 순서로 제거합니다. 실행 중인 계산은 제거하지 않습니다.
+        """
+        if self.max_entries is None:
+            return
+        for task_key, task in list(self._tasks.items()):
+            if len(self._tasks) <= self.max_entries:
+                break
+            if task.done():
+                del self._tasks[task_key]
+                self.evictions += 1
+
+
+# 현재 실행 컨텍스트의 중복 제거기 (LangGraph 노드까지 전파됩니다)
+_current_dedup: contextvars.ContextVar[BatchDeduplicator | None] = contextvars.ContextVar('batch_dedup', default=None)
+
+
+@contextmanager
+def dedup_scope(deduplicator: BatchDeduplicator | None = None):
+    """
+    중복 제거 범위를 설정하는 컨텍스트 관리자입니다. 이미 범위가 열려 있으면 그대로 재사용합니다.
+
+    Args:
+        deduplicator (BatchDeduplicator, optional): 사용할 중복 제거기. 없으면 새로 생성합니다.
+
+    Yields:
+        BatchDeduplicator: 현재 범위의 중복 제거기.
+    """
+    current = _current_dedup.get()
+    if current is not None and deduplicator is None:
+        yield current
+        return
+    deduplicator = deduplicator or BatchDeduplicator()
+    token = _current_dedup.set(deduplicator)
+    try:
+        yield deduplicator
+    finally:
+        _current_dedup.reset(token)
+
+
+async def dedup(namespace: str, key: Hashable, factory: Callable[[], Awaitable[Any]]):
+    """
+    현재 범위의 중복 제거기를 통해 계산을 수행합니다. 범위가 없으면 factory를 바로 실행합니다.
+
+    Args:
+        namespace (str): 계산 종류.
+        key (Hashable): 계산 입력을 나타내는 키.
+        factory (Callable[[], Awaitable[Any]]): 실제 계산을 수행하는 코루틴 팩토리.
+
+    Returns:
+        Any: 계산 결과.
+    """
+    deduplicator = _current_dedup.get()
+    if deduplicator is None:
+        return await factory()
+    return await deduplicator.run(namespace, key, factory)
+
+
+def canonical_key(value: Any) -> str:
+    """
+    리스트/딕셔너리 입력을 순서가 고정된 JSON 문자열로 변환하여 중복 제거 키로 사용합니다.
+
+    Args:
+        value (Any): 키로 변환할 값.
+
+    Returns:
+        str: 정규화된 JSON 문자열.
+    """
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
@@ -0,0 +1,174 @@
+import json
+import time
+import sqlite3
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class LRUTTLCache:
+    """
+    최대 크기(LRU 제거)와 만료 시간(TTL)을 지원하는 메모리 캐시입니다.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        LRUTTLCache 객체를 초기화합니다.
+
+        Args:
+            max_size (int): 보관할 최대 항목 수.
+            ttl_seconds (float, optional): 항목 만료 시간(초). None이면 만료되지 않습니다.
+            clock (Callable[[], float], optional): 현재 시각을 반환하는 함수.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (만료 시각, 값)
+        self._data: OrderedDict[str, tuple] = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at is not None and expires_at < self._clock():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = self._clock() + ttl_seconds if ttl_seconds is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SqliteCache:
+    """
+    재시작 후에도 유지되는 sqlite 기반 JSON 캐시입니다.
+    이벤트 루프를 막지 않도록 비동기 메서드는 스레드에서 실행됩니다.
+    """
+
+    def __init__(self, path: str, table: str = "cache", ttl_seconds: Optional[float] = None):
+        """
+        SqliteCache 객체를 초기화하고 테이블을 생성합니다.
+
+        Args:
+            path (str): sqlite 파일 경로.
+            table (str): 사용할 테이블 이름.
+            ttl_seconds (float, optional): 항목 만료 시간(초). None이면 만료되지 않습니다.
+        """
+        self.path = path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+        logger.info(f"sqlite 캐시 사용: {path} (테이블: {table})")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute(f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            self.delete(key)
+            return default
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), expires_at),
+            )
+
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """
+        만료된 항목을 삭제하고 삭제된 수를 반환합니다.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+        return cursor.rowcount
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        await asyncio.to_thread(self.set, key, value, ttl_seconds)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """
+    메모리(LRU/TTL) 캐시와 선택적인 sqlite 캐시를 묶은 2단 캐시입니다.
+    조회 시 메모리를 먼저 확인하고, 디스크에서 찾은 항목은 메모리로 올립니다.
+    """
+
+    def __init__(self, memory: LRUTTLCache, disk: Optional[SqliteCache] = None):
+        self.memory = memory
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+
+    async def aget(self, key: str, ttl_seconds: Optional[float] = None) -> Any:
+        """
+        캐시에서 값을 조회합니다. 없으면 None.
+
+        Args:
+            key (str): 캐시 키.
+            ttl_seconds (float, optional): 디스크에서 메모리로 올릴 때 사용할 TTL(초).
+        """
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = await self.disk.aget(key)
+            if value is not None:
+                self.memory.set(key, value, ttl_seconds)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def aset(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        캐시에 값을 저장합니다. 디스크 캐시가 있으면 함께 저장합니다.
+        """
+        self.memory.set(key, value, ttl_seconds)
+        if self.disk is not None:
+            await self.disk.aset(key, value, ttl_seconds)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "memory_size": len(self.memory),
+                "disk": self.disk.path if self.disk is not None else None}
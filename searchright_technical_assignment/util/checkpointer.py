@@ -0,0 +1,168 @@
+import os
+import time
+import logging
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from typing import Callable, Optional
+
+from dotenv import load_dotenv
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 체크포인터 모드: none(기본, 체크포인트 없음) | memory(크기/TTL 제한 메모리) | postgres
+CHECKPOINTER_MODE = os.getenv('PROFILING_CHECKPOINTER', 'none').lower()
+# memory 모드에서 유지할 최대 thread 수와 thread별 TTL(초)
+CHECKPOINTER_MAX_THREADS = int(os.getenv('PROFILING_CHECKPOINTER_MAX_THREADS', '1000'))
+CHECKPOINTER_TTL_SECONDS = float(os.getenv('PROFILING_CHECKPOINTER_TTL_SECONDS', '600'))
+# postgres 모드에서 사용할 접속 문자열 (psycopg 형식)
+CHECKPOINT_DATABASE_URL = os.getenv('CHECKPOINT_DATABASE_URL')
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    thread_id 단위 LRU/TTL 제거를 지원하는 메모리 체크포인터입니다.
+
+    InMemorySaver는 thread_id별 체크포인트를 무한히 보관하므로 장시간 실행되는 워커에서
+    RSS가 계속 증가합니다. 이 클래스는 최근 사용 순서를 추적하여 최대 thread 수를 넘거나
+    TTL이 지난 thread의 체크포인트, 쓰기 기록, blob을 함께 제거합니다.
+    """
+
+    def __init__(self, max_threads: int = CHECKPOINTER_MAX_THREADS, ttl_seconds: Optional[float] = CHECKPOINTER_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic, **kwargs):
+        """
+        BoundedMemorySaver 객체를 초기화합니다.
+
+        Args:
+            max_threads (int): 동시에 보관할 최대 thread 수.
+            ttl_seconds (float, optional): 마지막 접근 이후 thread를 보관할 시간(초). None이면 TTL 미적용.
+            clock (Callable[[], float], optional): 현재 시각을 반환하는 함수. 기본값은 time.monotonic.
+        """
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # thread_id -> 마지막 접근 시각 (오래된 순서)
+        self._last_access: OrderedDict[str, float] = OrderedDict()
+        self.evicted_threads = 0
+
+    def _touch(self, config: RunnableConfig):
+        """
+        thread의 마지막 접근 시각을 갱신하고 제거 대상 thread를 정리합니다.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        self._last_access[thread_id] = self._clock()
+        self._last_access.move_to_end(thread_id)
+        self._evict(keep=thread_id)
+
+    def _evict(self, keep: Optional[str] = None):
+        """
+        TTL이 지났거나 최대 thread 수를 초과한 thread를 오래된 순서로 제거합니다.
+
+        Args:
+            keep (str, optional): 현재 사용 중이어서 제거하지 않을 thread_id.
+        """
+        now = self._clock()
+        for thread_id, last_access in list(self._last_access.items()):
+            if thread_id == keep:
+                continue
+            expired = self.ttl_seconds is not None and now - last_access > self.ttl_seconds
+            over_capacity = len(self._last_access) > self.max_threads
+            if not (expired or over_capacity):
+                break
+            self.delete_thread(thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        if self._last_access.pop(thread_id, None) is not None:
+            self.evicted_threads += 1
+            logger.debug(f"체크포인트 thread 제거: {thread_id}")
+
+    def get_tuple(self, config: RunnableConfig):
+        if config["configurable"].get("thread_id") in self._last_access:
+            self._touch(config)
+        return super().get_tuple(config)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        result = super().put(config, checkpoint, metadata, new_versions)
+        self._touch(config)
+        return result
+
+    def put_writes(self, config, writes, task_id, task_path: str = ""):
+        super().put_writes(config, writes, task_id, task_path)
+        self._touch(config)
+
+    @property
+    def thread_count(self) -> int:
+        """
+        현재 보관 중인 thread 수를 반환합니다.
+        """
+        return len(self._last_access)
+
+
+# 애플리케이션 수명 동안 열려 있는 체크포인터와 정리용 스택
+_checkpointer: Optional[BaseCheckpointSaver] = None
+_exit_stack: Optional[AsyncExitStack] = None
+
+
+async def open_checkpointer(mode: Optional[str] = None) -> Optional[BaseCheckpointSaver]:
+    """
+    설정된 모드에 맞는 체크포인터를 생성합니다. FastAPI lifespan 또는 배치 스크립트 시작 시 호출됩니다.
+
+    Args:
+        mode (str, optional): 'none', 'memory', 'postgres' 중 하나. 기본값은 PROFILING_CHECKPOINTER 환경 변수.
+
+    Returns:
+        BaseCheckpointSaver | None: 생성된 체크포인터. 'none' 모드인 경우 None.
+
+    Raises:
+        ValueError: 알 수 없는 모드이거나 postgres 접속 정보가 없는 경우.
+        ImportError: postgres 모드에 필요한 패키지가 설치되어 있지 않은 경우.
+    """
+    global _checkpointer, _exit_stack
+    mode = (mode or CHECKPOINTER_MODE).lower()
+
+    if mode == 'none':
+        logger.info("체크포인터 없이(stateless) 그래프를 실행합니다.")
+        _checkpointer = None
+    elif mode == 'memory':
+        _checkpointer = BoundedMemorySaver()
+        logger.info(f"메모리 체크포인터 사용 (최대 thread: {CHECKPOINTER_MAX_THREADS}, TTL: {CHECKPOINTER_TTL_SECONDS}초)")
+    elif mode == 'postgres':
+        if not CHECKPOINT_DATABASE_URL:
+            raise ValueError("postgres 체크포인터를 사용하려면 CHECKPOINT_DATABASE_URL 환경 변수가 필요합니다.")
+        try:
+            from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        except ImportError as e:
+            raise ImportError("postgres 체크포인터를 사용하려면 'langgraph-checkpoint-postgres' 패키지를 설치하세요.") from e
+        _exit_stack = AsyncExitStack()
+        _checkpointer = await _exit_stack.enter_async_context(AsyncPostgresSaver.from_conn_string(CHECKPOINT_DATABASE_URL))
+        await _checkpointer.setup()
+        logger.info("postgres 체크포인터 사용.")
+    else:
+        raise ValueError(f"알 수 없는 체크포인터 모드입니다: {mode}")
+    return _checkpointer
+
+
+async def close_checkpointer():
+    """
+    열려 있는 체크포인터 자원(postgres 연결 등)을 정리합니다.
+    """
+    global _checkpointer, _exit_stack
+    if _exit_stack is not None:
+        await _exit_stack.aclose()
+        _exit_stack = None
+    _checkpointer = None
+
+
+def get_checkpointer() -> Optional[BaseCheckpointSaver]:
+    """
+    현재 열려 있는 체크포인터를 반환합니다. 없으면 None.
+    """
+    return _checkpointer
@@ -0,0 +1,91 @@
+import os
+import time
+import asyncio
+import logging
+import functools
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, List, Optional
+
+from dotenv import load_dotenv
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 요청에 지연 시간 예산이 없을 때 사용할 기본 예산(밀리초). 미설정 시 제한 없음.
+DEFAULT_LATENCY_BUDGET_MS = os.getenv('PROFILING_DEFAULT_LATENCY_BUDGET_MS')
+# 결합 노드와 응답 직렬화를 위해 예산에서 남겨 둘 시간(밀리초)
+DEADLINE_RESERVE_MS = float(os.getenv('PROFILING_DEADLINE_RESERVE_MS', '100'))
+
+# 현재 요청의 마감 시각 (time.monotonic 기준, LangGraph 노드 태스크까지 전파됩니다)
+_current_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('profiling_deadline', default=None)
+
+
+def resolve_budget_ms(budget_ms: Optional[float]) -> Optional[float]:
+    """
+    요청의 지연 시간 예산을 결정합니다. 요청 값이 없으면 기본 예산을 사용합니다.
+    """
+    if budget_ms is not None:
+        return budget_ms
+    return float(DEFAULT_LATENCY_BUDGET_MS) if DEFAULT_LATENCY_BUDGET_MS else None
+
+
+@contextmanager
+def deadline_scope(budget_ms: Optional[float]):
+    """
+    요청 단위 마감 시각을 설정하는 컨텍스트 관리자입니다.
+    바깥에서 이미 마감 시각을 설정했으면(예: 수락 제어 대기 전에 라우터가 설정) 새로 시작하지 않고 그 마감 시각을 사용하여,
+    대기열에서 기다린 시간도 예산에 포함합니다.
+
+    Args:
+        budget_ms (float, optional): 지연 시간 예산(밀리초). None이면 마감 시각을 설정하지 않습니다.
+    """
+    deadline = _current_deadline.get()
+    if deadline is None and budget_ms is not None:
+        deadline = time.monotonic() + budget_ms / 1000
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def remaining_seconds() -> Optional[float]:
+    """
+    마감 시각까지 노드가 사용할 수 있는 남은 시간(초)을 반환합니다. 마감 시각이 없으면 None.
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic() - DEADLINE_RESERVE_MS / 1000)
+
+
+def deadline_node(node: str, func: Callable[..., Awaitable[Any]],
+                  dimensions: Optional[List[str]] = None) -> Callable[..., Awaitable[Any]]:
+    """
+    LangGraph 노드 함수를 요청의 남은 예산만큼의 타임아웃으로 실행합니다.
+    시간이 초과되면 예외 대신 'missing_dimensions'에 노드 이름을 기록하여, 결합 노드가 완료된 결과만으로 프로파일을 만들게 합니다.
+
+    Args:
+        node (str): 노드 이름.
+        func (Callable[..., Awaitable[Any]]): 감쌀 비동기 노드 함수.
+        dimensions (List[str], optional): 시간 초과 시 누락으로 기록할 항목. 기본값은 [node].
+            (여러 항목을 한 번에 판단하는 통합 노드용)
+
+    Returns:
+        Callable[..., Awaitable[Any]]: 타임아웃이 적용된 노드 함수.
+    """
+    @functools.wraps(func)
+    async def _wrapper(state):
+        timeout = remaining_seconds()
+        if timeout is None:
+            return await func(state)
+        try:
+            return await asyncio.wait_for(func(state), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"[Deadline] '{node}' 노드가 남은 예산 {timeout * 1000:.0f}ms 안에 완료되지 않아 결과에서 제외합니다.")
+            return {'missing_dimensions': list(dimensions or [node])}
+    return _wrapper
@@ -1,10 +1,12 @@
-import os
 import logging
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
 from typing import List, Dict
 from tqdm.asyncio import tqdm
 
+from .openai_provider import openai_provider, OPENAI_EMBEDDING_MODEL
+from .llm_scheduler import llm_scheduler
+from .prompt_budget import count_tokens
+
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -47,8 +49,8 @@ async def generate_embedding(texts: List[str]) -> List[List[float]]:
         logger.info("모든 텍스트가 캐시에 있어 임베딩을 새로 생성하지 않습니다.")
         return results
 
-    # 배치 처리
-    client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    # 배치 처리 (호출마다 클라이언트를 만들지 않고 공유 연결 풀의 클라이언트 사용)
+    client = openai_provider.async_client()
     logger.info(f"총 {len(texts_to_embed)}개의 텍스트를 임베딩합니다. 배치 사이즈: {BATCH_SIZE}")
 
     # tqdm을 사용하여 배치 처리 루프에 진행률 표시줄을 추가합니다.
@@ -57,10 +59,13 @@ async def generate_embedding(texts: List[str]) -> List[List[float]]:
         batch_indices = indices_to_embed[i:i + BATCH_SIZE]
         
         try:
-            response = await client.embeddings.create(
-                input=batch_texts,
-                model="text-embedding-ada-002"
-            )
+            # 전역 스케줄러에서 임베딩 모델의 RPM/TPM 한도 안의 실행 순서를 받습니다.
+            batch_tokens = sum(count_tokens(text, OPENAI_EMBEDDING_MODEL) for text in batch_texts)
+            async with llm_scheduler.slot(OPENAI_EMBEDDING_MODEL, batch_tokens):
+                response = await client.embeddings.create(
+                    input=batch_texts,
+                    model=OPENAI_EMBEDDING_MODEL
+                )
             for j, embedding in enumerate(response.data):
                 original_index = batch_indices[j]
                 results[original_index] = embedding.embedding
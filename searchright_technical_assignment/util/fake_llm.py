@@ -0,0 +1,224 @@
+import os
+import math
+import time
+import random
+import asyncio
+import hashlib
+import logging
+import typing
+from types import SimpleNamespace
+from typing import Any, List, Optional, Type
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from .school_tier_index import TIERS
+from .leadership_rules import LEADERSHIP, NO_LEADERSHIP
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 가짜 LLM/임베딩 응답 지연 분포 (초 단위)
+# 'none', 'fixed:<초>', 'uniform:<최소>,<최대>', 'lognormal:<중앙값>,<sigma>' 형식
+FAKE_LLM_LATENCY = os.getenv('FAKE_LLM_LATENCY', 'lognormal:0.8,0.4')
+FAKE_EMBEDDING_LATENCY = os.getenv('FAKE_EMBEDDING_LATENCY', 'fixed:0.02')
+# 지연 시간 표본 추출 시드 (같은 시드면 같은 지연 시간 순서를 재현)
+FAKE_LLM_SEED = int(os.getenv('FAKE_LLM_SEED', '0'))
+# 가짜 응답의 출력 토큰 수
+FAKE_LLM_COMPLETION_TOKENS = int(os.getenv('FAKE_LLM_COMPLETION_TOKENS', '60'))
+# 임베딩 차원 (company_news 벡터와 같은 1536차원)
+FAKE_EMBEDDING_SIZE = 1536
+
+
+class LatencyDistribution:
+    """
+    가짜 호출의 응답 지연 시간 분포입니다.
+    """
+
+    def __init__(self, spec: str, seed: int = FAKE_LLM_SEED):
+        """
+        LatencyDistribution 객체를 초기화합니다.
+
+        Args:
+            spec (str): 'none', 'fixed:0.1', 'uniform:0.05,0.2', 'lognormal:0.8,0.4' 형식의 분포 설정.
+            seed (int): 표본 추출 시드.
+
+        Raises:
+            ValueError: 지원하지 않는 분포인 경우.
+        """
+        self.spec = spec
+        kind, _, params = spec.partition(':')
+        self.kind = kind.strip().lower()
+        self.params = [float(p) for p in params.split(',') if p.strip()]
+        if self.kind not in ('none', 'fixed', 'uniform', 'lognormal'):
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {spec}")
+        self._rng = random.Random(seed)
+
+    def sample(self) -> float:
+        if self.kind == 'fixed':
+            return self.params[0]
+        if self.kind == 'uniform':
+            return self._rng.uniform(self.params[0], self.params[1])
+        if self.kind == 'lognormal':
+            return self._rng.lognormvariate(math.log(self.params[0]), self.params[1])
+        return 0.0
+
+
+def _digest(text: str) -> int:
+    return int(hashlib.sha256(text.encode('utf-8')).hexdigest()[:12], 16)
+
+
+def _choice(options, key: str, field: str):
+    return options[_digest(f"{field}:{key}") % len(options)]
+
+
+def _vocabulary():
+    """
+    필드 이름별로 실제 응답에서 허용되는 값 목록을 반환합니다. (캐스케이드 검증을 통과하도록)
+    """
+    from .llm_cascade import LARGE_COMPANY, GROWTH_STARTUP
+    return {
+        'college_level': list(TIERS),
+        'leadership': [LEADERSHIP, NO_LEADERSHIP],
+        'company_size': [LARGE_COMPANY, GROWTH_STARTUP],
+    }
+
+
+def _fake_value(annotation: Any, field: str, key: str) -> Any:
+    origin = typing.get_origin(annotation)
+    if origin in (list, List):
+        (item_type,) = typing.get_args(annotation) or (str,)
+        return [_fake_value(item_type, field, key)]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return fake_instance(annotation, key)
+    if annotation is float:
+        return 0.9
+    if annotation is int:
+        return 1
+    if annotation is bool:
+        return True
+    options = _vocabulary().get(field)
+    if options:
+        return _choice(options, key, field)
+    return f"{field} 예시"
+
+
+def fake_instance(schema: Type[BaseModel], key: str) -> BaseModel:
+    """
+    스키마의 필드 타입에 맞는 값으로 채운 결정적인 응답 객체를 생성합니다.
+
+    Args:
+        schema (Type[BaseModel]): 출력 스키마 (LeadershipResponse, CompanySizeResponse 등).
+        key (str): 값을 고르는 기준 문자열 (같은 key면 같은 응답).
+
+    Returns:
+        BaseModel: 스키마 검증을 통과하는 응답 객체.
+    """
+    values = {name: _fake_value(info.annotation, name, key) for name, info in schema.model_fields.items()}
+    return schema.model_validate(values)
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    네트워크 없이 결정적인 응답을 지연 분포에 따라 반환하는 채팅 모델입니다.
+    문자열 출력은 학교 수준 중 하나를, with_structured_output은 스키마를 만족하는 객체를 반환합니다.
+    콜백(LLMUsageCallback)과 토큰 사용량은 실제 모델과 같은 방식으로 전달됩니다.
+    """
+
+    model_name: str = "fake"
+    latency: Any = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _result(self, messages: List[BaseMessage]) -> ChatResult:
+        prompt = "\n".join(str(message.content) for message in messages)
+        content = _choice(list(TIERS), prompt, 'college_level')
+        usage = {"input_tokens": _estimate_tokens(prompt), "output_tokens": FAKE_LLM_COMPLETION_TOKENS,
+                 "total_tokens": _estimate_tokens(prompt) + FAKE_LLM_COMPLETION_TOKENS}
+        # 구조화된 출력이 같은 프롬프트에 같은 응답을 만들도록 프롬프트 해시를 함께 전달합니다.
+        message = AIMessage(content=content, usage_metadata=usage,
+                            response_metadata={"model_name": self.model_name, "prompt_digest": str(_digest(prompt))})
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency is not None:
+            time.sleep(self.latency.sample())
+        return self._result(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency is not None:
+            await asyncio.sleep(self.latency.sample())
+        return self._result(messages)
+
+    def with_structured_output(self, schema: Type[BaseModel], **kwargs) -> Runnable:
+        return self | RunnableLambda(lambda message: fake_instance(schema, message.response_metadata["prompt_digest"]))
+
+
+class FakeEmbeddings(DeterministicFakeEmbedding):
+    """
+    같은 텍스트에 같은 벡터를 반환하는 임베딩 모델에 지연 분포를 더한 클래스입니다.
+    """
+
+    latency: Any = None
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.latency is not None:
+            time.sleep(self.latency.sample())
+        return super().embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        if self.latency is not None:
+            time.sleep(self.latency.sample())
+        return super().embed_query(text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.latency is not None:
+            await asyncio.sleep(self.latency.sample())
+        return super().embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        if self.latency is not None:
+            await asyncio.sleep(self.latency.sample())
+        return super().embed_query(text)
+
+
+class FakeAsyncOpenAI:
+    """
+    util/embedding.py가 사용하는 AsyncOpenAI의 embeddings.create만 흉내 내는 클라이언트입니다.
+    """
+
+    def __init__(self, embeddings: FakeEmbeddings):
+        self._embeddings = embeddings
+        self.embeddings = SimpleNamespace(create=self._create_embeddings)
+
+    async def _create_embeddings(self, input: List[str], model: str, **kwargs):
+        vectors = await self._embeddings.aembed_documents(list(input))
+        return SimpleNamespace(model=model, data=[SimpleNamespace(index=i, embedding=v) for i, v in enumerate(vectors)])
+
+
+def fake_chat_model(model: str, callbacks=None) -> FakeChatModel:
+    """
+    모델 이름별 가짜 채팅 모델을 생성합니다.
+    """
+    return FakeChatModel(model_name=model, latency=LatencyDistribution(FAKE_LLM_LATENCY), callbacks=callbacks)
+
+
+def fake_embeddings() -> FakeEmbeddings:
+    """
+    가짜 임베딩 모델을 생성합니다.
+    """
+    return FakeEmbeddings(size=FAKE_EMBEDDING_SIZE, latency=LatencyDistribution(FAKE_EMBEDDING_LATENCY))
@@ -0,0 +1,146 @@
+import os
+import re
+import hashlib
+import logging
+from typing import Iterable, List, Optional
+
+from dotenv import load_dotenv
+
+from ..schema.response_dto import LeadershipResponse
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 규칙 기반 리더십 판단 사용 여부
+LEADERSHIP_RULES_ENABLED = os.getenv('LEADERSHIP_RULES_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# 근거로 반환할 최대 직책 수
+MAX_REASONS = 5
+
+# leadership_prompt와 같은 출력 값
+LEADERSHIP = "리더쉽"
+NO_LEADERSHIP = "리더쉽경험없음"
+
+# 직책에 있으면 리더십 경험으로 바로 판단하는 용어 (팀 리더, 조직 책임자, 임원, 창업)
+# 한글 용어는 단어 끝에서만 일치합니다. ('개발팀장', '테크 리드'는 일치, '리더십', '리드타임'은 불일치)
+STRONG_TERMS = [
+    "리드", "리더", "팀장", "파트장", "실장", "본부장", "부문장", "그룹장", "센터장", "셀장", "챕터장", "사업부장",
+    "부장", "소장", "지점장", "국장", "원장",
+    "이사", "상무", "전무", "부사장", "사장", "대표", "창업", "공동창업", "창업자", "임원",
+    "lead", "leader", "head", "director", "vp", "vice president", "chief",
+    "ceo", "cto", "cpo", "cfo", "coo", "cio", "cso", "cmo", "cdo",
+    "founder", "co-founder", "cofounder", "engineering manager", "team manager",
+]
+# 리더십 근거일 수도 있지만 단독으로는 판단하기 어려운 용어 → LLM으로 판단
+WEAK_TERMS = [
+    "매니저", "관리자", "책임", "수석", "멘토", "멘토링", "주도", "총괄", "pm", "po", "프로젝트 매니저",
+    "manager", "management", "mentor", "mentoring", "principal", "owner", "supervisor", "coordinator",
+    "leadership", "리더십", "리더쉽", "팀 관리", "조직 관리", "founding",
+]
+# 리더 역할이 아닌 것으로 판단할 수 있는 직무 용어. 모든 직책이 이 용어로만 설명될 때만 LLM 없이 '리더쉽경험없음'으로 판단합니다.
+NON_LEADER_TERMS = [
+    "개발자", "엔지니어", "프로그래머", "디자이너", "연구원", "분석가", "기획자", "마케터", "컨설턴트", "사원", "주임", "대리",
+    "engineer", "developer", "programmer", "designer", "researcher", "scientist", "analyst", "marketer", "consultant",
+    "specialist", "associate",
+]
+# 리더십 용어를 포함하지만 리더 역할이 아닌 직책 (예: Lead Generation, 팀장 비서) → LLM으로 판단
+EXCLUDE_TERMS = [
+    "lead generation", "lead gen", "리드 제너레이션", "리드 발굴", "비서", "어시스턴트", "assistant", "인턴", "intern",
+]
+
+
+def _build_matcher(terms: Iterable[str], suffix_terms: Iterable[str] = ()) -> re.Pattern:
+    """
+    여러 용어를 한 번에 찾는 정규식을 만듭니다. 영문 용어는 단어 경계를 적용하여 'Headquarters' 같은 부분 일치를 피하고,
+    suffix_terms에 있는 한글 용어는 뒤에 한글이 이어지지 않을 때(단어 끝)만 일치시킵니다.
+    긴 용어를 먼저 두어 'vice president'가 'vp'보다, '리더십'이 '리더'보다 우선 매칭되도록 합니다.
+    """
+    suffix_terms = set(suffix_terms)
+    patterns = []
+    for term in sorted(set(terms), key=len, reverse=True):
+        escaped = re.escape(term).replace(r"\ ", r"\s*")
+        if re.search(r"[a-z]", term):
+            patterns.append(rf"(?<![a-z]){escaped}(?![a-z])")
+        elif term in suffix_terms:
+            patterns.append(rf"{escaped}(?![가-힣])")
+        else:
+            patterns.append(escaped)
+    return re.compile("|".join(patterns), re.IGNORECASE)
+
+
+def _term_key(text: str) -> str:
+    return re.sub(r"\s+", "", text.lower())
+
+
+# 리더 역할 용어와 애매한 용어를 한 정규식으로 찾아, 같은 위치에서는 더 긴 애매한 용어('리더십')가 리더 역할 용어('리더')보다 우선합니다.
+_TERM_MATCHER = _build_matcher(STRONG_TERMS + WEAK_TERMS, suffix_terms=STRONG_TERMS)
+_STRONG_KEYS = {_term_key(term) for term in STRONG_TERMS}
+_EXCLUDE_MATCHER = _build_matcher(EXCLUDE_TERMS)
+_NON_LEADER_MATCHER = _build_matcher(NON_LEADER_TERMS)
+# 용어 목록이 바뀌면 이전 규칙으로 만든 결과가 재사용되지 않도록 하는 해시
+_LEXICON_FINGERPRINT = hashlib.sha256("\x00".join(
+    "\x01".join(terms) for terms in (STRONG_TERMS, WEAK_TERMS, EXCLUDE_TERMS, NON_LEADER_TERMS)
+).encode("utf-8")).hexdigest()[:16]
+
+
+def rules_fingerprint() -> str:
+    """
+    규칙 사용 여부와 용어 목록의 식별자를 반환합니다. (프로파일 캐시 키용)
+    """
+    return f"{LEADERSHIP_RULES_ENABLED}:{_LEXICON_FINGERPRINT}"
+
+
+def _is_strong(text: str) -> bool:
+    return any(_term_key(match.group(0)) in _STRONG_KEYS for match in _TERM_MATCHER.finditer(text))
+
+
+def strong_titles(titles: Optional[List[str]]) -> List[str]:
+    """
+    리더 역할 용어(팀장, 리드, Head, CTO, 창업 등)가 있는 직책만 반환합니다. (Lead Generation 같은 예외 직책 제외)
+    """
+    return [t.strip() for t in titles or [] if isinstance(t, str) and not _EXCLUDE_MATCHER.search(t) and _is_strong(t)]
+
+
+def match_leadership(skills: Optional[List[str]], titles: Optional[List[str]]) -> Optional[LeadershipResponse]:
+    """
+    직책과 기술 목록만으로 리더십 여부가 명확한 경우 LLM 없이 판단합니다.
+
+    - 직책에 팀장, 리드, Head, CTO, 창업 등 리더 역할 용어가 있으면 '리더쉽' (근거: 해당 직책)
+    - 모든 직책이 개발자, 엔지니어, 디자이너 같은 실무 직무 용어로만 설명되고, 기술에도 리더십 관련 용어가 없으면 '리더쉽경험없음'
+    - 그 외(매니저, PM, 멘토링, Lead Generation 등 애매한 경우와 어떤 용어에도 해당하지 않는 직책)는 None을 반환하여 LLM으로 판단하게 합니다.
+
+    Args:
+        skills (List[str], optional): 지원자 기술 목록.
+        titles (List[str], optional): 지원자 직책 목록.
+
+    Returns:
+        Optional[LeadershipResponse]: 규칙으로 판단한 결과 또는 None.
+    """
+    if not LEADERSHIP_RULES_ENABLED:
+        return None
+    skills = [s for s in skills or [] if isinstance(s, str)]
+    titles = [t for t in titles or [] if isinstance(t, str)]
+
+    reasons: List[str] = []
+    ambiguous = False
+    for title in titles:
+        if _EXCLUDE_MATCHER.search(title):
+            ambiguous = True
+        elif _is_strong(title):
+            if title.strip() not in reasons:
+                reasons.append(title.strip())
+        elif _TERM_MATCHER.search(title) or not _NON_LEADER_MATCHER.search(title):
+            # 애매한 용어가 있거나 용어 목록에 없는 직책은 리더십이 없다고 단정하지 않습니다.
+            ambiguous = True
+
+    if reasons:
+        logger.info(f"[LeadershipRules] 직책으로 리더십 판단: {reasons[:MAX_REASONS]}")
+        return LeadershipResponse(leadership=LEADERSHIP, reason=reasons[:MAX_REASONS])
+
+    if ambiguous or any(_TERM_MATCHER.search(s) for s in skills):
+        return None
+
+    logger.info("[LeadershipRules] 실무 직무 직책만 있고 리더십 관련 기술이 없어 리더쉽경험없음으로 판단")
+    return LeadershipResponse(leadership=NO_LEADERSHIP, reason=["없음"])
@@ -0,0 +1,116 @@
+import os
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Optional, Type
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+
+from .batch_dedup import canonical_key
+from .cache import LRUTTLCache, SqliteCache, TieredCache
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# LLM 응답 캐시 사용 여부
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# 메모리 캐시 최대 항목 수
+LLM_CACHE_MAX_SIZE = int(os.getenv('LLM_CACHE_MAX_SIZE', '20000'))
+# 재시작 후에도 유지되는 sqlite 캐시 경로 (미설정 시 메모리 캐시만 사용)
+LLM_CACHE_SQLITE_PATH = os.getenv('LLM_CACHE_SQLITE_PATH')
+# 노드별 기본 TTL(초). LLM_CACHE_TTL_SECONDS_<노드 이름 대문자>로 변경할 수 있습니다.
+# 학교 수준은 거의 바뀌지 않고, 회사 규모는 DB/뉴스 데이터가 입력에 포함되어 갱신 주기가 짧습니다.
+DEFAULT_NODE_TTL_SECONDS = {
+    'college_level': 30 * 86400,
+    'leadership': 7 * 86400,
+    'company_size': 1 * 86400,
+    'experience': 7 * 86400,
+    # 통합 판단은 회사 규모 입력(DB/뉴스)을 포함하므로 회사 규모와 같은 주기로 갱신합니다.
+    'combined_profile': 1 * 86400,
+}
+LLM_CACHE_TTL_SECONDS = float(os.getenv('LLM_CACHE_TTL_SECONDS', str(7 * 86400)))
+
+
+def node_ttl_seconds(node: str) -> float:
+    """
+    노드별 캐시 TTL(초)을 반환합니다.
+    """
+    value = os.getenv(f'LLM_CACHE_TTL_SECONDS_{node.upper()}')
+    if value:
+        return float(value)
+    return DEFAULT_NODE_TTL_SECONDS.get(node, LLM_CACHE_TTL_SECONDS)
+
+
+def _prompt_identity(prompt: Any) -> str:
+    template = getattr(prompt, 'template', prompt)
+    return hashlib.sha256(str(template).encode('utf-8')).hexdigest()[:16]
+
+
+def llm_cache_key(node: str, model_name: str, prompt: Any, inputs: dict, response_model: Optional[Type[BaseModel]] = None) -> str:
+    """
+    (모델, 프롬프트 템플릿, 출력 스키마, 렌더링 입력 변수)로 LLM 응답 캐시 키를 생성합니다.
+
+    Args:
+        node (str): 호출한 노드 이름.
+        model_name (str): LLM 모델 이름.
+        prompt (Any): 프롬프트 템플릿 (template 속성의 내용으로 식별).
+        inputs (dict): 프롬프트에 전달되는 입력 변수.
+        response_model (Type[BaseModel], optional): 구조화된 출력 스키마. 문자열 출력이면 None.
+
+    Returns:
+        str: sha256 해시 기반 캐시 키.
+    """
+    schema = response_model.__name__ if response_model is not None else 'str'
+    identity = [node, model_name, _prompt_identity(prompt), schema, inputs]
+    return f"llm:{node}:{hashlib.sha256(canonical_key(identity).encode('utf-8')).hexdigest()}"
+
+
+def _build_llm_cache() -> Optional[TieredCache]:
+    if not LLM_CACHE_ENABLED:
+        logger.info("LLM 응답 캐시 비활성화.")
+        return None
+    disk = None
+    if LLM_CACHE_SQLITE_PATH:
+        disk = SqliteCache(LLM_CACHE_SQLITE_PATH, table="llm_cache", ttl_seconds=LLM_CACHE_TTL_SECONDS)
+    return TieredCache(LRUTTLCache(max_size=LLM_CACHE_MAX_SIZE, ttl_seconds=LLM_CACHE_TTL_SECONDS), disk)
+
+
+# 프로세스 단위로 공유되는 LLM 응답 캐시 (비활성화 시 None)
+llm_cache: Optional[TieredCache] = _build_llm_cache()
+
+
+async def cached_llm_call(node: str, model_name: str, prompt: Any, inputs: dict,
+                          factory: Callable[[], Awaitable[Any]],
+                          response_model: Optional[Type[BaseModel]] = None) -> Any:
+    """
+    같은 (모델, 프롬프트, 입력)의 LLM 호출 결과를 캐시에서 반환하고, 없으면 factory를 실행해 저장합니다.
+    temperature=0 호출만 대상으로 하며, 구조화된 출력은 JSON으로 저장했다가 response_model로 복원합니다.
+
+    Args:
+        node (str): 호출한 노드 이름 (노드별 TTL에 사용).
+        model_name (str): LLM 모델 이름.
+        prompt (Any): 프롬프트 템플릿.
+        inputs (dict): 프롬프트에 전달되는 입력 변수.
+        factory (Callable[[], Awaitable[Any]]): 실제 LLM 호출을 수행하는 코루틴 팩토리.
+        response_model (Type[BaseModel], optional): 구조화된 출력 스키마. 문자열 출력이면 None.
+
+    Returns:
+        Any: 문자열 또는 response_model 인스턴스.
+    """
+    if llm_cache is None:
+        return await factory()
+
+    key = llm_cache_key(node, model_name, prompt, inputs, response_model)
+    ttl_seconds = node_ttl_seconds(node)
+    cached = await llm_cache.aget(key, ttl_seconds)
+    if cached is not None:
+        logger.info(f"[LLMCache] '{node}' 응답 캐시 적중")
+        return response_model.model_validate(cached) if response_model is not None else cached
+
+    answer = await factory()
+    value = answer.model_dump() if isinstance(answer, BaseModel) else answer
+    await llm_cache.aset(key, value, ttl_seconds)
+    return answer
@@ -0,0 +1,248 @@
+import os
+import re
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Type
+
+from dotenv import load_dotenv
+from pydantic import BaseModel, Field, ValidationError, create_model
+from langchain_core.exceptions import OutputParserException
+
+from .llm_router import ModelRouter, model_router, DEFAULT_FALLBACK_MODELS
+from .leadership_rules import strong_titles, LEADERSHIP, NO_LEADERSHIP
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 모델 캐스케이드 사용 여부 (에스컬레이션 비율을 확인한 뒤 켜는 것을 권장합니다)
+LLM_CASCADE_ENABLED = os.getenv('LLM_CASCADE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+# 캐스케이드를 적용할 노드 (쉼표로 구분)
+LLM_CASCADE_NODES = [n.strip() for n in os.getenv('LLM_CASCADE_NODES', 'leadership,company_size,experience').split(',') if n.strip()]
+# 먼저 호출하는 저비용 모델과, 에스컬레이션 시 호출하는 모델
+LLM_CASCADE_CHEAP_MODEL = os.getenv('LLM_CASCADE_CHEAP_MODEL', 'gpt-4o-mini')
+LLM_CASCADE_STRONG_MODEL = os.getenv('LLM_CASCADE_STRONG_MODEL', 'gpt-4o')
+# 저비용 모델이 스스로 평가한 확신도가 이 값보다 낮으면 에스컬레이션합니다.
+LLM_CASCADE_MIN_CONFIDENCE = float(os.getenv('LLM_CASCADE_MIN_CONFIDENCE', '0.7'))
+
+# 에스컬레이션 사유
+ESCALATE_ERROR = "error"
+ESCALATE_INVALID = "invalid"
+ESCALATE_LOW_CONFIDENCE = "low_confidence"
+ESCALATE_DISAGREEMENT = "disagreement"
+
+# company_size_prompt가 정의하는 회사 규모 값
+LARGE_COMPANY = "대규모 회사 경험"
+GROWTH_STARTUP = "성장기스타트업 경험"
+# DB 신호로 판단하는 회사 규모 기준 (company_size_prompt의 분류 기준과 같음)
+LARGE_COMPANY_MIN_ORGANIZATION = 300
+STARTUP_MIN_ORGANIZATION = 10
+# 투자 단계 값은 정규화(소문자, 괄호 메모 제거) 후 앞부분으로 비교합니다. (예: 'Series A (추정)', 'Series B-2')
+STARTUP_INVESTMENT_LEVELS = ("series a", "series b", "series c")
+
+_confidence_models: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+
+def with_confidence(response_model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    출력 스키마에 저비용 모델이 스스로 평가한 확신도(confidence) 필드를 추가한 스키마를 반환합니다.
+    """
+    if response_model not in _confidence_models:
+        _confidence_models[response_model] = create_model(
+            f"{response_model.__name__}WithConfidence", __base__=response_model,
+            confidence=(float, Field(description="판단에 대한 확신도 (0.0 ~ 1.0). 입력 정보가 부족하거나 기준이 애매하면 낮게 평가")))
+    return _confidence_models[response_model]
+
+
+def check_leadership(answer: BaseModel, inputs: dict) -> Optional[str]:
+    """
+    리더십 응답을 검증합니다. 정의되지 않은 값이거나 근거가 없으면 'invalid',
+    직책에 명확한 리더 역할이 있는데 '리더쉽경험없음'이면 'disagreement'.
+    """
+    if answer.leadership not in (LEADERSHIP, NO_LEADERSHIP):
+        return ESCALATE_INVALID
+    if answer.leadership == LEADERSHIP and not [r for r in answer.reason if r and r != "없음"]:
+        return ESCALATE_INVALID
+    if answer.leadership == NO_LEADERSHIP and strong_titles(inputs.get('titles')):
+        return ESCALATE_DISAGREEMENT
+    return None
+
+
+def _organization_size(company: dict) -> Optional[int]:
+    value = (company.get('organization') or {}).get('value')
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _investment_level(company: dict) -> str:
+    level = str((company.get('investment') or {}).get('level') or '').lower()
+    level = re.sub(r"[(\[（].*?[)\]）]", " ", level).replace("-", " ")
+    return " ".join(level.split())
+
+
+def check_company_size(answer: BaseModel, inputs: dict) -> Optional[str]:
+    """
+    회사 규모 응답을 검증합니다. 정의되지 않은 규모 값이거나 근거가 없으면 'invalid',
+    DB의 재직자 수/투자 단계가 가리키는 규모가 응답에 없으면 'disagreement'.
+    """
+    sizes = set()
+    for item in answer.company_size_and_reason:
+        if item.company_size not in (LARGE_COMPANY, GROWTH_STARTUP) or not item.reasons:
+            return ESCALATE_INVALID
+        sizes.add(item.company_size)
+
+    for company in inputs.get('grouped_company_data') or []:
+        organization = _organization_size(company)
+        level = _investment_level(company)
+        if organization is not None and organization >= LARGE_COMPANY_MIN_ORGANIZATION and LARGE_COMPANY not in sizes:
+            return ESCALATE_DISAGREEMENT
+        if (level.startswith(STARTUP_INVESTMENT_LEVELS) and organization is not None
+                and STARTUP_MIN_ORGANIZATION <= organization < LARGE_COMPANY_MIN_ORGANIZATION and GROWTH_STARTUP not in sizes):
+            return ESCALATE_DISAGREEMENT
+    return None
+
+
+def check_experience(answer: BaseModel, inputs: dict) -> Optional[str]:
+    """
+    경험 응답을 검증합니다. 경험/근거가 비어 있거나 같은 경험이 중복되면 'invalid',
+    경력 설명이 없는데 경험을 만들어 내면 'disagreement'.
+    """
+    experiences = [item.experience.strip() for item in answer.experience_and_reason]
+    if any(not experience for experience in experiences) or len(set(experiences)) != len(experiences):
+        return ESCALATE_INVALID
+    if any(not str(item.reasons).strip() for item in answer.experience_and_reason):
+        return ESCALATE_INVALID
+    if experiences and not [d for d in inputs.get('descriptions') or [] if d]:
+        return ESCALATE_DISAGREEMENT
+    return None
+
+
+# 노드별 결정적 검증 함수
+NODE_CHECKS: Dict[str, Callable[[BaseModel, dict], Optional[str]]] = {
+    'leadership': check_leadership,
+    'company_size': check_company_size,
+    'experience': check_experience,
+}
+
+
+class CascadeStats:
+    """
+    노드별 저비용 모델 채택 수와 사유별 에스컬레이션 수를 집계하는 클래스입니다.
+    """
+
+    def __init__(self):
+        self._accepted: Dict[str, int] = defaultdict(int)
+        self._escalated: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record_accepted(self, node: str):
+        self._accepted[node] += 1
+
+    def record_escalated(self, node: str, reason: str):
+        self._escalated[node][reason] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns:
+            Dict: {노드: {"calls", "accepted", "escalated", "escalation_rate", "reasons": {사유: 수}}}
+        """
+        result = {}
+        for node in set(self._accepted) | set(self._escalated):
+            escalated = sum(self._escalated[node].values())
+            calls = self._accepted[node] + escalated
+            result[node] = {"calls": calls,
+                            "accepted": self._accepted[node],
+                            "escalated": escalated,
+                            "escalation_rate": round(escalated / calls, 4) if calls else 0.0,
+                            "reasons": dict(self._escalated[node])}
+        return result
+
+    def reset(self):
+        self._accepted.clear()
+        self._escalated.clear()
+
+
+class LLMCascade:
+    """
+    저비용 모델로 먼저 판단하고, 응답이 검증에 실패하거나 확신도가 낮거나 결정적 신호(DB 정보, 직책 규칙)와
+    어긋나는 경우에만 상위 모델로 다시 판단하는 모델 캐스케이드입니다.
+    """
+
+    def __init__(self, router: ModelRouter = model_router, cheap_model: str = LLM_CASCADE_CHEAP_MODEL,
+                 strong_model: str = LLM_CASCADE_STRONG_MODEL, min_confidence: float = LLM_CASCADE_MIN_CONFIDENCE,
+                 nodes=None, enabled: bool = LLM_CASCADE_ENABLED):
+        """
+        LLMCascade 객체를 초기화합니다.
+
+        Args:
+            router (ModelRouter): 모델별 ChatOpenAI 객체를 제공하는 모델 라우터.
+            cheap_model (str): 먼저 호출하는 저비용 모델.
+            strong_model (str): 에스컬레이션 시 호출하는 모델.
+            min_confidence (float): 저비용 모델 응답을 채택할 최소 확신도.
+            nodes (Iterable[str], optional): 캐스케이드를 적용할 노드. 기본값은 LLM_CASCADE_NODES.
+            enabled (bool): 캐스케이드 사용 여부.
+        """
+        self.router = router
+        self.cheap_model = cheap_model
+        self.strong_model = strong_model
+        self.min_confidence = min_confidence
+        self.nodes = set(LLM_CASCADE_NODES if nodes is None else nodes)
+        self.enabled = enabled
+        self.stats = CascadeStats()
+
+    def applies_to(self, node: str) -> bool:
+        return self.enabled and node in self.nodes and node in NODE_CHECKS
+
+    @property
+    def model_label(self) -> str:
+        """
+        캐시 키 등에 사용하는 캐스케이드 식별자입니다. (예: 'gpt-4o-mini>gpt-4o')
+        """
+        return f"{self.cheap_model}>{self.strong_model}"
+
+    async def _cheap_answer(self, node: str, prompt, inputs: dict, response_model: Type[BaseModel]):
+        chain = prompt | self.router.structured_for_model(self.cheap_model, with_confidence(response_model))
+        try:
+            answer = await chain.ainvoke(inputs)
+        except (ValidationError, OutputParserException) as e:
+            logger.info(f"[Cascade] '{node}' 저비용 모델 응답이 스키마 검증에 실패: {type(e).__name__}")
+            return None, ESCALATE_INVALID
+        except Exception as e:
+            logger.warning(f"[Cascade] '{node}' 저비용 모델 호출 실패: {type(e).__name__}: {e}")
+            return None, ESCALATE_ERROR
+        if answer is None:
+            return None, ESCALATE_INVALID
+        if getattr(answer, 'confidence', 0.0) < self.min_confidence:
+            return answer, ESCALATE_LOW_CONFIDENCE
+        return answer, NODE_CHECKS[node](answer, inputs)
+
+    async def ainvoke(self, node: str, prompt, inputs: dict, response_model: Type[BaseModel]) -> BaseModel:
+        """
+        캐스케이드로 노드의 구조화된 출력을 생성합니다.
+
+        Args:
+            node (str): 노드 이름.
+            prompt (PromptTemplate): 노드 프롬프트.
+            inputs (dict): 프롬프트 입력 변수.
+            response_model (Type[BaseModel]): 노드 출력 스키마.
+
+        Returns:
+            BaseModel: response_model 인스턴스.
+        """
+        answer, reason = await self._cheap_answer(node, prompt, inputs, response_model)
+        if reason is None:
+            self.stats.record_accepted(node)
+            return response_model.model_validate(answer.model_dump(exclude={'confidence'}))
+
+        self.stats.record_escalated(node, reason)
+        logger.info(f"[Cascade] '{node}' {self.strong_model}로 에스컬레이션 (사유: {reason})")
+        chain = prompt | self.router.structured_for_model(self.strong_model, response_model,
+                                                          DEFAULT_FALLBACK_MODELS.get(self.strong_model))
+        return await chain.ainvoke(inputs)
+
+
+# 프로세스 단위로 공유되는 모델 캐스케이드
+llm_cascade = LLMCascade()
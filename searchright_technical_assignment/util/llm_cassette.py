@@ -0,0 +1,243 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from langchain_core.embeddings import Embeddings
+
+from .llm_cache import llm_cache_key
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 카세트 모드 ('off', 'record': 실제 호출을 기록, 'replay': 기록된 응답을 재생)
+LLM_CASSETTE_MODE = os.getenv('LLM_CASSETTE_MODE', 'off').lower()
+CASSETTE_MODES = ('off', 'record', 'replay')
+# 카세트 파일 경로 (JSON Lines)
+LLM_CASSETTE_PATH = os.getenv('LLM_CASSETTE_PATH', 'cassettes/profiling.jsonl')
+# 재생 시 기록된 응답 시간만큼 기다릴지 여부 (false면 지연 없이 바로 응답)
+LLM_CASSETTE_REPLAY_LATENCY = os.getenv('LLM_CASSETTE_REPLAY_LATENCY', 'true').lower() in ('1', 'true', 'yes')
+# 재생 시 기록에 없는 호출 처리 ('error': CassetteMiss 발생, 'live': 실제 호출)
+LLM_CASSETTE_ON_MISS = os.getenv('LLM_CASSETTE_ON_MISS', 'error').lower()
+
+KIND_LLM = "llm"
+KIND_EMBEDDING = "embedding"
+
+
+class CassetteMiss(KeyError):
+    """
+    재생 모드에서 카세트에 기록되지 않은 호출이 발생했을 때의 예외입니다.
+    """
+
+
+def embedding_key(model: str, text: str) -> str:
+    return f"embedding:{model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+def _render_prompt(prompt: Any, inputs: dict) -> Optional[str]:
+    try:
+        return prompt.format(**inputs)
+    except Exception:
+        return None
+
+
+class Cassette:
+    """
+    LLM 호출(노드, 모델, 프롬프트, 응답)과 질의 임베딩 호출을 응답 시간과 함께 기록하고 재생하는 클래스입니다.
+
+    - record: 실제 호출 결과를 JSON Lines 파일에 한 줄씩 추가합니다.
+    - replay: 같은 키(LLM 응답 캐시 키와 같은 (노드, 모델, 프롬프트, 스키마, 입력) 해시)의 기록을
+      기록된 순서대로 반환하며, 기록된 응답 시간만큼 기다려 실제 그래프의 지연 특성을 재현합니다.
+    """
+
+    def __init__(self, path: str = LLM_CASSETTE_PATH, mode: str = LLM_CASSETTE_MODE,
+                 replay_latency: bool = LLM_CASSETTE_REPLAY_LATENCY, on_miss: str = LLM_CASSETTE_ON_MISS):
+        """
+        Cassette 객체를 초기화합니다.
+
+        Args:
+            path (str): 카세트 파일 경로.
+            mode (str): 'off', 'record', 'replay'.
+            replay_latency (bool): 재생 시 기록된 응답 시간만큼 기다릴지 여부.
+            on_miss (str): 재생 시 기록에 없는 호출 처리 ('error' 또는 'live').
+
+        Raises:
+            ValueError: 지원하지 않는 모드인 경우.
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"지원하지 않는 카세트 모드입니다: {mode} (지원: {', '.join(CASSETTE_MODES)})")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.on_miss = on_miss
+        self._entries: Dict[str, List[dict]] = defaultdict(list)
+        self._positions: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        if mode == 'replay':
+            self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != 'off'
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            logger.warning(f"[Cassette] 카세트 파일이 없습니다: {self.path}")
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[entry['key']].append(entry)
+        logger.info(f"[Cassette] {self.path}에서 {sum(len(v) for v in self._entries.values())}건의 기록을 불러왔습니다.")
+
+    def _next(self, key: str) -> Optional[dict]:
+        """
+        키의 다음 기록을 반환합니다. 같은 호출이 기록보다 많이 발생하면 마지막 기록을 반복합니다.
+        """
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                return None
+            position = self._positions[key]
+            self._positions[key] = position + 1
+            self.hits += 1
+            return entries[min(position, len(entries) - 1)]
+
+    def _append(self, entry: dict):
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.recorded += 1
+
+    def _miss(self, key: str, description: str):
+        if self.on_miss != 'live':
+            raise CassetteMiss(f"카세트에 기록되지 않은 호출입니다: {description} ({key})")
+        logger.warning(f"[Cassette] 기록되지 않은 호출을 실제로 실행합니다: {description}")
+
+    async def llm_call(self, node: str, model_name: str, prompt: Any, inputs: dict,
+                       factory: Callable[[], Awaitable[Any]],
+                       response_model: Optional[Type[BaseModel]] = None) -> Any:
+        """
+        LLM 호출을 기록하거나 재생합니다.
+
+        Args:
+            node (str): 호출한 노드 이름.
+            model_name (str): LLM 모델 이름 (캐스케이드면 캐스케이드 식별자).
+            prompt (Any): 프롬프트 템플릿.
+            inputs (dict): 프롬프트에 전달되는 입력 변수.
+            factory (Callable[[], Awaitable[Any]]): 실제 LLM 호출을 수행하는 코루틴 팩토리.
+            response_model (Type[BaseModel], optional): 구조화된 출력 스키마. 문자열 출력이면 None.
+
+        Returns:
+            Any: 문자열 또는 response_model 인스턴스.
+
+        Raises:
+            CassetteMiss: 재생 모드에서 기록이 없고 on_miss가 'error'인 경우.
+        """
+        if not self.enabled:
+            return await factory()
+
+        key = llm_cache_key(node, model_name, prompt, inputs, response_model)
+        if self.mode == 'replay':
+            entry = self._next(key)
+            if entry is not None:
+                if self.replay_latency:
+                    await asyncio.sleep(entry['latency_s'])
+                response = entry['response']
+                return response_model.model_validate(response) if response_model is not None else response
+            self._miss(key, f"'{node}' {model_name}")
+
+        start_time = time.perf_counter()
+        answer = await factory()
+        if self.mode == 'record':
+            self._append({"kind": KIND_LLM, "key": key, "node": node, "model": model_name,
+                          "schema": response_model.__name__ if response_model is not None else 'str',
+                          "prompt": _render_prompt(prompt, inputs),
+                          "response": answer.model_dump() if isinstance(answer, BaseModel) else answer,
+                          "latency_s": round(time.perf_counter() - start_time, 4)})
+        return answer
+
+    def embedding_call(self, model: str, text: str, call: Callable[[], List[float]]) -> List[float]:
+        """
+        질의 임베딩 호출(동기, 스레드에서 실행)을 기록하거나 재생합니다.
+        """
+        key = embedding_key(model, text)
+        if self.mode == 'replay':
+            entry = self._next(key)
+            if entry is not None:
+                if self.replay_latency:
+                    time.sleep(entry['latency_s'])
+                return entry['response']
+            self._miss(key, f"embedding {model}")
+
+        start_time = time.perf_counter()
+        vector = call()
+        if self.mode == 'record':
+            self._append({"kind": KIND_EMBEDDING, "key": key, "model": model, "text": text, "response": vector,
+                          "latency_s": round(time.perf_counter() - start_time, 4)})
+        return vector
+
+    async def aembedding_call(self, model: str, text: str, factory: Callable[[], Awaitable[List[float]]]) -> List[float]:
+        """
+        질의 임베딩 호출(비동기)을 기록하거나 재생합니다.
+        """
+        key = embedding_key(model, text)
+        if self.mode == 'replay':
+            entry = self._next(key)
+            if entry is not None:
+                if self.replay_latency:
+                    await asyncio.sleep(entry['latency_s'])
+                return entry['response']
+            self._miss(key, f"embedding {model}")
+
+        start_time = time.perf_counter()
+        vector = await factory()
+        if self.mode == 'record':
+            self._append({"kind": KIND_EMBEDDING, "key": key, "model": model, "text": text, "response": vector,
+                          "latency_s": round(time.perf_counter() - start_time, 4)})
+        return vector
+
+    def stats(self) -> dict:
+        return {"mode": self.mode, "path": self.path, "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+
+class CassetteEmbeddings(Embeddings):
+    """
+    질의 임베딩(embed_query)을 카세트로 기록/재생하는 임베딩 모델 래퍼입니다. 문서 임베딩은 그대로 전달합니다.
+    """
+
+    def __init__(self, inner: Embeddings, model: str, cassette: Cassette):
+        self.inner = inner
+        self.model = model
+        self.cassette = cassette
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.inner.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.cassette.embedding_call(self.model, text, lambda: self.inner.embed_query(text))
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.cassette.aembedding_call(self.model, text, lambda: self.inner.aembed_query(text))
+
+
+# 프로세스 단위로 공유되는 LLM/임베딩 카세트
+llm_cassette = Cassette()
@@ -0,0 +1,185 @@
+import os
+import time
+import random
+import asyncio
+import logging
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+import openai
+from dotenv import load_dotenv
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# LLM 호출 한 번(재시도 1회분)의 타임아웃(초). LLM_CALL_TIMEOUT_<노드 이름 대문자>로 노드별 변경 가능 (0이면 제한 없음)
+# 주 모델과 대체 모델 시도 전체에 적용되므로 모델 요청 타임아웃(LLM_REQUEST_TIMEOUT_SECONDS, 기본 20초)의 두 배 이상으로 둡니다.
+LLM_CALL_TIMEOUT_SECONDS = float(os.getenv('LLM_CALL_TIMEOUT_SECONDS', '45'))
+# 일시적인 오류(시간 초과, 연결 오류, 429, 5xx) 시 재시도 횟수와 지터 백오프의 기준/최대 대기 시간(초)
+LLM_CALL_RETRIES = int(os.getenv('LLM_CALL_RETRIES', '1'))
+LLM_RETRY_BASE_DELAY = float(os.getenv('LLM_RETRY_BASE_DELAY', '0.5'))
+LLM_RETRY_MAX_DELAY = float(os.getenv('LLM_RETRY_MAX_DELAY', '8'))
+# 헤징 사용 여부. 노드의 최근 응답 시간 분위수(기본 p95)가 지나도 응답이 없으면 같은 요청을 한 번 더 보내고 먼저 끝난 응답을 사용합니다.
+LLM_HEDGING_ENABLED = os.getenv('LLM_HEDGING_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+LLM_HEDGE_QUANTILE = float(os.getenv('LLM_HEDGE_QUANTILE', '0.95'))
+# 분위수를 계산하기 위한 최소 표본 수, 노드별로 유지하는 최근 표본 수, 헤지 요청을 보내기 전 최소 대기 시간(초)
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv('LLM_HEDGE_MIN_SAMPLES', '20'))
+LLM_HEDGE_WINDOW = int(os.getenv('LLM_HEDGE_WINDOW', '200'))
+LLM_HEDGE_MIN_DELAY = float(os.getenv('LLM_HEDGE_MIN_DELAY', '1.0'))
+
+# 재시도 대상 오류
+TRANSIENT_EXCEPTIONS = (asyncio.TimeoutError, openai.APITimeoutError, openai.APIConnectionError,
+                        openai.RateLimitError, openai.InternalServerError)
+
+
+def node_call_timeout(node: str) -> Optional[float]:
+    """
+    노드의 LLM 호출 타임아웃(초)을 반환합니다. 제한이 없으면 None.
+    """
+    value = float(os.getenv(f'LLM_CALL_TIMEOUT_{node.upper()}') or LLM_CALL_TIMEOUT_SECONDS)
+    return value if value > 0 else None
+
+
+class LLMResilience:
+    """
+    LLM 호출에 시도별 타임아웃, 지터를 넣은 재시도, 응답 시간 분위수 기반 헤징을 적용하는 클래스입니다.
+
+    - 타임아웃: 스트림이 멈춘 호출이 후보자 전체를 붙잡지 않도록 시도마다 제한 시간을 둡니다.
+    - 재시도: 일시적인 오류는 full jitter 지수 백오프 후 다시 호출합니다.
+    - 헤징: 노드의 최근 성공 응답 시간의 p95가 지나도 응답이 없으면 같은 요청을 하나 더 보내고,
+      먼저 성공한 응답을 사용하며 나머지 요청은 취소합니다.
+    """
+
+    def __init__(self, retries: int = LLM_CALL_RETRIES, base_delay: float = LLM_RETRY_BASE_DELAY,
+                 max_delay: float = LLM_RETRY_MAX_DELAY, hedging: bool = LLM_HEDGING_ENABLED,
+                 hedge_quantile: float = LLM_HEDGE_QUANTILE, hedge_min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+                 hedge_min_delay: float = LLM_HEDGE_MIN_DELAY, window: int = LLM_HEDGE_WINDOW,
+                 timeout: Callable[[str], Optional[float]] = node_call_timeout):
+        """
+        LLMResilience 객체를 초기화합니다.
+
+        Args:
+            retries (int): 일시적인 오류 시 재시도 횟수.
+            base_delay (float): 재시도 백오프 기준 시간(초).
+            max_delay (float): 재시도 백오프 최대 시간(초).
+            hedging (bool): 헤징 사용 여부.
+            hedge_quantile (float): 헤지 요청을 보낼 응답 시간 분위수.
+            hedge_min_samples (int): 헤징을 시작하기 위한 노드별 최소 표본 수.
+            hedge_min_delay (float): 헤지 요청을 보내기 전 최소 대기 시간(초).
+            window (int): 노드별로 유지할 최근 응답 시간 표본 수.
+            timeout (Callable[[str], Optional[float]]): 노드 이름으로 시도별 타임아웃을 반환하는 함수.
+        """
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedging = hedging
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.timeout = timeout
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"calls": 0, "timeouts": 0, "retries": 0, "errors": 0, "hedges_fired": 0, "hedges_won": 0})
+
+    def hedge_delay(self, node: str) -> Optional[float]:
+        """
+        헤지 요청을 보낼 때까지 기다릴 시간(초)을 반환합니다. 헤징하지 않으면 None.
+        """
+        samples = self._latencies[node]
+        if not self.hedging or len(samples) < self.hedge_min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(self.hedge_quantile * len(ordered)))
+        return max(self.hedge_min_delay, ordered[index])
+
+    def backoff(self, attempt: int) -> float:
+        """
+        attempt번째 재시도 전 대기 시간(초)을 반환합니다. (full jitter)
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def _hedged(self, node: str, factory: Callable[[], Awaitable[Any]]):
+        delay = self.hedge_delay(node)
+        primary = asyncio.ensure_future(factory())
+        if delay is None:
+            return await primary
+
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self._counters[node]["hedges_fired"] += 1
+                logger.info(f"[Hedge] '{node}' 응답이 {delay:.2f}초(p{int(self.hedge_quantile * 100)}) 동안 없어 헤지 요청을 보냅니다.")
+                tasks.append(asyncio.ensure_future(factory()))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # 먼저 끝난 요청이 실패했으면 남은 요청의 결과를 기다립니다.
+                    if task.exception() is None:
+                        if task is not primary:
+                            self._counters[node]["hedges_won"] += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def ainvoke(self, node: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        LLM 호출을 타임아웃, 재시도, 헤징을 적용하여 실행합니다.
+
+        Args:
+            node (str): 노드 이름 (타임아웃 설정, 응답 시간 분위수, 카운터 기준).
+            factory (Callable[[], Awaitable[Any]]): 호출할 때마다 새 LLM 호출 코루틴을 만드는 함수.
+
+        Returns:
+            Any: LLM 응답.
+
+        Raises:
+            Exception: 재시도 후에도 실패한 마지막 오류. (일시적이지 않은 오류는 바로 전달)
+        """
+        counters = self._counters[node]
+        counters["calls"] += 1
+        for attempt in range(self.retries + 1):
+            start_time = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(self._hedged(node, factory), timeout=self.timeout(node))
+            except TRANSIENT_EXCEPTIONS as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    counters["timeouts"] += 1
+                if attempt >= self.retries:
+                    counters["errors"] += 1
+                    raise
+                counters["retries"] += 1
+                delay = self.backoff(attempt)
+                logger.warning(f"[Retry] '{node}' LLM 호출 실패({type(e).__name__}), {delay:.2f}초 후 재시도 ({attempt + 1}/{self.retries})")
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                counters["errors"] += 1
+                raise
+            self._latencies[node].append(time.perf_counter() - start_time)
+            return result
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        노드별 호출/시간 초과/재시도/오류/헤징 카운터와 현재 헤지 대기 시간을 반환합니다.
+        """
+        result = {}
+        for node, counters in self._counters.items():
+            delay = self.hedge_delay(node)
+            result[node] = {**counters, "hedge_delay_ms": round(delay * 1000, 2) if delay is not None else None}
+        return result
+
+    def reset(self):
+        self._latencies.clear()
+        self._counters.clear()
+
+
+# 프로세스 단위로 공유되는 LLM 호출 타임아웃/재시도/헤징 정책
+llm_resilience = LLMResilience()
@@ -0,0 +1,262 @@
+import os
+import json
+import time
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Optional, Tuple, Type
+from uuid import UUID
+
+import openai
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from langchain_openai import ChatOpenAI
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from .timing import current_node, record_dependency
+from .openai_provider import openai_provider
+from .llm_scheduler import llm_scheduler, estimate_request_tokens
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 노드별 설정이 없을 때 사용할 모델
+LLM_DEFAULT_MODEL = os.getenv('LLM_DEFAULT_MODEL', 'gpt-4o')
+# 노드별 기본 모델. LLM_MODEL_<노드 이름 대문자>로 변경할 수 있습니다.
+# 학교 수준(3단계 분류)과 리더십 판단은 작은 모델로 충분하고, 회사 규모/경험은 긴 입력(DB/뉴스)을 해석해야 하므로 큰 모델을 사용합니다.
+DEFAULT_NODE_MODELS = {
+    'college_level': 'gpt-4o-mini',
+    'leadership': 'gpt-4o-mini',
+    'company_size': 'gpt-4o',
+    'experience': 'gpt-4o',
+    'combined_profile': 'gpt-4o',
+}
+# 모델별 기본 대체 모델 (시간 초과, 속도 제한 시 사용). LLM_FALLBACK_MODEL_<노드 이름 대문자>로 변경하며, 'none'이면 대체하지 않습니다.
+DEFAULT_FALLBACK_MODELS = {
+    'gpt-4o': 'gpt-4o-mini',
+    'gpt-4o-mini': 'gpt-4o',
+}
+# 모델 한 번의 요청 타임아웃(초). 시간이 초과되면 대체 모델로 넘어가므로, 노드 호출 타임아웃(LLM_CALL_TIMEOUT_SECONDS, 기본 45초)
+# 안에 주 모델과 대체 모델이 모두 시도될 수 있도록 그 절반 이하로 둡니다.
+LLM_REQUEST_TIMEOUT_SECONDS = float(os.getenv('LLM_REQUEST_TIMEOUT_SECONDS', '20'))
+# OpenAI SDK의 같은 모델 재시도 횟수. 재시도는 노드 단위(util/llm_resilience.py, LLM_CALL_RETRIES)에서만 수행하므로 기본값은 0입니다.
+# 노드 호출 한 번의 최대 업스트림 요청 수 = (1 + LLM_CALL_RETRIES) x (헤징 시 2) x (주 모델 + 대체 모델) x (1 + LLM_MAX_RETRIES)
+LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '0'))
+# 모델별 100만 토큰당 가격(USD, [입력, 출력]). LLM_MODEL_PRICES에 같은 형식의 JSON으로 추가/변경할 수 있습니다.
+MODEL_PRICES_PER_1M = {
+    'gpt-4o': (2.5, 10.0),
+    'gpt-4o-mini': (0.15, 0.6),
+}
+MODEL_PRICES_PER_1M.update({model: tuple(price) for model, price in json.loads(os.getenv('LLM_MODEL_PRICES', '{}')).items()})
+
+# 대체 모델로 넘어가는 오류 (일시적인 과부하/지연에 해당하는 오류만 대상으로 합니다)
+FALLBACK_EXCEPTIONS = (openai.RateLimitError, openai.APITimeoutError, asyncio.TimeoutError)
+
+
+def _token_usage(response: LLMResult) -> Tuple[int, int]:
+    """
+    LLM 응답에서 (입력 토큰 수, 출력 토큰 수)를 추출합니다.
+    """
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, 'message', None), 'usage_metadata', None)
+            if usage:
+                return usage.get('input_tokens', 0), usage.get('output_tokens', 0)
+    token_usage = (response.llm_output or {}).get('token_usage') or {}
+    return token_usage.get('prompt_tokens', 0), token_usage.get('completion_tokens', 0)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    토큰 수로 LLM 호출 비용(USD)을 추정합니다. 가격이 등록되지 않은 모델은 0.
+    """
+    input_price, output_price = MODEL_PRICES_PER_1M.get(model, (0.0, 0.0))
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+class LLMUsageStats:
+    """
+    프로세스 전체의 노드별/모델별 LLM 호출 수, 오류 수, 토큰 수, 추정 비용을 집계하는 클래스입니다.
+    """
+
+    def __init__(self):
+        # (노드, 모델) -> 집계값
+        self._usage: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(
+            lambda: {"calls": 0, "errors": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0})
+
+    def record(self, node: str, model: str, prompt_tokens: int, completion_tokens: int):
+        usage = self._usage[(node, model)]
+        usage["calls"] += 1
+        usage["prompt_tokens"] += prompt_tokens
+        usage["completion_tokens"] += completion_tokens
+        usage["cost_usd"] += estimate_cost(model, prompt_tokens, completion_tokens)
+
+    def record_error(self, node: str, model: str):
+        self._usage[(node, model)]["errors"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        집계된 사용량을 반환합니다. 대체 모델로 처리된 호출은 대체 모델 항목에 집계됩니다.
+
+        Returns:
+            Dict: {노드: {모델: {"calls", "errors", "prompt_tokens", "completion_tokens", "cost_usd"}}}
+        """
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (node, model), usage in self._usage.items():
+            result.setdefault(node, {})[model] = {**usage, "cost_usd": round(usage["cost_usd"], 6)}
+        return result
+
+    def reset(self):
+        self._usage.clear()
+
+
+# 프로세스 단위 LLM 사용량 집계
+llm_usage = LLMUsageStats()
+
+
+class LLMUsageCallback(AsyncCallbackHandler):
+    """
+    한 모델의 호출마다 소요 시간, 토큰 수, 비용을 현재 노드 기준으로 기록하는 콜백입니다.
+    소요 시간은 'llm.<모델>' 의존성으로 실행 시간 통계(/profilling/timings)에 함께 기록됩니다.
+    """
+
+    def __init__(self, model: str, stats: LLMUsageStats = llm_usage):
+        self.model = model
+        self.stats = stats
+        self._started: Dict[UUID, float] = {}
+
+    async def on_chat_model_start(self, serialized: Dict[str, Any], messages, *, run_id: UUID, **kwargs: Any):
+        self._started[run_id] = time.perf_counter()
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        start_time = self._started.pop(run_id, None)
+        if start_time is not None:
+            record_dependency(f"llm.{self.model}", time.perf_counter() - start_time)
+        prompt_tokens, completion_tokens = _token_usage(response)
+        self.stats.record(current_node(), self.model, prompt_tokens, completion_tokens)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._started.pop(run_id, None)
+        self.stats.record_error(current_node(), self.model)
+        logger.warning(f"[LLMRouter] '{current_node()}' 노드의 {self.model} 호출 실패: {type(error).__name__}")
+
+
+class ModelRouter:
+    """
+    노드별로 사용할 LLM 모델을 선택하고, 시간 초과/속도 제한 오류 시 대체 모델로 넘어가는 체인을 만드는 클래스입니다.
+    모델별 ChatOpenAI 객체는 첫 호출 시 한 번만 생성하여 노드 간에 공유하고, 공유 연결 풀이 닫히면 다시 생성합니다.
+    """
+
+    def __init__(self, default_model: str = LLM_DEFAULT_MODEL, node_models: Optional[Dict[str, str]] = None,
+                 fallback_models: Optional[Dict[str, str]] = None):
+        """
+        ModelRouter 객체를 초기화합니다.
+
+        Args:
+            default_model (str): 노드별 설정이 없을 때 사용할 모델.
+            node_models (Dict[str, str], optional): {노드 이름: 모델} 기본값. 환경 변수가 우선합니다.
+            fallback_models (Dict[str, str], optional): {모델: 대체 모델} 기본값.
+        """
+        self.default_model = default_model
+        self.node_models = DEFAULT_NODE_MODELS if node_models is None else node_models
+        self.fallback_models = DEFAULT_FALLBACK_MODELS if fallback_models is None else fallback_models
+        self._llms: Dict[str, ChatOpenAI] = {}
+        # (모델, 출력 스키마) -> 스키마가 바인딩된 모델
+        self._bound: Dict[Tuple[str, Optional[Type[BaseModel]]], Runnable] = {}
+        self._pool_generation = openai_provider.generation
+
+    def model_name(self, node: str) -> str:
+        """
+        노드가 사용할 주 모델 이름을 반환합니다.
+        """
+        return os.getenv(f'LLM_MODEL_{node.upper()}') or self.node_models.get(node, self.default_model)
+
+    def fallback_model_name(self, node: str) -> Optional[str]:
+        """
+        노드의 대체 모델 이름을 반환합니다. 대체하지 않으면 None.
+        """
+        fallback = os.getenv(f'LLM_FALLBACK_MODEL_{node.upper()}') or self.fallback_models.get(self.model_name(node))
+        if not fallback or fallback.lower() == 'none' or fallback == self.model_name(node):
+            return None
+        return fallback
+
+    def _sync_pool(self):
+        """
+        공유 연결 풀이 닫혔다가 다시 만들어졌으면 이전 풀에 묶인 모델 객체를 버립니다.
+        """
+        if self._pool_generation != openai_provider.generation:
+            self._llms.clear()
+            self._bound.clear()
+            self._pool_generation = openai_provider.generation
+
+    def llm(self, model: str) -> ChatOpenAI:
+        """
+        모델별로 공유되는 ChatOpenAI 객체를 반환합니다. (HTTP 연결 풀은 모든 모델이 공유)
+        """
+        self._sync_pool()
+        if model not in self._llms:
+            self._llms[model] = openai_provider.chat_model(model=model, streaming=True, stream_usage=True, temperature=0,
+                                                           timeout=LLM_REQUEST_TIMEOUT_SECONDS, max_retries=LLM_MAX_RETRIES,
+                                                           callbacks=[LLMUsageCallback(model)])
+        return self._llms[model]
+
+    def _bound_model(self, model: str, response_model: Optional[Type[BaseModel]] = None) -> Runnable:
+        """
+        모델 객체를 반환합니다. response_model이 있으면 구조화된 출력이 바인딩된 객체를 반환합니다.
+        """
+        llm = self.llm(model)
+        key = (model, response_model)
+        if key not in self._bound:
+            self._bound[key] = llm if response_model is None else llm.with_structured_output(response_model)
+        return self._bound[key]
+
+    def _scheduled(self, model: str, response_model: Optional[Type[BaseModel]] = None) -> Runnable:
+        """
+        호출 전에 전역 스케줄러에서 모델의 RPM/TPM 한도 안의 실행 순서를 받도록 감쌉니다.
+        모델 객체는 호출 시점에 조회하므로, 모듈 임포트 시 체인을 만들어도 연결 풀은 첫 호출 때 생성됩니다.
+        """
+        async def _ainvoke(value, config):
+            async with llm_scheduler.slot(model, estimate_request_tokens(value, model)):
+                return await self._bound_model(model, response_model).ainvoke(value, config)
+        return RunnableLambda(_ainvoke, name=f"scheduled_{model}")
+
+    def _with_fallback(self, model: str, fallback: Optional[str], response_model: Optional[Type[BaseModel]] = None) -> Runnable:
+        primary = self._scheduled(model, response_model)
+        if fallback is None:
+            return primary
+        return primary.with_fallbacks([self._scheduled(fallback, response_model)],
+                                      exceptions_to_handle=FALLBACK_EXCEPTIONS)
+
+    def structured_for_model(self, model: str, response_model: Type[BaseModel], fallback: Optional[str] = None) -> Runnable:
+        """
+        노드 설정과 무관하게 지정한 모델(과 대체 모델)로 구조화된 출력 모델을 반환합니다. (모델 캐스케이드용)
+        """
+        return self._with_fallback(model, fallback, response_model)
+
+    def chat(self, node: str) -> Runnable:
+        """
+        노드용 대화 모델(문자열 출력)을 대체 모델과 함께 반환합니다.
+        """
+        return self._with_fallback(self.model_name(node), self.fallback_model_name(node))
+
+    def structured(self, node: str, response_model: Type[BaseModel]) -> Runnable:
+        """
+        노드용 구조화된 출력 모델을 대체 모델과 함께 반환합니다.
+        """
+        return self.structured_for_model(self.model_name(node), response_model, self.fallback_model_name(node))
+
+    def routes(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        노드별 주 모델과 대체 모델을 반환합니다.
+        """
+        return {node: {"model": self.model_name(node), "fallback": self.fallback_model_name(node)}
+                for node in self.node_models}
+
+
+# 프로세스 단위로 공유되는 모델 라우터
+model_router = ModelRouter()
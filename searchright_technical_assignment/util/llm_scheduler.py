@@ -0,0 +1,346 @@
+import os
+import re
+import json
+import math
+import time
+import asyncio
+import logging
+import itertools
+import contextvars
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from .openai_provider import openai_provider
+from .prompt_budget import count_tokens
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 스케줄러 사용 여부
+LLM_SCHEDULER_ENABLED = os.getenv('LLM_SCHEDULER_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# 모든 모델에 적용할 분당 요청 수/토큰 수 기본 한도 (0이면 제공자 응답 헤더의 한도를 알기 전까지 제한하지 않음)
+LLM_RATE_LIMIT_RPM = float(os.getenv('LLM_RATE_LIMIT_RPM', '0'))
+LLM_RATE_LIMIT_TPM = float(os.getenv('LLM_RATE_LIMIT_TPM', '0'))
+# 모델별 한도 ({"gpt-4o": {"rpm": 500, "tpm": 30000}, ...} 형식의 JSON)
+LLM_RATE_LIMITS = json.loads(os.getenv('LLM_RATE_LIMITS', '{}'))
+# 요청 토큰 추정 시 더하는 응답 토큰 수
+LLM_SCHEDULER_COMPLETION_TOKENS = int(os.getenv('LLM_SCHEDULER_COMPLETION_TOKENS', '500'))
+
+# 우선순위 (값이 작을수록 먼저 실행)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BULK: "bulk"}
+
+# 현재 요청의 우선순위 (LangGraph 노드 태스크까지 전파됩니다)
+_current_priority: contextvars.ContextVar[int] = contextvars.ContextVar('llm_priority', default=PRIORITY_INTERACTIVE)
+
+
+def current_priority() -> int:
+    return _current_priority.get()
+
+
+@contextmanager
+def priority_scope(priority: int):
+    """
+    이 범위에서 발생하는 LLM/임베딩 호출의 우선순위를 설정하는 컨텍스트 관리자입니다.
+    대량 작업(작업 큐, 대량 프로파일링 CLI)은 PRIORITY_BULK로 실행하여 /profilling 요청보다 뒤에 처리됩니다.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """
+    'x-ratelimit-reset-*' 헤더의 기간 값('1s', '6m0s', '20ms' 등)을 초로 변환합니다.
+    """
+    if not value:
+        return None
+    parts = _DURATION_PATTERN.findall(value)
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class TokenBucket:
+    """
+    분당 한도를 일정한 속도로 다시 채우는 토큰 버킷입니다. 한도가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.per_minute = per_minute
+        self.available = per_minute
+        self.updated = clock()
+
+    @property
+    def limited(self) -> bool:
+        return self.per_minute > 0
+
+    def _refill(self):
+        now = self.clock()
+        if self.limited:
+            self.available = min(self.per_minute, self.available + (now - self.updated) * self.per_minute / 60)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """
+        amount만큼 사용할 수 있을 때까지 기다려야 하는 시간(초)을 반환합니다.
+        """
+        if not self.limited:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.per_minute)
+        return max(0.0, (amount - self.available) * 60 / self.per_minute)
+
+    def consume(self, amount: float):
+        if self.limited:
+            self._refill()
+            self.available -= min(amount, self.per_minute)
+
+    def set_limit(self, per_minute: float):
+        self._refill()
+        if not self.limited:
+            self.available = per_minute
+        self.per_minute = per_minute
+        self.available = min(self.available, per_minute)
+
+    def set_available(self, available: float):
+        """
+        제공자가 알려준 남은 한도로 버킷을 맞춥니다. (더 적은 쪽을 따릅니다)
+        """
+        if self.limited:
+            self._refill()
+            self.available = min(self.available, available)
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    key: str = field(compare=False)
+    tokens: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class RateLimitScheduler:
+    """
+    모델별 분당 요청 수(RPM)/토큰 수(TPM) 토큰 버킷으로 LLM과 임베딩 호출을 순서대로 내보내는 스케줄러입니다.
+
+    - 한도를 넘는 호출은 429로 실패한 뒤 재시도하는 대신 대기열에서 기다립니다.
+    - 대기열은 우선순위(interactive → bulk), 도착 순서대로 처리하며, 같은 모델 안에서는 뒤의 호출이 앞지르지 않습니다.
+    - 제공자 응답 헤더(x-ratelimit-*, retry-after)로 한도, 남은 양, 재시도 시각을 반영합니다.
+    """
+
+    def __init__(self, default_rpm: float = LLM_RATE_LIMIT_RPM, default_tpm: float = LLM_RATE_LIMIT_TPM,
+                 model_limits: Optional[Mapping[str, Mapping[str, float]]] = None, enabled: bool = LLM_SCHEDULER_ENABLED,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        RateLimitScheduler 객체를 초기화합니다.
+
+        Args:
+            default_rpm (float): 모델별 설정이 없을 때의 분당 요청 수 한도 (0이면 제한 없음).
+            default_tpm (float): 모델별 설정이 없을 때의 분당 토큰 수 한도 (0이면 제한 없음).
+            model_limits (Mapping[str, Mapping[str, float]], optional): {모델: {"rpm", "tpm"}}.
+            enabled (bool): 스케줄러 사용 여부.
+            clock (Callable[[], float]): 시계 함수 (테스트용).
+        """
+        self.default_rpm = default_rpm
+        self.default_tpm = default_tpm
+        self.model_limits = dict(LLM_RATE_LIMITS if model_limits is None else model_limits)
+        self.enabled = enabled
+        self.clock = clock
+        self._requests: Dict[str, TokenBucket] = {}
+        self._tokens: Dict[str, TokenBucket] = {}
+        self._backoff_until: Dict[str, float] = defaultdict(float)
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.granted = defaultdict(int)
+        self.total_wait = defaultdict(float)
+        self.max_wait = defaultdict(float)
+        self.backoffs = 0
+
+    def _buckets(self, key: str):
+        if key not in self._requests:
+            limits = self.model_limits.get(key, {})
+            self._requests[key] = TokenBucket(float(limits.get('rpm', self.default_rpm)), self.clock)
+            self._tokens[key] = TokenBucket(float(limits.get('tpm', self.default_tpm)), self.clock)
+        return self._requests[key], self._tokens[key]
+
+    def _delay(self, key: str, tokens: float) -> float:
+        requests_bucket, tokens_bucket = self._buckets(key)
+        return max(requests_bucket.wait_time(1), tokens_bucket.wait_time(tokens), self._backoff_until[key] - self.clock())
+
+    def _ensure_dispatcher(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이벤트 루프가 바뀌면(테스트, 일회성 스크립트) 이전 루프의 대기열은 버립니다.
+            self._loop = loop
+            self._waiters = []
+            self._wakeup = asyncio.Event()
+            self._dispatcher = None
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    async def _dispatch(self):
+        while True:
+            next_delay = math.inf
+            blocked = set()
+            for waiter in sorted(self._waiters):
+                if waiter.future.done() or waiter.key in blocked:
+                    continue
+                delay = self._delay(waiter.key, waiter.tokens)
+                if delay > 0:
+                    blocked.add(waiter.key)
+                    next_delay = min(next_delay, delay)
+                    continue
+                requests_bucket, tokens_bucket = self._buckets(waiter.key)
+                requests_bucket.consume(1)
+                tokens_bucket.consume(waiter.tokens)
+                waiter.future.set_result(None)
+            self._waiters = [w for w in self._waiters if not w.future.done()]
+
+            self._wakeup.clear()
+            if not self._waiters:
+                await self._wakeup.wait()
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=next_delay)
+            except asyncio.TimeoutError:
+                pass
+
+    @asynccontextmanager
+    async def slot(self, key: str, tokens: float = 0, priority: Optional[int] = None):
+        """
+        한도 안에서 호출을 보낼 수 있을 때까지 기다리는 비동기 컨텍스트 관리자입니다.
+
+        Args:
+            key (str): 한도를 적용할 모델 이름.
+            tokens (float): 호출이 사용할 것으로 추정되는 토큰 수 (요청 + 응답).
+            priority (int, optional): 우선순위. 기본값은 현재 priority_scope의 우선순위.
+        """
+        if not self.enabled:
+            yield
+            return
+        priority = current_priority() if priority is None else priority
+        self._ensure_dispatcher()
+        start_time = self.clock()
+        waiter = _Waiter(priority, next(self._seq), key, tokens, self._loop.create_future())
+        self._waiters.append(waiter)
+        self._wakeup.set()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            waiter.future.cancel()
+            raise
+        waited = self.clock() - start_time
+        name = PRIORITY_NAMES.get(priority, str(priority))
+        self.granted[name] += 1
+        self.total_wait[name] += waited
+        self.max_wait[name] = max(self.max_wait[name], waited)
+        yield
+
+    def observe_response(self, key: str, status_code: int, headers: Mapping[str, str]):
+        """
+        제공자 응답 헤더로 한도, 남은 양, 재시도 시각을 갱신합니다.
+
+        Args:
+            key (str): 요청한 모델 이름.
+            status_code (int): HTTP 상태 코드.
+            headers (Mapping[str, str]): 응답 헤더.
+        """
+        requests_bucket, tokens_bucket = self._buckets(key)
+        for bucket, kind in ((requests_bucket, 'requests'), (tokens_bucket, 'tokens')):
+            limit = headers.get(f'x-ratelimit-limit-{kind}')
+            remaining = headers.get(f'x-ratelimit-remaining-{kind}')
+            try:
+                if limit is not None and (not bucket.limited or float(limit) < bucket.per_minute):
+                    bucket.set_limit(float(limit))
+                if remaining is not None:
+                    bucket.set_available(float(remaining))
+                    if float(remaining) <= 0:
+                        self._backoff(key, parse_reset_duration(headers.get(f'x-ratelimit-reset-{kind}')))
+            except ValueError:
+                continue
+
+        if status_code == 429:
+            retry_after = None
+            if headers.get('retry-after-ms'):
+                retry_after = float(headers['retry-after-ms']) / 1000
+            elif headers.get('retry-after'):
+                retry_after = parse_reset_duration(headers['retry-after'])
+            self._backoff(key, retry_after or 1.0)
+
+    def _backoff(self, key: str, seconds: Optional[float]):
+        if not seconds:
+            return
+        until = self.clock() + seconds
+        if until > self._backoff_until[key]:
+            self._backoff_until[key] = until
+            self.backoffs += 1
+            logger.warning(f"[Scheduler] '{key}' 한도 도달, {seconds:.2f}초 동안 호출을 보류합니다.")
+
+    def stats(self) -> dict:
+        """
+        우선순위별 처리 수/대기 시간, 대기열 길이, 모델별 한도를 반환합니다.
+        """
+        return {"enabled": self.enabled,
+                "queue_depth": len([w for w in self._waiters if not w.future.done()]),
+                "backoffs": self.backoffs,
+                "priorities": {name: {"granted": count,
+                                      "mean_wait_ms": round(self.total_wait[name] / count * 1000, 2),
+                                      "max_wait_ms": round(self.max_wait[name] * 1000, 2)}
+                               for name, count in self.granted.items()},
+                "limits": {key: {"rpm": self._requests[key].per_minute, "tpm": self._tokens[key].per_minute}
+                           for key in self._requests}}
+
+
+def estimate_request_tokens(value: Any, model: str, completion_tokens: int = LLM_SCHEDULER_COMPLETION_TOKENS) -> int:
+    """
+    LLM 호출 입력(PromptValue, 문자열, 메시지 리스트 등)으로 요청 토큰 수를 추정하고 응답 토큰 수를 더합니다.
+    """
+    text = value.to_string() if hasattr(value, 'to_string') else str(value)
+    return count_tokens(text, model) + completion_tokens
+
+
+# 프로세스 단위로 공유되는 LLM/임베딩 호출 스케줄러
+llm_scheduler = RateLimitScheduler()
+
+
+def _request_model(request: httpx.Request) -> Optional[str]:
+    try:
+        return json.loads(request.content or b'{}').get('model')
+    except (ValueError, AttributeError, httpx.RequestNotRead):
+        return None
+
+
+def _observe_openai_response(response: httpx.Response):
+    """
+    공유 HTTP 클라이언트의 모든 OpenAI 응답에서 속도 제한 헤더를 읽어 스케줄러에 반영합니다.
+    """
+    model = _request_model(response.request)
+    if model:
+        llm_scheduler.observe_response(model, response.status_code, response.headers)
+
+
+openai_provider.add_response_hook(_observe_openai_response)
@@ -1,6 +1,6 @@
 import logging
 from langchain_core.messages import AIMessageChunk
-from typing import Any, Dict, List, Callable
+from typing import Any, AsyncIterator, Dict, List, Callable
 from dataclasses import dataclass
 from langchain_core.agents import AgentAction, AgentFinish, AgentStep
 from langchain.agents.output_parsers.tools import ToolAgentAction
@@ -549,4 +549,37 @@ def invoke_graph(
                         elif isinstance(v, dict):
                             for node_chunk_key, node_chunk_value in node_chunk.items():
                                 logger.info(f"{node_chunk_key}:\n{node_chunk_value}")
-                logger.info("=" * 50)
\ No newline at end of file
+                logger.info("=" * 50)
+
+
+async def astream_graph_updates(
+    graph: CompiledStateGraph,
+    inputs: dict,
+    config: RunnableConfig,
+    node_names: List[str] = [],
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    LangGraph 앱을 비동기로 실행하면서 노드가 완료될 때마다 해당 노드의 상태 업데이트를 반환하는 제너레이터입니다.
+    invoke_graph와 같은 방식으로 "updates" 스트림을 순회하지만, 출력 대신 호출자에게 청크를 전달합니다.
+
+    Args:
+        graph (CompiledStateGraph): 실행할 컴파일된 LangGraph 객체.
+        inputs (dict): 그래프에 전달할 입력값 딕셔너리.
+        config (RunnableConfig): 실행 설정.
+        node_names (List[str], optional): 반환할 노드 이름 목록. 기본값은 빈 리스트(모든 노드).
+
+    Yields:
+        Dict[str, Any]: {"node": str, "namespace": str, "content": dict} 형태의 노드 업데이트.
+    """
+
+    def format_namespace(namespace):
+        return namespace[-1].split(":")[0] if len(namespace) > 0 else "root graph"
+
+    async for namespace, chunk in graph.astream(
+        inputs, config, stream_mode="updates", subgraphs=True
+    ):
+        for node_name, node_chunk in chunk.items():
+            # node_names가 비어있지 않은 경우에만 필터링
+            if len(node_names) > 0 and node_name not in node_names:
+                continue
+            yield {"node": node_name, "namespace": format_namespace(namespace), "content": node_chunk}
@@ -0,0 +1,157 @@
+import os
+import logging
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+
+from .fake_llm import FakeAsyncOpenAI, fake_chat_model, fake_embeddings
+from .llm_cassette import llm_cassette, CassetteEmbeddings
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# OpenAI 연결 풀 설정
+# 동시에 열 수 있는 최대 연결 수와, 요청 사이에 유지할 keep-alive 연결 수/유지 시간(초)
+OPENAI_HTTP_MAX_CONNECTIONS = int(os.getenv('OPENAI_HTTP_MAX_CONNECTIONS', '100'))
+OPENAI_HTTP_MAX_KEEPALIVE = int(os.getenv('OPENAI_HTTP_MAX_KEEPALIVE', '20'))
+OPENAI_HTTP_KEEPALIVE_EXPIRY = float(os.getenv('OPENAI_HTTP_KEEPALIVE_EXPIRY', '60'))
+# 연결 수립/풀 대기 타임아웃과 응답 읽기 타임아웃(초)
+OPENAI_HTTP_CONNECT_TIMEOUT = float(os.getenv('OPENAI_HTTP_CONNECT_TIMEOUT', '5'))
+OPENAI_HTTP_POOL_TIMEOUT = float(os.getenv('OPENAI_HTTP_POOL_TIMEOUT', '10'))
+OPENAI_HTTP_READ_TIMEOUT = float(os.getenv('OPENAI_HTTP_READ_TIMEOUT', '60'))
+# LLM/임베딩 백엔드 ('openai' 또는 네트워크 없이 결정적인 응답을 반환하는 'fake')
+# 로컬 대역 서버를 사용할 때는 'openai'로 두고 OPENAI_BASE_URL을 대역 서버 주소로 설정합니다.
+LLM_BACKEND = os.getenv('LLM_BACKEND', 'openai').lower()
+LLM_BACKENDS = ('openai', 'fake')
+# 임베딩 모델 (company_news 벡터 생성 시 사용한 모델과 같아야 합니다)
+OPENAI_EMBEDDING_MODEL = os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-ada-002')
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(max_connections=OPENAI_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=OPENAI_HTTP_MAX_KEEPALIVE,
+                        keepalive_expiry=OPENAI_HTTP_KEEPALIVE_EXPIRY)
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(OPENAI_HTTP_READ_TIMEOUT, connect=OPENAI_HTTP_CONNECT_TIMEOUT, pool=OPENAI_HTTP_POOL_TIMEOUT)
+
+
+class OpenAIProvider:
+    """
+    모든 OpenAI 호출(채팅, 임베딩)이 공유하는 HTTP 연결 풀과 클라이언트를 소유하는 클래스입니다.
+    호출마다 클라이언트를 만들면 TLS 핸드셰이크와 연결 수립이 반복되므로, keep-alive 연결을 재사용하도록 한 번만 생성합니다.
+    클라이언트는 모듈 임포트 시점이 아니라 첫 호출 시 생성되며, aclose() 이후 다시 사용하면 새 연결 풀을 만듭니다.
+    (generation이 바뀌면 모델 라우터도 이전 연결 풀에 묶인 모델 객체를 버립니다.)
+    backend가 'fake'이면 채팅/임베딩 모델과 AsyncOpenAI 클라이언트 대신 util/fake_llm.py의 가짜 구현을 반환합니다.
+    """
+
+    def __init__(self, backend: str = LLM_BACKEND):
+        if backend not in LLM_BACKENDS:
+            raise ValueError(f"지원하지 않는 LLM 백엔드입니다: {backend} (지원: {', '.join(LLM_BACKENDS)})")
+        self.backend = backend
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._embeddings: Dict[str, OpenAIEmbeddings] = {}
+        self._response_hooks: List[Callable[[httpx.Response], None]] = []
+        # aclose()로 연결 풀을 닫을 때마다 증가하는 세대 번호
+        self.generation = 0
+
+    def add_response_hook(self, hook: Callable[[httpx.Response], None]):
+        """
+        모든 OpenAI 응답마다 호출할 동기 함수를 등록합니다. (속도 제한 헤더 수집 등)
+        이미 생성된 클라이언트에도 적용됩니다.
+        """
+        self._response_hooks.append(hook)
+        if self._http_client is not None:
+            self._http_client.event_hooks['response'].append(hook)
+        if self._http_async_client is not None:
+            self._http_async_client.event_hooks['response'].append(self._async_hook(hook))
+
+    @staticmethod
+    def _async_hook(hook: Callable[[httpx.Response], None]):
+        async def _hook(response: httpx.Response):
+            hook(response)
+        return _hook
+
+    def http_client(self) -> httpx.Client:
+        """
+        공유 동기 HTTP 클라이언트를 반환합니다.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(limits=_limits(), timeout=_timeout(),
+                                             event_hooks={'response': list(self._response_hooks)})
+        return self._http_client
+
+    def http_async_client(self) -> httpx.AsyncClient:
+        """
+        공유 비동기 HTTP 클라이언트를 반환합니다.
+        """
+        if self._http_async_client is None:
+            self._http_async_client = httpx.AsyncClient(
+                limits=_limits(), timeout=_timeout(),
+                event_hooks={'response': [self._async_hook(hook) for hook in self._response_hooks]})
+            logger.info(f"OpenAI HTTP 연결 풀 생성 (최대 연결 {OPENAI_HTTP_MAX_CONNECTIONS}, keep-alive {OPENAI_HTTP_MAX_KEEPALIVE})")
+        return self._http_async_client
+
+    def async_client(self) -> AsyncOpenAI:
+        """
+        공유 연결 풀을 사용하는 AsyncOpenAI 클라이언트를 반환합니다.
+        """
+        if self._async_client is None and self.backend == 'fake':
+            self._async_client = FakeAsyncOpenAI(self.embeddings())
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'), http_client=self.http_async_client())
+        return self._async_client
+
+    def chat_model(self, **kwargs) -> ChatOpenAI:
+        """
+        공유 연결 풀을 사용하는 ChatOpenAI 객체를 생성합니다.
+
+        Args:
+            **kwargs: ChatOpenAI 생성 인자 (model, temperature 등).
+        """
+        if self.backend == 'fake':
+            return fake_chat_model(kwargs.get('model', 'fake'), callbacks=kwargs.get('callbacks'))
+        return ChatOpenAI(http_client=self.http_client(), http_async_client=self.http_async_client(), **kwargs)
+
+    def embeddings(self, model: str = OPENAI_EMBEDDING_MODEL) -> OpenAIEmbeddings:
+        """
+        공유 연결 풀을 사용하는 모델별 OpenAIEmbeddings 객체를 반환합니다.
+        카세트 모드(LLM_CASSETTE_MODE)가 켜져 있으면 질의 임베딩을 기록/재생하는 래퍼로 감쌉니다.
+        """
+        if model not in self._embeddings:
+            if self.backend == 'fake':
+                embeddings = fake_embeddings()
+            else:
+                embeddings = OpenAIEmbeddings(model=model, http_client=self.http_client(),
+                                              http_async_client=self.http_async_client())
+            if llm_cassette.enabled:
+                embeddings = CassetteEmbeddings(embeddings, model, llm_cassette)
+            self._embeddings[model] = embeddings
+        return self._embeddings[model]
+
+    async def aclose(self):
+        """
+        HTTP 연결 풀을 닫습니다. FastAPI lifespan 종료 또는 일회성 스크립트 종료 시 호출합니다.
+        """
+        if self._http_async_client is not None:
+            await self._http_async_client.aclose()
+        if self._http_client is not None:
+            self._http_client.close()
+        self._http_client = None
+        self._http_async_client = None
+        self._async_client = None
+        self._embeddings.clear()
+        self.generation += 1
+
+
+# 프로세스 단위로 공유되는 OpenAI 클라이언트 제공자
+openai_provider = OpenAIProvider()
@@ -0,0 +1,239 @@
+import os
+import math
+import logging
+import functools
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from langchain_core.documents import Document
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 프롬프트 컨텍스트 압축 사용 여부
+PROMPT_BUDGET_ENABLED = os.getenv('PROMPT_BUDGET_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# 노드별 컨텍스트(프롬프트 입력 변수) 토큰 예산. PROMPT_TOKEN_BUDGET_<노드 이름 대문자>로 변경할 수 있습니다.
+DEFAULT_NODE_TOKEN_BUDGETS = {
+    'company_size': 6000,
+    'experience': 4000,
+}
+PROMPT_TOKEN_BUDGET = int(os.getenv('PROMPT_TOKEN_BUDGET', '6000'))
+# 뉴스 기사 한 건, 경력 설명 한 건의 최대 토큰 수
+NEWS_MAX_TOKENS_PER_DOC = int(os.getenv('PROMPT_NEWS_MAX_TOKENS_PER_DOC', '400'))
+DESCRIPTION_MAX_TOKENS = int(os.getenv('PROMPT_DESCRIPTION_MAX_TOKENS', '600'))
+# 회사별로 전달할 최대 제품 수
+PRODUCTS_MAX_PER_COMPANY = int(os.getenv('PROMPT_PRODUCTS_MAX_PER_COMPANY', '10'))
+# 이보다 짧게 잘라야 하는 항목은 의미가 없으므로 제외합니다.
+MIN_ITEM_TOKENS = 30
+# 인코딩을 불러올 수 없을 때 사용하는 추정치 (영문 약 4자당 1토큰, 한글 등은 1자당 1토큰)
+ASCII_CHARS_PER_TOKEN = 4
+
+
+def node_token_budget(node: str) -> int:
+    """
+    노드별 컨텍스트 토큰 예산을 반환합니다.
+    """
+    value = os.getenv(f'PROMPT_TOKEN_BUDGET_{node.upper()}')
+    if value:
+        return int(value)
+    return DEFAULT_NODE_TOKEN_BUDGETS.get(node, PROMPT_TOKEN_BUDGET)
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding(model: str):
+    """
+    모델의 tiktoken 인코딩을 반환합니다. 인코딩 파일을 받을 수 없는 환경(오프라인 등)에서는 None.
+    """
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"[PromptBudget] '{model}' 토큰 인코딩을 불러올 수 없어 추정치를 사용합니다: {type(e).__name__}")
+        return None
+
+
+def _estimate_tokens(text: str) -> int:
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / ASCII_CHARS_PER_TOKEN) + (len(text) - ascii_chars)
+
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    대상 모델 기준 텍스트의 토큰 수를 반환합니다.
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return _estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str) -> str:
+    """
+    텍스트를 대상 모델 기준 max_tokens 토큰 이하로 자릅니다.
+    """
+    if max_tokens <= 0:
+        return ""
+    encoding = _encoding(model)
+    if encoding is None:
+        tokens = _estimate_tokens(text)
+        if tokens <= max_tokens:
+            return text
+        return text[:max(1, len(text) * max_tokens // tokens)]
+    encoded = encoding.encode(text, disallowed_special=())
+    if len(encoded) <= max_tokens:
+        return text
+    return encoding.decode(encoded[:max_tokens])
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def _shrink_to_budget(texts: List[str], budget: int, model: str) -> List[Optional[str]]:
+    """
+    우선순위 순서의 텍스트들을 합계가 budget 이하가 되도록 우선순위가 낮은 항목부터 자르거나 제외합니다.
+    제외된 항목은 None으로 반환합니다.
+    """
+    counts = [count_tokens(text, model) for text in texts]
+    total = sum(counts)
+    result: List[Optional[str]] = list(texts)
+    for i in reversed(range(len(texts))):
+        if total <= budget:
+            break
+        keep = counts[i] - (total - budget)
+        if keep < MIN_ITEM_TOKENS:
+            result[i] = None
+            total -= counts[i]
+        else:
+            result[i] = truncate_tokens(texts[i], keep, model)
+            total -= counts[i] - keep
+    return result
+
+
+def compact_company_news(company_news_contents: Dict[str, List[Any]], budget: int, model: str) -> Dict[str, List[Any]]:
+    """
+    회사별 뉴스 검색 결과를 토큰 예산에 맞게 압축합니다.
+
+    - 같은 회사의 여러 근무기간 검색에서 중복으로 나온 기사를 제거합니다.
+    - 기사 한 건은 NEWS_MAX_TOKENS_PER_DOC 토큰 이하로 자릅니다.
+    - 예산을 넘으면 모든 회사의 1순위 기사를 먼저 남기고, 검색 순위가 낮은 기사부터 자르거나 제외합니다.
+
+    Args:
+        company_news_contents (Dict[str, List[Any]]): {회사 이름: 검색 순위 순서의 뉴스 문서 리스트}.
+        budget (int): 뉴스 기사 본문에 사용할 토큰 예산.
+        model (str): 토큰 수를 셀 대상 모델.
+
+    Returns:
+        Dict[str, List[Any]]: 압축된 {회사 이름: 뉴스 문서 리스트}.
+    """
+    ranked: List[Tuple[int, int, str, Any]] = []
+    for company_order, (company_name, docs) in enumerate(company_news_contents.items()):
+        seen = set()
+        rank = 0
+        for doc in docs:
+            content = doc.page_content if isinstance(doc, Document) else str(doc)
+            key = _normalize_text(content)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            ranked.append((rank, company_order, company_name, doc))
+            rank += 1
+    # 회사별 1순위 기사 → 2순위 기사 … 순서로 우선순위를 정합니다.
+    ranked.sort(key=lambda item: (item[0], item[1]))
+
+    contents = [truncate_tokens(doc.page_content if isinstance(doc, Document) else str(doc), NEWS_MAX_TOKENS_PER_DOC, model)
+                for _, _, _, doc in ranked]
+    shrunk = _shrink_to_budget(contents, budget, model)
+
+    compacted: Dict[str, List[Any]] = {name: [] for name in company_news_contents}
+    for (_, _, company_name, doc), content in sorted(zip(ranked, shrunk), key=lambda item: (item[0][1], item[0][0])):
+        if content is None:
+            continue
+        if isinstance(doc, Document):
+            compacted[company_name].append(Document(page_content=content, metadata=doc.metadata))
+        else:
+            compacted[company_name].append(content)
+    return compacted
+
+
+def compact_company_size_inputs(inputs: Dict[str, Any], model: str, budget: Optional[int] = None) -> Dict[str, Any]:
+    """
+    company_size 프롬프트 입력을 토큰 예산에 맞게 압축합니다.
+    근무 정보와 DB 회사 정보는 판단의 기준이므로 그대로 두고, 남은 예산 안에서 뉴스 기사를 압축합니다.
+
+    Args:
+        inputs (Dict[str, Any]): 'companynames_and_dates', 'grouped_company_data', 'company_news_contents'를 포함하는 입력 변수.
+        model (str): 토큰 수를 셀 대상 모델.
+        budget (int, optional): 토큰 예산. 기본값은 company_size 노드 예산.
+
+    Returns:
+        Dict[str, Any]: 압축된 입력 변수.
+    """
+    if not PROMPT_BUDGET_ENABLED:
+        return inputs
+    budget = node_token_budget('company_size') if budget is None else budget
+    fixed_tokens = count_tokens(str(inputs['companynames_and_dates']), model) + count_tokens(str(inputs['grouped_company_data']), model)
+    before = fixed_tokens + count_tokens(str(inputs['company_news_contents']), model)
+    if before <= budget:
+        return inputs
+
+    # 문서 표현(메타데이터 등)에 드는 토큰을 감안하여 본문 예산을 정합니다.
+    news = inputs['company_news_contents']
+    overhead = count_tokens(str(news), model) - sum(
+        count_tokens(doc.page_content if isinstance(doc, Document) else str(doc), model) for docs in news.values() for doc in docs)
+    news = compact_company_news(news, max(0, budget - fixed_tokens - max(0, overhead)), model)
+    compacted = {**inputs, 'company_news_contents': news}
+    logger.info(f"[PromptBudget] 'company_size' 컨텍스트 {before} → "
+                f"{fixed_tokens + count_tokens(str(news), model)} 토큰 (예산 {budget})")
+    return compacted
+
+
+def compact_experience_inputs(inputs: Dict[str, Any], model: str, budget: Optional[int] = None) -> Dict[str, Any]:
+    """
+    experience 프롬프트 입력을 토큰 예산에 맞게 압축합니다.
+
+    - 중복된 경력 설명과 제품 이름을 제거하고, 회사별 제품은 PRODUCTS_MAX_PER_COMPANY개까지만 전달합니다.
+    - 경력 설명 한 건은 DESCRIPTION_MAX_TOKENS 토큰 이하로 자릅니다.
+    - 예산을 넘으면 뒤쪽(오래된) 경력 설명부터 자르거나 제외합니다.
+
+    Args:
+        inputs (Dict[str, Any]): 'descriptions', 'grouped_company_data'를 포함하는 입력 변수.
+        model (str): 토큰 수를 셀 대상 모델.
+        budget (int, optional): 토큰 예산. 기본값은 experience 노드 예산.
+
+    Returns:
+        Dict[str, Any]: 압축된 입력 변수.
+    """
+    if not PROMPT_BUDGET_ENABLED:
+        return inputs
+    budget = node_token_budget('experience') if budget is None else budget
+    before = count_tokens(str(inputs['descriptions']), model) + count_tokens(str(inputs['grouped_company_data']), model)
+    if before <= budget:
+        return inputs
+
+    products = []
+    for company in inputs['grouped_company_data']:
+        names = list(dict.fromkeys(company.get('products') or []))[:PRODUCTS_MAX_PER_COMPANY]
+        products.append({**company, 'products': names if company.get('products') is not None else None})
+    products_tokens = count_tokens(str(products), model)
+
+    descriptions, seen = [], set()
+    for description in inputs['descriptions'] or []:
+        if not isinstance(description, str):
+            continue
+        key = _normalize_text(description)
+        if key and key not in seen:
+            seen.add(key)
+            descriptions.append(truncate_tokens(description, DESCRIPTION_MAX_TOKENS, model))
+    descriptions = [d for d in _shrink_to_budget(descriptions, max(0, budget - products_tokens), model) if d is not None]
+
+    compacted = {**inputs, 'descriptions': descriptions, 'grouped_company_data': products}
+    logger.info(f"[PromptBudget] 'experience' 컨텍스트 {before} → "
+                f"{count_tokens(str(descriptions), model) + products_tokens} 토큰 (예산 {budget})")
+    return compacted
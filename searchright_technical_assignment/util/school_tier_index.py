@@ -0,0 +1,222 @@
+import os
+import re
+import json
+import difflib
+import hashlib
+import logging
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+from dotenv import load_dotenv
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 오프라인 라벨링 작업이 추가한 학교 목록(JSON) 경로
+SCHOOL_TIER_INDEX_PATH = os.getenv('SCHOOL_TIER_INDEX_PATH')
+# 오타 등을 허용하는 유사도 기준 (difflib ratio)
+FUZZY_CUTOFF = float(os.getenv('SCHOOL_TIER_FUZZY_CUTOFF', '0.88'))
+# 짧은 이름은 다른 학교와 잘못 매칭되기 쉬우므로 유사도 매칭을 하지 않습니다.
+FUZZY_MIN_LENGTH = 5
+
+# college_prompt가 정의하는 대학 수준
+TIER_TOP = "상위권대학교"
+TIER_MID = "중위권대학교"
+TIER_LOW = "하위권대학교"
+TIERS = (TIER_TOP, TIER_MID, TIER_LOW)
+# 학력 정보가 없는 경우 (build_profile에서 제외됨)
+NO_EDUCATION = "최종학력없음"
+NO_EDUCATION_NAMES = ("최종 학력 정보 없음", "최종학력없음")
+
+# college_prompt의 판단 기준을 옮긴 기본 색인 (한글/영문 표기, 약칭 포함)
+SEED_SCHOOLS: Dict[str, List[str]] = {
+    TIER_TOP: [
+        "서울대학교", "Seoul National University", "SNU",
+        "연세대학교", "Yonsei University",
+        "고려대학교", "Korea University",
+        "한국과학기술원", "KAIST", "카이스트", "Korea Advanced Institute of Science and Technology",
+        "포항공과대학교", "포항공대", "POSTECH", "포스텍", "Pohang University of Science and Technology",
+        "울산과학기술원", "UNIST", "유니스트", "Ulsan National Institute of Science and Technology",
+        "Harvard University", "Harvard",
+        "Massachusetts Institute of Technology", "MIT",
+        "Stanford University", "Stanford",
+        "Princeton University", "Yale University", "Columbia University",
+        "University of California, Berkeley", "UC Berkeley",
+        "University of Chicago", "UChicago",
+        "California Institute of Technology", "Caltech",
+    ],
+    TIER_MID: [
+        "경희대학교", "Kyung Hee University",
+        "성균관대학교", "Sungkyunkwan University", "SKKU",
+        "한양대학교", "Hanyang University",
+        "이화여자대학교", "이화여대", "Ewha Womans University",
+        "중앙대학교", "Chung-Ang University",
+        "University of Wisconsin-Madison", "University of Wisconsin",
+        "Pennsylvania State University", "Penn State",
+        "Ohio State University", "The Ohio State University",
+        "University of Florida", "University of Arizona",
+    ],
+    TIER_LOW: [
+        "한국방송통신대학교", "방송통신대",
+    ],
+}
+
+# 이름만으로 하위권으로 분류되는 학교 유형 (정규화 전 소문자 이름에 대해 검사)
+LOW_TIER_PATTERNS = [re.compile(p) for p in (r"사이버\s*대학", r"전문\s*대학", r"community\s+college", r"online\s+university")]
+
+# 정규화 시 제거하는 영문 단어와 한글 접미사
+_ENGLISH_STOPWORDS = {"the", "university", "univ", "of", "at", "in"}
+_KOREAN_SUFFIXES = ("대학원", "대학교", "대학", "대")
+
+
+def normalize_school_name(name: str) -> str:
+    """
+    학교 이름을 비교용 키로 정규화합니다.
+    대소문자, 공백, 문장부호, '대학교/대학/대' 접미사, 'University of' 같은 영문 단어 차이를 제거합니다.
+
+    Args:
+        name (str): 학교 이름.
+
+    Returns:
+        str: 정규화된 키. (예: '서울대학교' → '서울', 'University of Chicago' → 'chicago')
+    """
+    tokens = re.findall(r"[a-z0-9]+|[가-힣]+", unicodedata.normalize("NFKC", name).lower())
+    normalized = []
+    for token in tokens:
+        if token in _ENGLISH_STOPWORDS or token in _KOREAN_SUFFIXES:
+            continue
+        for suffix in _KOREAN_SUFFIXES:
+            if token.endswith(suffix) and len(token) > len(suffix):
+                token = token[:-len(suffix)]
+                break
+        normalized.append(token)
+    return "".join(normalized)
+
+
+def _name_variants(name: str) -> List[str]:
+    """
+    한 학력 항목의 학교 이름에서 조회에 사용할 후보 이름들을 만듭니다.
+    예: '서울대학교 (Seoul National University)' → 전체, '서울대학교', 'Seoul National University'
+        'Emory University - Goizueta Business School' → 전체, 'Emory University'
+    """
+    variants = [name]
+    outside = re.sub(r"\(.*?\)", " ", name).strip()
+    variants.append(outside)
+    variants.extend(re.findall(r"\((.*?)\)", name))
+    variants.extend(part for part in re.split(r"\s+-\s+|,\s*|·", outside) if part.strip())
+    return [v for v in dict.fromkeys(v.strip() for v in variants) if v]
+
+
+class SchoolTierIndex:
+    """
+    학교 이름을 대학 수준(상위권/중위권/하위권)으로 찾아 주는 로컬 색인입니다.
+    college_level 노드가 LLM 호출 전에 먼저 조회하며, 색인에 없는 학교만 LLM으로 판단합니다.
+    """
+
+    def __init__(self, seed: Optional[Dict[str, List[str]]] = None, overlay_path: Optional[str] = None):
+        """
+        SchoolTierIndex 객체를 초기화합니다.
+
+        Args:
+            seed (Dict[str, List[str]], optional): {대학 수준: [학교 이름, ...]} 기본 색인.
+            overlay_path (str, optional): 오프라인 라벨링 결과 JSON 경로 ({학교 이름: 대학 수준}).
+        """
+        self._tiers: Dict[str, str] = {}
+        self._fingerprint: Optional[str] = None
+        self.overlay_path = overlay_path
+        self.hits = 0
+        self.misses = 0
+        for tier, names in (SEED_SCHOOLS if seed is None else seed).items():
+            self.add_many(names, tier)
+        if overlay_path and os.path.exists(overlay_path):
+            with open(overlay_path, encoding='utf-8') as f:
+                overlay = json.load(f)
+            for name, tier in overlay.items():
+                self.add(name, tier)
+            logger.info(f"학교 수준 색인 추가 항목 {len(overlay)}개 로드: {overlay_path}")
+
+    def add(self, name: str, tier: str):
+        if tier not in TIERS:
+            raise ValueError(f"알 수 없는 대학 수준입니다: {tier}")
+        key = normalize_school_name(name)
+        if key:
+            self._tiers[key] = tier
+            self._fingerprint = None
+
+    def add_many(self, names: Iterable[str], tier: str):
+        for name in names:
+            self.add(name, tier)
+
+    def _lookup_key(self, key: str) -> Optional[str]:
+        tier = self._tiers.get(key)
+        if tier is not None or len(key) < FUZZY_MIN_LENGTH:
+            return tier
+        matches = difflib.get_close_matches(key, self._tiers.keys(), n=1, cutoff=FUZZY_CUTOFF)
+        return self._tiers[matches[0]] if matches else None
+
+    def lookup(self, name: Optional[str]) -> Optional[str]:
+        """
+        학교 이름의 대학 수준을 반환합니다. 색인에 없으면 None.
+
+        Args:
+            name (str): 학교 이름 (get_final_school_name 결과).
+
+        Returns:
+            Optional[str]: '상위권대학교', '중위권대학교', '하위권대학교', '최종학력없음' 중 하나 또는 None.
+        """
+        if not name or name.strip() in NO_EDUCATION_NAMES:
+            return NO_EDUCATION
+        tier = None
+        for variant in _name_variants(name):
+            tier = self._lookup_key(normalize_school_name(variant))
+            if tier is not None:
+                break
+        if tier is None and any(pattern.search(name.lower()) for pattern in LOW_TIER_PATTERNS):
+            tier = TIER_LOW
+        if tier is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return tier
+
+    def save_overlay(self, labels: Dict[str, str], path: Optional[str] = None):
+        """
+        라벨링된 학교를 색인에 추가하고 추가 항목 JSON 파일에 병합하여 저장합니다.
+
+        Args:
+            labels (Dict[str, str]): {학교 이름: 대학 수준}.
+            path (str, optional): 저장할 경로. 기본값은 overlay_path.
+        """
+        path = path or self.overlay_path
+        if not path:
+            raise ValueError("추가 항목을 저장할 경로가 없습니다. SCHOOL_TIER_INDEX_PATH를 설정하세요.")
+        existing = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                existing = json.load(f)
+        for name, tier in labels.items():
+            self.add(name, tier)
+            existing[name] = tier
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(existing, f, ensure_ascii=False, indent=2, sort_keys=True)
+        logger.info(f"학교 수준 색인 추가 항목 {len(labels)}개 저장: {path}")
+
+    def fingerprint(self) -> str:
+        """
+        색인 내용(기본 색인 + 추가 항목)과 매칭 기준의 해시를 반환합니다. 라벨이 바뀌면 값이 달라집니다. (프로파일 캐시 키용)
+        """
+        if self._fingerprint is None:
+            content = json.dumps([sorted(self._tiers.items()), FUZZY_CUTOFF, [p.pattern for p in LOW_TIER_PATTERNS]],
+                                 ensure_ascii=False)
+            self._fingerprint = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        return self._fingerprint
+
+    def __len__(self) -> int:
+        return len(self._tiers)
+
+
+# 프로세스 단위로 공유되는 학교 수준 색인
+school_tier_index = SchoolTierIndex(overlay_path=SCHOOL_TIER_INDEX_PATH)
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    동시에 들어온 동일한 요청을 하나의 실행으로 합치는 클래스입니다.
+
+    같은 키로 실행 중인 계산이 있으면 새로 실행하지 않고 그 결과(또는 예외)를 함께 기다립니다.
+    BatchDeduplicator와 달리 실행이 끝나면 키를 제거하므로 프로세스 전체에서 공유해도 결과가 쌓이지 않습니다.
+    완료된 결과의 재사용은 결과 캐시가 담당하고, 이 클래스는 캐시 미스 구간의 중복 실행만 막습니다.
+    """
+
+    def __init__(self):
+        """
+        SingleFlight 객체를 초기화합니다.
+        """
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key에 해당하는 계산 결과를 반환합니다. 같은 키로 실행 중인 계산이 없을 때만 factory를 실행합니다.
+
+        Args:
+            key (Hashable): 요청을 식별하는 키.
+            factory (Callable[[], Awaitable[Any]]): 실제 계산을 수행하는 코루틴 팩토리.
+
+        Returns:
+            Any: 계산 결과.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.followers += 1
+            logger.info(f"[SingleFlight] 실행 중인 동일 요청에 합류: {key}")
+        # 먼저 온 호출자가 취소되어도 공유 실행은 다른 호출자를 위해 계속됩니다.
+        return await asyncio.shield(task)
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> dict:
+        return {"inflight": self.inflight, "leaders": self.leaders, "followers": self.followers}
@@ -0,0 +1,199 @@
+import time
+import logging
+import functools
+import contextvars
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 노드 자체의 실행 시간을 나타내는 의존성 이름
+NODE_WALL = "wall"
+# 노드 밖에서 측정된 의존성에 사용할 노드 이름
+NO_NODE = "-"
+# 집계 통계에서 분위수 계산에 보관할 최근 샘플 수
+STATS_WINDOW = 1000
+
+
+class TimingRecorder:
+    """
+    한 요청 동안의 노드별 실행 시간과 노드 내부 의존성(DB 조회, 벡터 검색, LLM 호출 등) 시간을 기록하는 클래스입니다.
+    """
+
+    def __init__(self):
+        """
+        TimingRecorder 객체를 초기화합니다.
+        """
+        # (노드, 의존성) -> [호출 수, 누적 시간(초)]
+        self._spans: Dict[Tuple[str, str], list] = defaultdict(lambda: [0, 0.0])
+
+    def record(self, node: str, name: str, elapsed: float):
+        span = self._spans[(node, name)]
+        span[0] += 1
+        span[1] += elapsed
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        노드별 실행 시간 요약을 반환합니다.
+        병렬로 실행된 의존성(예: 여러 건의 벡터 검색)은 누적 시간이 노드 실행 시간보다 클 수 있습니다.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {노드: {"wall_ms": 실행 시간, "dependencies": {의존성: {"count", "total_ms"}}}}
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        for (node, name), (count, total) in self._spans.items():
+            node_summary = result.setdefault(node, {"wall_ms": None, "dependencies": {}})
+            if name == NODE_WALL:
+                node_summary["wall_ms"] = round(total * 1000, 2)
+            else:
+                node_summary["dependencies"][name] = {"count": count, "total_ms": round(total * 1000, 2)}
+        return result
+
+
+class TimingStats:
+    """
+    프로세스 전체의 노드/의존성 실행 시간을 집계하는 클래스입니다.
+    """
+
+    def __init__(self, window: int = STATS_WINDOW):
+        self._window = window
+        self._count: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._total: Dict[Tuple[str, str], float] = defaultdict(float)
+        self._max: Dict[Tuple[str, str], float] = defaultdict(float)
+        self._samples: Dict[Tuple[str, str], Deque[float]] = defaultdict(lambda: deque(maxlen=self._window))
+
+    def record(self, node: str, name: str, elapsed: float):
+        key = (node, name)
+        self._count[key] += 1
+        self._total[key] += elapsed
+        self._max[key] = max(self._max[key], elapsed)
+        self._samples[key].append(elapsed)
+
+    def percentile(self, node: str, name: str, q: float) -> Optional[float]:
+        """
+        최근 샘플 기준 분위수(초)를 반환합니다. 샘플이 없으면 None.
+        """
+        samples = sorted(self._samples.get((node, name), ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        집계된 통계를 반환합니다.
+
+        Returns:
+            Dict: {노드: {의존성: {"count", "mean_ms", "p50_ms", "p95_ms", "max_ms"}}}
+        """
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (node, name), count in self._count.items():
+            result.setdefault(node, {})[name] = {
+                "count": count,
+                "mean_ms": round(self._total[(node, name)] / count * 1000, 2),
+                "p50_ms": round(self.percentile(node, name, 0.5) * 1000, 2),
+                "p95_ms": round(self.percentile(node, name, 0.95) * 1000, 2),
+                "max_ms": round(self._max[(node, name)] * 1000, 2),
+            }
+        return result
+
+    def reset(self):
+        self._count.clear()
+        self._total.clear()
+        self._max.clear()
+        self._samples.clear()
+
+
+# 프로세스 단위 집계 통계
+timing_stats = TimingStats()
+
+# 현재 요청의 기록기와 현재 실행 중인 노드 (LangGraph 노드 태스크까지 전파됩니다)
+_current_recorder: contextvars.ContextVar[TimingRecorder | None] = contextvars.ContextVar('timing_recorder', default=None)
+_current_node: contextvars.ContextVar[str] = contextvars.ContextVar('timing_node', default=NO_NODE)
+
+
+def current_node() -> str:
+    """
+    현재 실행 중인 노드 이름을 반환합니다. 노드 밖이면 '-'.
+    """
+    return _current_node.get()
+
+
+def current_recorder() -> Optional[TimingRecorder]:
+    """
+    현재 요청의 실행 시간 기록기를 반환합니다. 실행 시간을 요청하지 않았으면 None.
+    """
+    return _current_recorder.get()
+
+
+@contextmanager
+def timing_scope(recorder: Optional[TimingRecorder]):
+    """
+    요청 단위 기록기를 설정하는 컨텍스트 관리자입니다.
+
+    Args:
+        recorder (TimingRecorder, optional): 이 범위에서 시간을 기록할 기록기. None이면 집계 통계에만 기록합니다.
+    """
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+def _record(node: str, name: str, elapsed: float):
+    timing_stats.record(node, name, elapsed)
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        recorder.record(node, name, elapsed)
+
+
+def record_dependency(name: str, elapsed: float):
+    """
+    컨텍스트 관리자로 감쌀 수 없는 의존성(예: 콜백으로 시작/종료를 전달받는 LLM 호출)의 소요 시간을 현재 노드에 기록합니다.
+
+    Args:
+        name (str): 의존성 이름.
+        elapsed (float): 소요 시간(초).
+    """
+    _record(current_node(), name, elapsed)
+
+
+@asynccontextmanager
+async def timed(name: str):
+    """
+    현재 노드 안에서 의존성 호출 시간을 측정하는 비동기 컨텍스트 관리자입니다.
+    측정값은 프로세스 집계 통계와 (설정된 경우) 요청 단위 기록기에 모두 기록됩니다.
+
+    Args:
+        name (str): 의존성 이름 (예: 'db.get_data_by_names', 'vector.search_by_keyword', 'llm').
+    """
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(current_node(), name, time.perf_counter() - start_time)
+
+
+def timed_node(node: str, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    LangGraph 노드 함수를 감싸 노드 실행 시간을 측정하고, 노드 내부 의존성 측정에 사용할 노드 이름을 설정합니다.
+
+    Args:
+        node (str): 노드 이름.
+        func (Callable[..., Awaitable[Any]]): 감쌀 비동기 노드 함수.
+
+    Returns:
+        Callable[..., Awaitable[Any]]: 시간 측정이 적용된 노드 함수.
+    """
+    @functools.wraps(func)
+    async def _wrapper(state):
+        token = _current_node.set(node)
+        start_time = time.perf_counter()
+        try:
+            return await func(state)
+        finally:
+            _record(node, NODE_WALL, time.perf_counter() - start_time)
+            _current_node.reset(token)
+    return _wrapper
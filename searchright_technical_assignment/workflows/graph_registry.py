@@ -0,0 +1,125 @@
+import logging
+from typing import Dict, Optional
+
+# 그래프 관련 모듈 임포트
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph import StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+# 상태 및 워크플로우 정의 모듈 임포트
+from ..state.profiling_state import ProfilingState
+from .profiling_workflow import WORKFLOW_BUILDERS, PROFILING_WORKFLOW_MODE
+from ..util.message import random_uuid
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 프로파일링 그래프 이름 (체크포인트 없는 단발성 실행용)
+PROFILING_GRAPH = "profiling"
+# 체크포인터가 연결된 프로파일링 그래프 이름 (재개 가능한 장시간 배치 실행용)
+PROFILING_CHECKPOINTED_GRAPH = "profiling_checkpointed"
+
+# 프로세스 단위로 공유되는 컴파일된 그래프 레지스트리
+_compiled_graphs: Dict[str, CompiledStateGraph] = {}
+
+
+def build_profiling_graph(checkpointer: Optional[BaseCheckpointSaver] = None, mode: Optional[str] = None) -> CompiledStateGraph:
+    """
+    프로파일링 상태 그래프를 생성하고 컴파일합니다.
+
+    checkpointer가 없으면 노드 단계마다 상태를 직렬화/보관하지 않는 stateless 그래프가 됩니다.
+    단발성 /profilling 요청은 체크포인트를 재사용하지 않으므로 이 모드를 사용합니다.
+
+    Args:
+        checkpointer (BaseCheckpointSaver, optional): 그래프에 연결할 체크포인터.
+        mode (str, optional): 워크플로우 모드 ('fanout' 또는 'combined'). 기본값은 PROFILING_WORKFLOW_MODE.
+
+    Returns:
+        CompiledStateGraph: 컴파일된 프로파일링 그래프.
+
+    Raises:
+        ValueError: 알 수 없는 워크플로우 모드인 경우.
+    """
+    mode = mode or PROFILING_WORKFLOW_MODE
+    if mode not in WORKFLOW_BUILDERS:
+        raise ValueError(f"알 수 없는 워크플로우 모드입니다: {mode} (사용 가능: {list(WORKFLOW_BUILDERS)})")
+    logger.info(f"프로파일링 그래프 컴파일 시작 (모드: {mode}, 체크포인터: {type(checkpointer).__name__ if checkpointer else '없음'}).")
+    workflow = WORKFLOW_BUILDERS[mode](StateGraph(ProfilingState))
+    app = workflow.compile(checkpointer=checkpointer)
+    logger.info("프로파일링 그래프 컴파일 완료.")
+    return app
+
+
+def init_graph_registry(checkpointer: Optional[BaseCheckpointSaver] = None):
+    """
+    애플리케이션 시작 시 사용할 그래프들을 한 번만 컴파일하여 레지스트리에 등록합니다.
+    FastAPI lifespan에서 호출됩니다.
+
+    Args:
+        checkpointer (BaseCheckpointSaver, optional): 주어지면 체크포인터가 연결된 그래프도 함께 등록합니다.
+    """
+    if PROFILING_GRAPH not in _compiled_graphs:
+        _compiled_graphs[PROFILING_GRAPH] = build_profiling_graph()
+    if checkpointer is not None:
+        _compiled_graphs[PROFILING_CHECKPOINTED_GRAPH] = build_profiling_graph(checkpointer)
+    logger.info(f"그래프 레지스트리 초기화 완료: {list(_compiled_graphs)}")
+
+
+def clear_graph_registry():
+    """
+    레지스트리에 등록된 그래프를 모두 제거합니다. (애플리케이션 종료 또는 테스트용)
+    """
+    _compiled_graphs.clear()
+    logger.info("그래프 레지스트리를 비웠습니다.")
+
+
+def get_profiling_graph(name: Optional[str] = None) -> CompiledStateGraph:
+    """
+    레지스트리에서 컴파일된 그래프를 반환합니다.
+    lifespan 밖에서 호출된 경우(스크립트, 테스트 등)에는 최초 호출 시 한 번 컴파일합니다.
+
+    Args:
+        name (str, optional): 그래프 이름. 기본값은 'profiling'.
+
+    Returns:
+        CompiledStateGraph: 컴파일된 그래프.
+
+    Raises:
+        KeyError: 체크포인터가 설정되지 않아 요청한 그래프가 등록되지 않은 경우.
+    """
+    name = name or PROFILING_GRAPH
+    app = _compiled_graphs.get(name)
+    if app is None:
+        if name != PROFILING_GRAPH:
+            raise KeyError(f"'{name}' 그래프가 등록되어 있지 않습니다. PROFILING_CHECKPOINTER 설정을 확인하세요.")
+        logger.info(f"레지스트리에 '{name}' 그래프가 없어 새로 컴파일합니다.")
+        init_graph_registry()
+        app = _compiled_graphs[name]
+    return app
+
+
+def make_graph_config(app: CompiledStateGraph, thread_id: Optional[str] = None, recursion_limit: int = 5) -> RunnableConfig:
+    """
+    그래프 실행 config를 생성합니다. 체크포인터가 연결된 그래프에만 thread_id를 설정합니다.
+
+    Args:
+        app (CompiledStateGraph): 실행할 그래프.
+        thread_id (str, optional): 재개에 사용할 thread_id. 없으면 새 UUID를 사용합니다.
+        recursion_limit (int, optional): 재귀 최대 횟수. 기본값은 5.
+
+    Returns:
+        RunnableConfig: 그래프 실행 config.
+    """
+    if app.checkpointer is None:
+        return RunnableConfig(recursion_limit=recursion_limit)
+    return RunnableConfig(recursion_limit=recursion_limit, configurable={"thread_id": thread_id or random_uuid()})
+
+
+# 그래프 이미지는 요청 처리 경로가 아닌 별도 빌드 단계에서 생성합니다.
+# 사용법: python -m searchright_technical_assignment.workflows.graph_registry
+if __name__ == "__main__":
+    from ..util.graph import visualize_graph
+
+    logging.basicConfig(level=logging.INFO)
+    visualize_graph(get_profiling_graph(), 'tech_graph')
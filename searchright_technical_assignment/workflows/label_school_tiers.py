@@ -0,0 +1,121 @@
+import sys
+import json
+import asyncio
+import logging
+import argparse
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from langchain_core.output_parsers import StrOutputParser
+
+from ..prompt.profiling_prompt import college_prompt
+from ..util.llm_router import model_router
+from ..util.school_tier_index import school_tier_index, SchoolTierIndex, SCHOOL_TIER_INDEX_PATH, TIERS
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def collect_school_names(input_path: str) -> List[str]:
+    """
+    지원자 JSONL 파일에서 학력 항목의 학교 이름을 중복 없이 수집합니다.
+
+    Args:
+        input_path (str): 입력 JSONL 파일 경로 (한 줄에 TalentIn 형식의 JSON 객체 하나).
+
+    Returns:
+        List[str]: 등장 순서대로의 학교 이름 리스트.
+    """
+    names: Dict[str, None] = {}
+    with open(input_path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("JSON 파싱에 실패한 줄을 건너뜁니다.")
+                continue
+            for education in record.get('educations') or []:
+                name = (education.get('schoolName') or '').strip()
+                if name:
+                    names.setdefault(name)
+    return list(names)
+
+
+def parse_tier(answer: str) -> Optional[str]:
+    """
+    LLM 응답에서 대학 수준을 찾습니다. 정의된 세 수준 중 하나가 아니면 None.
+    """
+    found = [tier for tier in TIERS if tier in answer]
+    return found[0] if len(found) == 1 else None
+
+
+async def _llm_labeler(name: str) -> str:
+    chain = college_prompt | model_router.chat('college_level') | StrOutputParser()
+    return await chain.ainvoke({'college': name})
+
+
+async def label_unseen_schools(names: Iterable[str], index: SchoolTierIndex = school_tier_index, concurrency: int = 8,
+                               labeler: Callable[[str], Awaitable[str]] = _llm_labeler) -> Dict[str, str]:
+    """
+    색인에 없는 학교만 college_prompt로 일괄 라벨링합니다.
+
+    Args:
+        names (Iterable[str]): 학교 이름들.
+        index (SchoolTierIndex, optional): 조회할 학교 수준 색인.
+        concurrency (int, optional): 동시에 실행할 LLM 호출 수.
+        labeler (Callable[[str], Awaitable[str]], optional): 학교 이름을 받아 LLM 응답을 반환하는 코루틴 함수.
+
+    Returns:
+        Dict[str, str]: {학교 이름: 대학 수준}. 응답을 해석할 수 없는 학교는 제외됩니다.
+    """
+    unseen = [name for name in names if index.lookup(name) is None]
+    logger.info(f"색인에 없는 학교 {len(unseen)}개 라벨링 시작.")
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _label(name: str):
+        async with semaphore:
+            try:
+                answer = await labeler(name)
+            except Exception as e:
+                logger.error(f"'{name}' 라벨링 실패: {e}")
+                return name, None
+        tier = parse_tier(answer)
+        if tier is None:
+            logger.warning(f"'{name}'의 응답을 대학 수준으로 해석할 수 없습니다: {answer!r}")
+        return name, tier
+
+    results = await asyncio.gather(*[_label(name) for name in unseen])
+    return {name: tier for name, tier in results if tier is not None}
+
+
+def main(argv=None):
+    """
+    학교 수준 색인 오프라인 라벨링 명령행 진입점입니다.
+
+    사용 예:
+        python -m searchright_technical_assignment.workflows.label_school_tiers talents.jsonl --output school_tiers.json
+    """
+    parser = argparse.ArgumentParser(description="지원자 JSONL에서 색인에 없는 학교를 찾아 LLM으로 라벨링하고 학교 수준 색인에 추가합니다.")
+    parser.add_argument("input", help="입력 JSONL 파일 (한 줄에 TalentIn 형식의 JSON 객체 하나)")
+    parser.add_argument("--output", default=SCHOOL_TIER_INDEX_PATH,
+                        help="추가 항목 JSON 경로 (기본값: SCHOOL_TIER_INDEX_PATH). 서버는 이 파일을 시작 시 읽습니다.")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 LLM 호출 수 (기본값: 8)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 라벨링 결과만 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if not args.output and not args.dry_run:
+        parser.error("--output 또는 SCHOOL_TIER_INDEX_PATH가 필요합니다.")
+
+    index = SchoolTierIndex(overlay_path=args.output)
+    labels = asyncio.run(label_unseen_schools(collect_school_names(args.input), index, args.concurrency))
+    if args.dry_run:
+        print(json.dumps(labels, ensure_ascii=False, indent=2))
+    elif labels:
+        index.save_overlay(labels)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+import os
+import hashlib
+import logging
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+
+from ..state.profiling_state import ProfilingState
+from ..prompt.profiling_prompt import college_prompt, leadership_prompt, company_size_prompt, experience_prompt, combined_profile_prompt
+from .profiling_workflow import PROFILING_WORKFLOW_MODE, WORKFLOW_MODE_COMBINED
+from ..util.batch_dedup import canonical_key
+from ..util.llm_router import model_router
+from ..util.llm_cascade import llm_cascade
+from ..util.leadership_rules import rules_fingerprint
+from ..util.school_tier_index import school_tier_index
+from ..util.cache import LRUTTLCache, SqliteCache, TieredCache
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 프로파일 결과 캐시 사용 여부
+PROFILE_CACHE_ENABLED = os.getenv('PROFILE_CACHE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# 캐시 항목 만료 시간(초)
+PROFILE_CACHE_TTL_SECONDS = float(os.getenv('PROFILE_CACHE_TTL_SECONDS', '86400'))
+# 메모리 캐시 최대 항목 수
+PROFILE_CACHE_MAX_SIZE = int(os.getenv('PROFILE_CACHE_MAX_SIZE', '10000'))
+# 재시작 후에도 유지되는 sqlite 캐시 경로 (미설정 시 메모리 캐시만 사용)
+PROFILE_CACHE_SQLITE_PATH = os.getenv('PROFILE_CACHE_SQLITE_PATH')
+
+# 캐시 키에 사용하는 입력 필드
+_KEY_FIELDS = ("college", "skills", "titles", "companynames_and_dates", "descriptions")
+
+# 프롬프트가 바뀌면 이전 결과가 재사용되지 않도록 현재 워크플로우 모드가 사용하는 프롬프트 내용을 키에 포함합니다.
+_WORKFLOW_PROMPTS = ((combined_profile_prompt,) if PROFILING_WORKFLOW_MODE == WORKFLOW_MODE_COMBINED
+                     else (college_prompt, leadership_prompt, company_size_prompt, experience_prompt))
+_PROMPT_FINGERPRINT = hashlib.sha256("\x00".join(
+    [PROFILING_WORKFLOW_MODE] + [prompt.template for prompt in _WORKFLOW_PROMPTS]
+).encode("utf-8")).hexdigest()[:16]
+# 현재 워크플로우 모드에서 LLM을 호출하는 노드
+_WORKFLOW_LLM_NODES = (("combined_profile",) if PROFILING_WORKFLOW_MODE == WORKFLOW_MODE_COMBINED
+                       else ("college_level", "leadership", "company_size", "experience"))
+
+
+def _normalize(value: Any) -> Any:
+    """
+    공백 차이처럼 결과에 영향을 주지 않는 차이를 제거합니다.
+    """
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def _model_routes() -> dict:
+    """
+    노드별로 실제 호출하는 모델(캐스케이드 적용 노드는 캐스케이드 식별자)을 반환합니다. (llm_cache_key의 모델 이름과 같음)
+    """
+    return {node: llm_cascade.model_label if llm_cascade.applies_to(node) else model_router.model_name(node)
+            for node in _WORKFLOW_LLM_NODES}
+
+
+def _local_rules() -> dict:
+    """
+    LLM 대신 답을 만드는 로컬 판단(리더십 규칙, 학교 수준 색인)의 식별자를 반환합니다. (fanout 모드에서만 사용)
+    """
+    if PROFILING_WORKFLOW_MODE == WORKFLOW_MODE_COMBINED:
+        return {}
+    return {"leadership_rules": rules_fingerprint(), "school_tier_index": school_tier_index.fingerprint()}
+
+
+def profile_cache_key(inputs: ProfilingState) -> str:
+    """
+    그래프 입력 상태를 정규화하여 내용 기반 캐시 키를 생성합니다.
+    기술(skills)은 순서와 중복이 의미가 없으므로 정렬 후 중복을 제거합니다.
+    노드별 모델 라우팅이나 로컬 판단(리더십 규칙 사용 여부와 용어 목록, 학교 수준 색인 내용)이 바뀌면
+    이전 결과가 재사용되지 않도록 노드→모델 매핑과 로컬 판단의 식별자를 키에 포함합니다.
+
+    Args:
+        inputs (ProfilingState): build_profiling_inputs로 추출한 그래프 입력 상태.
+
+    Returns:
+        str: sha256 해시 문자열.
+    """
+    normalized = {field: _normalize(inputs.get(field)) for field in _KEY_FIELDS}
+    normalized["skills"] = sorted({skill for skill in normalized["skills"] or [] if skill})
+    digest = hashlib.sha256(canonical_key([_PROMPT_FINGERPRINT, _model_routes(), _local_rules(), normalized]).encode("utf-8")).hexdigest()
+    return f"profile:{digest}"
+
+
+def _build_profile_cache() -> Optional[TieredCache]:
+    if not PROFILE_CACHE_ENABLED:
+        logger.info("프로파일 결과 캐시 비활성화.")
+        return None
+    disk = None
+    if PROFILE_CACHE_SQLITE_PATH:
+        disk = SqliteCache(PROFILE_CACHE_SQLITE_PATH, table="profile_cache", ttl_seconds=PROFILE_CACHE_TTL_SECONDS)
+    return TieredCache(LRUTTLCache(max_size=PROFILE_CACHE_MAX_SIZE, ttl_seconds=PROFILE_CACHE_TTL_SECONDS), disk)
+
+
+# 프로세스 단위로 공유되는 프로파일 결과 캐시 (비활성화 시 None)
+profile_cache: Optional[TieredCache] = _build_profile_cache()
+
+
+async def get_cached_profile(key: str) -> Optional[dict]:
+    """
+    캐시된 프로파일을 조회합니다. 캐시가 비활성화되었거나 없으면 None.
+    """
+    if profile_cache is None:
+        return None
+    return await profile_cache.aget(key)
+
+
+async def store_profile(key: str, profile: dict):
+    """
+    프로파일을 캐시에 저장합니다.
+    """
+    if profile_cache is not None:
+        await profile_cache.aset(key, profile)
@@ -0,0 +1,224 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from typing import Awaitable, Callable, Iterator, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+
+from .profiling_runner import run_profiling
+from .graph_registry import init_graph_registry, clear_graph_registry
+from ..util.batch_dedup import BatchDeduplicator, dedup_scope
+from ..util.checkpointer import open_checkpointer, close_checkpointer
+from ..db.conn import engine
+from ..util.openai_provider import openai_provider
+from ..util.llm_scheduler import priority_scope, PRIORITY_BULK
+from ..schema.talent_dto import TalentIn
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 대량 프로파일링 기본 동시 실행 수
+BULK_CONCURRENCY = int(os.getenv('PROFILING_BULK_CONCURRENCY', '8'))
+# 진행 상황 로그 출력 간격 (처리 건수)
+BULK_LOG_EVERY = int(os.getenv('PROFILING_BULK_LOG_EVERY', '100'))
+# 실행 전체가 공유하는 중복 제거 결과의 최대 보관 수 (오래 사용되지 않은 결과부터 제거)
+BULK_DEDUP_MAX_ENTRIES = int(os.getenv('PROFILING_BULK_DEDUP_MAX_ENTRIES', '10000'))
+
+# 재개 시 다시 실행하지 않는 결과 상태
+DONE_STATUSES = ("success", "partial")
+
+
+def load_completed_ids(output_path: str) -> Set[str]:
+    """
+    기존 출력 파일에서 이미 완료된 지원자 ID를 읽습니다.
+    출력 파일 자체가 진행 상황 체크포인트이며, 비정상 종료로 잘린 마지막 줄은 무시합니다.
+
+    Args:
+        output_path (str): 출력 JSONL 파일 경로.
+
+    Returns:
+        Set[str]: 완료된 지원자 ID 집합. 실패한 지원자는 포함하지 않으므로 재실행 시 다시 처리됩니다.
+    """
+    completed: Set[str] = set()
+    if not os.path.exists(output_path):
+        return completed
+    with open(output_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("출력 파일의 잘린 줄을 건너뜁니다.")
+                continue
+            if record.get("status") in DONE_STATUSES:
+                completed.add(str(record["id"]))
+            else:
+                completed.discard(str(record["id"]))
+    return completed
+
+
+def iter_candidates(input_path: str, id_field: str) -> Iterator[Tuple[str, Optional[dict], Optional[str]]]:
+    """
+    입력 JSONL 파일에서 지원자를 한 줄씩 읽습니다.
+
+    Args:
+        input_path (str): 입력 JSONL 파일 경로. 한 줄에 TalentIn 형식의 JSON 객체 하나.
+        id_field (str): 지원자 ID로 사용할 필드 이름. 없으면 'line:<줄 번호>'를 사용합니다.
+
+    Yields:
+        Tuple[str, Optional[dict], Optional[str]]: (지원자 ID, JSON 객체, 파싱 오류 메시지).
+    """
+    with open(input_path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield f"line:{line_no}", None, f"JSON 파싱 오류: {e}"
+                continue
+            yield str(record.get(id_field, f"line:{line_no}")), record, None
+
+
+def _result_record(candidate_id: str, outputs: Optional[dict] = None, error: Optional[str] = None) -> dict:
+    if error is not None:
+        return {"id": candidate_id, "status": "error", "output": {}, "error": error}
+    missing_dimensions = outputs.get('missing_dimensions') or []
+    return {"id": candidate_id,
+            "status": "partial" if missing_dimensions else "success",
+            "output": outputs['profile'],
+            "missing_dimensions": missing_dimensions}
+
+
+async def run_bulk_profiling(input_path: str, output_path: str, concurrency: int = BULK_CONCURRENCY,
+                             id_field: str = "id",
+                             runner: Callable[..., Awaitable[dict]] = run_profiling) -> dict:
+    """
+    입력 JSONL의 지원자들을 제한된 동시성으로 프로파일링하고 결과를 완료 순서대로 출력 JSONL에 기록합니다.
+    출력 파일에 이미 성공한 지원자는 건너뛰므로, 중단된 실행은 같은 명령으로 이어서 처리할 수 있습니다.
+    실행 전체가 하나의 중복 제거 범위를 공유하여 같은 학교, 회사+근무기간, 회사 제품 조회를 한 번만 계산합니다.
+    (최근 BULK_DEDUP_MAX_ENTRIES개의 결과만 보관하며, 실패한 계산은 공유하지 않고 다음 지원자에서 다시 실행합니다.)
+    체크포인터가 설정되어 있으면 지원자 ID를 thread_id로 노드 단위 체크포인트를 남기므로,
+    실패한 지원자는 재실행 시 완료된 노드를 건너뛰고 이어서 처리합니다.
+    입력에 같은 지원자 ID가 여러 번 있으면 같은 체크포인트를 동시에 사용하지 않도록 처음 것만 처리합니다.
+
+    Args:
+        input_path (str): 입력 JSONL 파일 경로.
+        output_path (str): 출력 JSONL 파일 경로.
+        concurrency (int, optional): 동시에 실행할 최대 그래프 수.
+        id_field (str, optional): 지원자 ID로 사용할 입력 필드 이름.
+        runner (Callable[[TalentIn], Awaitable[dict]], optional): 지원자 한 명을 프로파일링하는 코루틴 함수.
+
+    Returns:
+        dict: {"processed", "succeeded", "failed", "skipped", "duplicates", "elapsed_seconds"} 실행 통계.
+    """
+    concurrency = max(1, concurrency)
+    completed = load_completed_ids(output_path)
+    # 이번 실행에서 이미 대기열에 넣은 지원자 ID
+    queued_ids = set()
+    stats = {"processed": 0, "succeeded": 0, "failed": 0, "skipped": 0, "duplicates": 0}
+    start_time = time.perf_counter()
+    # 입력 전체를 메모리에 올리지 않도록 대기열 길이를 제한합니다.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈을 보정합니다.
+    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        with open(output_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+    else:
+        needs_newline = False
+
+    with open(output_path, 'a', encoding='utf-8') as out:
+        if needs_newline:
+            out.write("\n")
+
+        def _write(record: dict):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            # 비정상 종료 시에도 완료된 결과가 체크포인트로 남도록 매 건 기록합니다.
+            out.flush()
+            stats["processed"] += 1
+            stats["succeeded" if record["status"] in DONE_STATUSES else "failed"] += 1
+            if stats["processed"] % BULK_LOG_EVERY == 0:
+                logger.info(f"대량 프로파일링 진행: {stats['processed']}건 처리 "
+                            f"({stats['processed'] / (time.perf_counter() - start_time):.2f}건/초)")
+
+        async def _worker():
+            while True:
+                candidate_id, record = await queue.get()
+                try:
+                    outputs = await runner(TalentIn.model_validate(record), thread_id=candidate_id)
+                    _write(_result_record(candidate_id, outputs=outputs))
+                except Exception as e:
+                    logger.error(f"지원자 {candidate_id} 프로파일링 실패: {e}")
+                    _write(_result_record(candidate_id, error=str(e)))
+                finally:
+                    queue.task_done()
+
+        with dedup_scope(BatchDeduplicator(max_entries=BULK_DEDUP_MAX_ENTRIES)), priority_scope(PRIORITY_BULK):
+            workers = [asyncio.create_task(_worker()) for _ in range(concurrency)]
+            try:
+                for candidate_id, record, error in iter_candidates(input_path, id_field):
+                    if candidate_id in completed:
+                        stats["skipped"] += 1
+                        continue
+                    if error is not None:
+                        _write(_result_record(candidate_id, error=error))
+                        continue
+                    if candidate_id in queued_ids:
+                        logger.warning(f"입력에 중복된 지원자 ID를 건너뜁니다: {candidate_id}")
+                        stats["duplicates"] += 1
+                        continue
+                    queued_ids.add(candidate_id)
+                    await queue.put((candidate_id, record))
+                await queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - start_time, 2)
+    logger.info(f"대량 프로파일링 완료: {stats}")
+    return stats
+
+
+def main(argv=None):
+    """
+    대량 프로파일링 명령행 진입점입니다.
+
+    사용 예:
+        python -m searchright_technical_assignment.workflows.profiling_bulk talents.jsonl profiles.jsonl --concurrency 16
+    """
+    parser = argparse.ArgumentParser(description="JSONL 파일의 지원자들을 일괄 프로파일링합니다. 같은 출력 파일로 다시 실행하면 이어서 처리합니다.")
+    parser.add_argument("input", help="입력 JSONL 파일 (한 줄에 TalentIn 형식의 JSON 객체 하나)")
+    parser.add_argument("output", help="출력 JSONL 파일 (진행 상황 체크포인트로도 사용)")
+    parser.add_argument("--concurrency", type=int, default=BULK_CONCURRENCY, help=f"동시 실행 그래프 수 (기본값: {BULK_CONCURRENCY})")
+    parser.add_argument("--id-field", default="id", help="지원자 ID로 사용할 입력 필드 이름 (기본값: id)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    async def _run():
+        # PROFILING_CHECKPOINTER=postgres이면 중단된 지원자의 노드 단위 진행 상황도 이어서 처리합니다.
+        checkpointer = await open_checkpointer()
+        init_graph_registry(checkpointer)
+        try:
+            return await run_bulk_profiling(args.input, args.output, args.concurrency, args.id_field)
+        finally:
+            clear_graph_registry()
+            await close_checkpointer()
+            await engine.dispose()
+            await openai_provider.aclose()
+
+    stats = asyncio.run(_run())
+    return 0 if stats["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from .profiling_runner import run_profiling
+from ..util.message import random_uuid
+from ..util.llm_scheduler import priority_scope, PRIORITY_BULK
+from ..schema.talent_dto import TalentIn
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 작업 큐를 처리하는 워커 수 (동시에 실행되는 그래프 수)
+JOB_WORKERS = int(os.getenv('PROFILING_JOB_WORKERS', '4'))
+# 대기열 최대 길이
+JOB_QUEUE_MAX_SIZE = int(os.getenv('PROFILING_JOB_QUEUE_MAX_SIZE', '1000'))
+# 완료된 작업 결과 보관 시간(초)
+JOB_RESULT_TTL_SECONDS = float(os.getenv('PROFILING_JOB_RESULT_TTL_SECONDS', '3600'))
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """
+    작업 대기열이 가득 차 새 작업을 받을 수 없을 때 발생하는 예외입니다.
+    """
+
+
+@dataclass
+class ProfilingJob:
+    """
+    비동기 프로파일링 작업 하나의 상태와 결과를 담는 데이터 클래스입니다.
+    """
+    job_id: str
+    item: TalentIn
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    outputs: Optional[dict] = None
+    error: Optional[str] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
+
+
+class ProfilingJobQueue:
+    """
+    프로파일링 작업을 대기열에 넣고 프로세스 내 워커 풀이 설정된 동시성으로 처리하는 클래스입니다.
+    요청 제출과 그래프 실행을 분리하여 동기 /profilling 호출이 HTTP 연결을 오래 점유하는 문제를 피합니다.
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS, max_queue_size: int = JOB_QUEUE_MAX_SIZE,
+                 result_ttl_seconds: float = JOB_RESULT_TTL_SECONDS,
+                 runner: Callable[..., Awaitable[dict]] = run_profiling):
+        """
+        ProfilingJobQueue 객체를 초기화합니다.
+
+        Args:
+            workers (int): 워커 수.
+            max_queue_size (int): 대기열 최대 길이.
+            result_ttl_seconds (float): 완료된 작업 결과 보관 시간(초).
+            runner (Callable[..., Awaitable[dict]], optional): 작업 하나를 runner(item, thread_id=...)로 실행하는 코루틴 함수.
+        """
+        self.workers = max(1, workers)
+        self.max_queue_size = max_queue_size
+        self.result_ttl_seconds = result_ttl_seconds
+        self._runner = runner
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._jobs: Dict[str, ProfilingJob] = {}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._worker_tasks)
+
+    async def start(self):
+        """
+        워커 태스크를 시작합니다. FastAPI lifespan에서 호출됩니다.
+        """
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker_tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        logger.info(f"프로파일링 작업 워커 {self.workers}개 시작.")
+
+    async def stop(self):
+        """
+        워커 태스크를 종료합니다. 대기 중인 작업은 실패 처리됩니다.
+        """
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        for job in self._jobs.values():
+            if not job.finished:
+                self._finish(job, error="서버 종료로 작업이 취소되었습니다.")
+        logger.info("프로파일링 작업 워커 종료.")
+
+    async def submit(self, item: TalentIn) -> ProfilingJob:
+        """
+        새 작업을 대기열에 추가합니다.
+
+        Args:
+            item (TalentIn): 지원자 입력 데이터.
+
+        Returns:
+            ProfilingJob: 생성된 작업.
+
+        Raises:
+            JobQueueFull: 대기열이 가득 찬 경우.
+        """
+        if not self.running:
+            await self.start()
+        self._purge_expired()
+        job = ProfilingJob(job_id=random_uuid(), item=item)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFull(f"작업 대기열이 가득 찼습니다. (최대 {self.max_queue_size}개)")
+        self._jobs[job.job_id] = job
+        logger.info(f"프로파일링 작업 등록: {job.job_id} (대기열 길이: {self._queue.qsize()})")
+        return job
+
+    def get(self, job_id: str) -> Optional[ProfilingJob]:
+        """
+        작업 ID로 작업을 조회합니다. 없거나 보관 시간이 지난 경우 None.
+        """
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    async def wait(self, job: ProfilingJob, timeout: float) -> bool:
+        """
+        작업이 완료될 때까지 최대 timeout초 동안 기다립니다. (long-poll)
+
+        Returns:
+            bool: 작업 완료 여부.
+        """
+        if not job.finished and timeout > 0:
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        return job.finished
+
+    def stats(self) -> dict:
+        """
+        대기열 길이와 상태별 작업 수를 반환합니다.
+        """
+        counts = {JOB_QUEUED: 0, JOB_RUNNING: 0, JOB_SUCCEEDED: 0, JOB_FAILED: 0}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {"workers": self.workers, "queue_depth": self._queue.qsize() if self._queue else 0, "jobs": counts}
+
+    async def _worker(self, worker_id: int):
+        """
+        대기열에서 작업을 꺼내 실행하는 워커 루프입니다.
+        """
+        while True:
+            job = await self._queue.get()
+            try:
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+                # 작업 큐의 LLM 호출은 대화형 /profilling 요청보다 뒤에 스케줄링합니다.
+                # 체크포인터가 설정되어 있으면 지원자 ID(없으면 작업 ID) 단위로 체크포인트를 남기므로,
+                # 실패한 지원자를 같은 talent_id로 다시 제출하면 완료된 노드는 다시 실행하지 않습니다.
+                with priority_scope(PRIORITY_BULK):
+                    outputs = await self._runner(job.item, thread_id=job.item.talent_id or job.job_id)
+                self._finish(job, outputs=outputs)
+            except asyncio.CancelledError:
+                self._finish(job, error="작업이 취소되었습니다.")
+                raise
+            except Exception as e:
+                logger.error(f"[워커 {worker_id}] 프로파일링 작업 {job.job_id} 실패: {e}")
+                self._finish(job, error=str(e))
+            finally:
+                self._queue.task_done()
+
+    def _finish(self, job: ProfilingJob, outputs: Optional[dict] = None, error: Optional[str] = None):
+        job.outputs = outputs
+        job.error = error
+        job.status = JOB_FAILED if error is not None else JOB_SUCCEEDED
+        job.finished_at = time.time()
+        # 결과를 기다리는 동안 입력 데이터는 더 이상 필요 없으므로 해제합니다.
+        job.item = None
+        job.done.set()
+
+    def _purge_expired(self):
+        """
+        보관 시간이 지난 완료 작업을 제거합니다.
+        """
+        now = time.time()
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished and now - job.finished_at > self.result_ttl_seconds]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# 프로세스 단위로 공유되는 작업 큐
+job_queue = ProfilingJobQueue()
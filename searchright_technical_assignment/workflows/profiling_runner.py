@@ -0,0 +1,230 @@
+import os
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from dotenv import load_dotenv
+from langgraph.graph.state import CompiledStateGraph
+
+# 상태 및 그래프 레지스트리 모듈 임포트
+from ..state.profiling_state import ProfilingState
+from .graph_registry import get_profiling_graph, make_graph_config, PROFILING_CHECKPOINTED_GRAPH
+# 지원자 정보 추출 유틸리티 임포트
+from ..util.extract_school_name import get_final_school_name
+from ..util.extract_titles import get_title
+from ..util.extract_companynames_and_dates import get_companynames_and_dates
+from ..util.extract_descriptions import get_descriptions
+from ..util.batch_dedup import BatchDeduplicator, dedup_scope
+from ..util.message import astream_graph_updates
+from ..util.single_flight import SingleFlight
+from ..util.timing import current_recorder
+from ..util.llm_scheduler import current_priority
+from ..util.deadline import deadline_scope, resolve_budget_ms
+from .profile_cache import profile_cache_key, get_cached_profile, store_profile
+from ..node.profiling_node import build_profile
+# 데이터 전송 객체 (DTO) 모듈
+from ..schema.talent_dto import TalentIn
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 환경 변수 로드
+load_dotenv()
+
+# 배치 프로파일링 동시 실행 수
+BATCH_CONCURRENCY = int(os.getenv('PROFILING_BATCH_CONCURRENCY', '8'))
+
+# 프로파일의 각 차원을 생성하는 노드(통합 모드의 combined_profile 포함)와 최종 결합 노드
+PROFILE_NODES = ["college_level", "leadership", "company_size", "experience", "combined_profile"]
+COMBINE_NODE = "combine"
+
+# 동시에 들어온 동일 입력의 그래프 실행을 하나로 합치는 프로세스 단위 객체
+single_flight = SingleFlight()
+
+
+def build_profiling_inputs(item: TalentIn) -> ProfilingState:
+    """
+    지원자 정보에서 그래프 입력 상태를 추출합니다.
+
+    Args:
+        item (TalentIn): 지원자의 학력, 기술, 경력 정보를 포함하는 입력 데이터.
+
+    Returns:
+        ProfilingState: 그래프에 전달할 초기 상태.
+    """
+    return ProfilingState(college=get_final_school_name(item.educations or []),
+                          skills=item.skills or [],
+                          titles=get_title(item.positions or []),
+                          companynames_and_dates=get_companynames_and_dates(item.positions or []),
+                          descriptions=get_descriptions(item.positions or []))
+
+
+async def run_profiling(item: TalentIn, app: Optional[CompiledStateGraph] = None, thread_id: Optional[str] = None) -> dict:
+    """
+    한 명의 지원자에 대해 프로파일링 그래프를 실행하고 최종 상태를 반환합니다.
+    요청 범위의 중복 제거기가 없으면 새로 열어, 한 지원자 안의 중복 DB 조회도 한 번만 수행합니다.
+    기본 그래프로 실행하는 경우, 정규화된 입력이 같은 지원자는 캐시된 프로파일을 그래프 실행 없이 반환하고,
+    동시에 실행 중인 같은 입력(과 같은 우선순위)이 있으면 그 실행 결과를 함께 받습니다. (실행 시간 측정 요청은 제외)
+    thread_id가 주어지고 체크포인터가 설정되어 있으면(작업 큐, 대량 프로파일링) 체크포인터가 연결된 그래프로 실행하며,
+    같은 thread_id의 중단된 실행은 완료된 노드를 다시 실행하지 않고 이어서 처리합니다.
+    지연 시간 예산(item.latency_budget_ms)이 있으면 예산 안에 끝나지 않은 노드는 'missing_dimensions'에 기록되고,
+    이러한 부분 결과는 캐시에 저장하지 않습니다.
+
+    Args:
+        item (TalentIn): 지원자 입력 데이터.
+        app (CompiledStateGraph, optional): 실행할 그래프. 기본값은 레지스트리의 stateless 그래프.
+        thread_id (str, optional): 재개 단위가 되는 체크포인트 thread_id (지원자 ID).
+
+    Returns:
+        dict: 그래프 실행 후 최종 상태 ('profile' 포함).
+    """
+    inputs = build_profiling_inputs(item)
+    budget_ms = resolve_budget_ms(item.latency_budget_ms)
+    # 캐시와 요청 합치기는 레지스트리의 그래프 실행에만 사용합니다.
+    cache_key = profile_cache_key(inputs) if app is None else None
+    if cache_key is None:
+        return await _invoke_graph(app, inputs, budget_ms)
+
+    cached = await _cached_outputs(inputs, cache_key)
+    if cached is not None:
+        return cached
+
+    resumable_app = _resumable_graph() if thread_id is not None else None
+
+    async def _invoke_and_store():
+        if resumable_app is not None:
+            outputs = await _invoke_graph(resumable_app, inputs, budget_ms, thread_id)
+        else:
+            outputs = await _invoke_graph(get_profiling_graph(), inputs, budget_ms)
+        if not outputs.get('missing_dimensions'):
+            await store_profile(cache_key, outputs['profile'])
+        return outputs
+
+    # 재개 가능한 실행은 thread_id별 체크포인트를 사용하고, 실행 시간을 요청한 경우(?timings=true)는
+    # 자신의 실행을 측정해야 하므로 다른 요청과 합치지 않습니다.
+    if resumable_app is not None or current_recorder() is not None:
+        return await _invoke_and_store()
+    # 캐시 미스 구간에 같은 입력과 예산으로 동시에 들어온 요청은 하나의 그래프 실행 결과를 함께 받습니다.
+    # 공유 실행은 먼저 온 요청의 우선순위로 LLM을 호출하므로, 대화형 요청이 대량 작업의 실행에 합류하지 않도록 우선순위도 키에 포함합니다.
+    return await single_flight.do((cache_key, budget_ms, current_priority()), _invoke_and_store)
+
+
+async def get_cached_profiling(item: TalentIn) -> Optional[dict]:
+    """
+    정규화된 입력이 같은 지원자의 캐시된 프로파일이 있으면 그래프를 실행하지 않고 최종 상태를 반환합니다.
+    /profilling은 캐시 적중 요청을 수락 제어(동시 실행 수, 처리 시간 추정) 앞에서 바로 응답하는 데 사용합니다.
+
+    Args:
+        item (TalentIn): 지원자 입력 데이터.
+
+    Returns:
+        Optional[dict]: 캐시된 프로파일을 포함한 최종 상태. 캐시에 없으면 None.
+    """
+    inputs = build_profiling_inputs(item)
+    return await _cached_outputs(inputs, profile_cache_key(inputs))
+
+
+async def _cached_outputs(inputs: ProfilingState, cache_key: str) -> Optional[dict]:
+    cached = await get_cached_profile(cache_key)
+    if cached is None:
+        return None
+    logger.info(f"프로파일 캐시 적중: {cache_key}")
+    return {**inputs, 'profile': cached}
+
+
+def _resumable_graph() -> Optional[CompiledStateGraph]:
+    """
+    체크포인터가 연결된 그래프를 반환합니다. PROFILING_CHECKPOINTER=none이라 등록되지 않았으면 None.
+    """
+    try:
+        return get_profiling_graph(PROFILING_CHECKPOINTED_GRAPH)
+    except KeyError:
+        return None
+
+
+async def _invoke_graph(app: CompiledStateGraph, inputs: ProfilingState, budget_ms: Optional[float] = None,
+                        thread_id: Optional[str] = None) -> dict:
+    config = make_graph_config(app, thread_id)
+    with dedup_scope(), deadline_scope(budget_ms):
+        if thread_id is not None and app.checkpointer is not None:
+            snapshot = await app.aget_state(config)
+            if snapshot.values:
+                same_inputs = all(snapshot.values.get(key) == value for key, value in inputs.items())
+                if same_inputs and snapshot.next:
+                    # 실패/중단된 실행: 체크포인트 이후의 노드만 실행합니다.
+                    logger.info(f"체크포인트에서 프로파일링 재개: {thread_id} (남은 노드: {list(snapshot.next)})")
+                    return await app.ainvoke(None, config)
+                if same_inputs and 'profile' in snapshot.values and not snapshot.values.get('missing_dimensions'):
+                    logger.info(f"체크포인트의 완료된 프로파일 재사용: {thread_id}")
+                    return snapshot.values
+                # 입력이 바뀌었거나 부분 결과인 경우 이전 상태(누적되는 missing_dimensions 포함)를 지우고 새로 실행합니다.
+                await app.checkpointer.adelete_thread(thread_id)
+        return await app.ainvoke(inputs, config)
+
+
+async def stream_profiling(item: TalentIn, app: Optional[CompiledStateGraph] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    한 명의 지원자에 대해 프로파일링 그래프를 실행하면서, 각 노드가 완료되는 즉시 부분 프로파일을 반환합니다.
+    마지막으로 결합 노드의 최종 프로파일을 반환합니다.
+    캐시된 프로파일이 있으면 부분 결과 없이 최종 프로파일만 즉시 반환합니다.
+    지연 시간 예산 안에 끝나지 않은 노드는 최종 결과의 'missing_dimensions'에 포함됩니다.
+
+    Args:
+        item (TalentIn): 지원자 입력 데이터.
+        app (CompiledStateGraph, optional): 실행할 그래프. 기본값은 레지스트리의 stateless 그래프.
+
+    Yields:
+        Dict[str, Any]: {"node": 노드 이름, "profile": 부분 또는 최종 프로파일, "final": 최종 여부,
+                         "missing_dimensions": 제외된 노드 (최종 결과에만 포함)}.
+    """
+    inputs = build_profiling_inputs(item)
+    budget_ms = resolve_budget_ms(item.latency_budget_ms)
+    cache_key = profile_cache_key(inputs) if app is None else None
+    if cache_key is not None:
+        cached = await get_cached_profile(cache_key)
+        if cached is not None:
+            logger.info(f"프로파일 캐시 적중: {cache_key}")
+            yield {"node": COMBINE_NODE, "profile": cached, "final": True, "missing_dimensions": []}
+            return
+
+    app = app or get_profiling_graph()
+    missing_dimensions = []
+    with dedup_scope(), deadline_scope(budget_ms):
+        async for update in astream_graph_updates(app, inputs, make_graph_config(app), node_names=PROFILE_NODES + [COMBINE_NODE]):
+            content = update["content"] or {}
+            if update["node"] == COMBINE_NODE:
+                profile = content.get('profile', {})
+                if cache_key is not None and not missing_dimensions:
+                    await store_profile(cache_key, profile)
+                yield {"node": COMBINE_NODE, "profile": profile, "final": True, "missing_dimensions": missing_dimensions}
+            else:
+                missing_dimensions.extend(content.get('missing_dimensions') or [])
+                # college_level 결과는 원래 학교명과 함께 표시되므로 입력 상태의 college를 함께 전달합니다.
+                partial = build_profile({'college': inputs['college'], **content})
+                yield {"node": update["node"], "profile": partial, "final": False}
+
+
+async def run_profiling_batch(items: List[TalentIn], concurrency: int = BATCH_CONCURRENCY) -> List[dict | BaseException]:
+    """
+    여러 지원자를 제한된 동시성으로 프로파일링합니다.
+    배치 전체가 하나의 중복 제거 범위를 공유하므로 같은 학교, 같은 회사+근무기간, 같은 회사 제품 조회는
+    한 번만 계산되어 모든 지원자에게 전달됩니다.
+
+    Args:
+        items (List[TalentIn]): 지원자 입력 데이터 리스트.
+        concurrency (int, optional): 동시에 실행할 최대 그래프 수.
+
+    Returns:
+        List[dict | BaseException]: 입력 순서대로의 최종 상태 또는 실패한 경우 예외 객체.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    deduplicator = BatchDeduplicator()
+
+    async def _run_one(item: TalentIn):
+        async with semaphore:
+            return await run_profiling(item)
+
+    with dedup_scope(deduplicator):
+        results = await asyncio.gather(*[_run_one(item) for item in items], return_exceptions=True)
+    logger.info(f"배치 프로파일링 완료: {len(items)}명, 중복 제거된 하위 계산 {deduplicator.hits}건, 실제 계산 {deduplicator.misses}건")
+    return results
@@ -1,15 +1,33 @@
+import os
 import logging
 import functools
+from dotenv import load_dotenv
 # 그래프 관련 모듈 임포트
 from langgraph.graph import END, StateGraph
 # 노드 관련 모듈 임포트
-from ..node.profiling_node import input, college_level, leadership, combine, company_size, experience
+from ..node.profiling_node import input, college_level, leadership, combine, company_size, experience, combined_profile
 # 프롬프트 관련 모듈 임포트
-from ..prompt.profiling_prompt import college_prompt, leadership_prompt, company_size_prompt, experience_prompt
+from ..prompt.profiling_prompt import college_prompt, leadership_prompt, company_size_prompt, experience_prompt, combined_profile_prompt
+# 노드 실행 시간 측정 및 지연 시간 예산 모듈 임포트
+from ..util.timing import timed_node
+from ..util.deadline import deadline_node
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 환경 변수 로드
+load_dotenv()
+
+# 워크플로우 모드
+# - fanout: 네 가지 항목을 각각의 노드(LLM 호출 4회)에서 병렬로 판단 (기본값)
+# - combined: DB/뉴스 조회 후 네 가지 항목을 한 번의 구조화된 출력 호출로 판단
+WORKFLOW_MODE_FANOUT = "fanout"
+WORKFLOW_MODE_COMBINED = "combined"
+PROFILING_WORKFLOW_MODE = os.getenv('PROFILING_WORKFLOW_MODE', WORKFLOW_MODE_FANOUT).lower()
+
+# 통합 노드가 판단하는 항목 (시간 초과 시 모두 누락으로 기록)
+COMBINED_DIMENSIONS = ["college_level", "leadership", "company_size", "experience"]
+
 def profilling_stategraph(workflow: StateGraph):
     """
     프로파일링 워크플로우를 정의하는 LangGraph 상태 그래프를 설정합니다.
@@ -23,10 +41,10 @@ def profilling_stategraph(workflow: StateGraph):
     logger.info("프로파일링 상태 그래프 설정 시작.")
     # 1. 노드 추가
     workflow.add_node("input", input)
-    workflow.add_node("college_level", functools.partial(college_level, prompt=college_prompt))
-    workflow.add_node("leadership", functools.partial(leadership, prompt=leadership_prompt))
-    workflow.add_node("company_size", functools.partial(company_size, prompt=company_size_prompt))
-    workflow.add_node("experience", functools.partial(experience, prompt=experience_prompt))
+    workflow.add_node("college_level", deadline_node("college_level", timed_node("college_level", functools.partial(college_level, prompt=college_prompt))))
+    workflow.add_node("leadership", deadline_node("leadership", timed_node("leadership", functools.partial(leadership, prompt=leadership_prompt))))
+    workflow.add_node("company_size", deadline_node("company_size", timed_node("company_size", functools.partial(company_size, prompt=company_size_prompt))))
+    workflow.add_node("experience", deadline_node("experience", timed_node("experience", functools.partial(experience, prompt=experience_prompt))))
     workflow.add_node("combine", combine)
     logger.info("그래프에 노드 추가 완료.")
     
@@ -49,4 +67,36 @@ def profilling_stategraph(workflow: StateGraph):
     logger.info("진입점 'input'으로 설정 완료.")
     
     logger.info("프로파일링 상태 그래프 설정 완료.")
-    return workflow
\ No newline at end of file
+    return workflow
+
+
+def profilling_combined_stategraph(workflow: StateGraph):
+    """
+    네 가지 항목을 한 번의 LLM 호출로 판단하는 통합 프로파일링 상태 그래프를 설정합니다.
+    input → combined_profile → combine 순서로 실행됩니다.
+
+    Args:
+        workflow (StateGraph): 노드와 엣지를 추가할 LangGraph의 StateGraph 인스턴스.
+
+    Returns:
+        StateGraph: 설정이 완료된 LangGraph 상태 그래프.
+    """
+    logger.info("통합 프로파일링 상태 그래프 설정 시작.")
+    workflow.add_node("input", input)
+    workflow.add_node("combined_profile", deadline_node("combined_profile", timed_node("combined_profile", functools.partial(combined_profile, prompt=combined_profile_prompt)), dimensions=COMBINED_DIMENSIONS))
+    workflow.add_node("combine", combine)
+
+    workflow.add_edge("input", "combined_profile")
+    workflow.add_edge("combined_profile", "combine")
+    workflow.add_edge("combine", END)
+
+    workflow.set_entry_point("input")
+    logger.info("통합 프로파일링 상태 그래프 설정 완료.")
+    return workflow
+
+
+# 워크플로우 모드별 상태 그래프 설정 함수
+WORKFLOW_BUILDERS = {
+    WORKFLOW_MODE_FANOUT: profilling_stategraph,
+    WORKFLOW_MODE_COMBINED: profilling_combined_stategraph,
+}
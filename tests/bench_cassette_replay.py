@@ -0,0 +1,69 @@
+import sys
+import os
+import json
+import time
+import glob
+import asyncio
+import argparse
+import numpy as np # 통계 계산을 위해 numpy 사용
+
+# 프로젝트 루트를 sys.path에 추가하여 절대 임포트가 가능하도록 합니다.
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+# 벤치마크 설정
+RUN_COUNT = 5  # 지원자별 반복 횟수
+TALENT_GLOB = os.path.join(project_root, 'example_datas', 'talent_ex*.json')
+CASSETTE_PATH = os.path.join(project_root, 'cassettes', 'profiling.jsonl')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="카세트로 기록한 LLM/임베딩 응답을 재생하여 실제 그래프(app.ainvoke)의 종단간 지연 시간을 측정")
+    parser.add_argument("mode", choices=["record", "replay"], help="record: 실제 호출을 기록 (벤더 API 필요), replay: 기록을 재생")
+    parser.add_argument("--cassette", default=CASSETTE_PATH, help="카세트 파일 경로")
+    parser.add_argument("--runs", type=int, default=RUN_COUNT, help="지원자별 반복 횟수 (record는 1회)")
+    parser.add_argument("--talents", default=TALENT_GLOB, help="지원자 JSON 파일 glob 패턴")
+    parser.add_argument("--no-latency", action="store_true", help="재생 시 기록된 응답 시간을 기다리지 않음 (프레임워크 오버헤드만 측정)")
+    return parser.parse_args()
+
+
+async def main(args):
+    from searchright_technical_assignment.db.conn import engine
+    from searchright_technical_assignment.schema.talent_dto import TalentIn
+    from searchright_technical_assignment.workflows.graph_registry import build_profiling_graph
+    from searchright_technical_assignment.workflows.profiling_runner import run_profiling
+    from searchright_technical_assignment.util.llm_cassette import llm_cassette
+
+    talents = []
+    for path in sorted(glob.glob(args.talents)):
+        with open(path, encoding='utf-8') as f:
+            talents.append(TalentIn(**json.load(f)))
+
+    app = build_profiling_graph()
+    run_count = 1 if args.mode == "record" else args.runs
+    print(f"--- 카세트 {args.mode} (지원자 {len(talents)}명 x {run_count}회, {args.cassette}) ---")
+    timings = []
+    for talent in talents:
+        for _ in range(run_count):
+            start_time = time.perf_counter()
+            await run_profiling(talent, app=app)
+            timings.append((time.perf_counter() - start_time) * 1000)
+
+    print(f"지연 시간 평균: {np.mean(timings):.1f} ms, p50: {np.percentile(timings, 50):.1f} ms, "
+          f"p95: {np.percentile(timings, 95):.1f} ms")
+    print(f"카세트: {llm_cassette.stats()}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # 카세트 설정은 모듈 임포트 시 읽으므로 임포트 전에 설정합니다.
+    # 캐시 적중은 기록되지 않으므로 기록/재생 모두 캐시를 끕니다.
+    os.environ['LLM_CASSETTE_MODE'] = args.mode
+    os.environ['LLM_CASSETTE_PATH'] = args.cassette
+    os.environ['LLM_CASSETTE_REPLAY_LATENCY'] = 'false' if args.no_latency else 'true'
+    os.environ['PROFILE_CACHE_ENABLED'] = 'false'
+    os.environ['LLM_CACHE_ENABLED'] = 'false'
+    if args.mode == "record" and os.path.exists(args.cassette):
+        os.remove(args.cassette)
+    asyncio.run(main(args))
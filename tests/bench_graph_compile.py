@@ -0,0 +1,82 @@
+import sys
+import os
+import time
+import argparse
+import numpy as np # 통계 계산을 위해 numpy 사용
+
+# 프로젝트 루트를 sys.path에 추가하여 절대 임포트가 가능하도록 합니다.
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from langgraph.graph import StateGraph
+from langgraph.checkpoint.memory import MemorySaver
+
+from searchright_technical_assignment.state.profiling_state import ProfilingState
+from searchright_technical_assignment.workflows.profiling_workflow import profilling_stategraph
+from searchright_technical_assignment.workflows.graph_registry import get_profiling_graph, clear_graph_registry
+from searchright_technical_assignment.util.graph import visualize_graph
+
+# 벤치마크 설정
+RUN_COUNT = 50  # 반복 횟수
+
+
+def per_request_compile(render: bool):
+    """
+    기존 /profilling 요청 경로: 매 요청마다 그래프 생성, 체크포인터 생성, 컴파일, (선택) 시각화.
+    """
+    workflow = profilling_stategraph(StateGraph(ProfilingState))
+    memory = MemorySaver()
+    app = workflow.compile(checkpointer=memory)
+    if render:
+        visualize_graph(app, 'bench_graph')
+    return app
+
+
+def registry_lookup():
+    """
+    변경된 /profilling 요청 경로: lifespan에서 컴파일된 그래프를 레지스트리에서 조회.
+    """
+    return get_profiling_graph()
+
+
+def measure(func, run_count: int, **kwargs):
+    """
+    주어진 함수를 run_count 회 실행하여 각 실행 시간(ms)을 반환합니다.
+    """
+    timings = []
+    for _ in range(run_count):
+        start_time = time.perf_counter()
+        func(**kwargs)
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return timings
+
+
+def print_stats(label: str, timings: list):
+    print(f"[{label}] 평균: {np.mean(timings):.3f} ms, p50: {np.percentile(timings, 50):.3f} ms, "
+          f"p95: {np.percentile(timings, 95):.3f} ms, 최대: {np.max(timings):.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로파일링 그래프 요청당 컴파일 오버헤드 벤치마크")
+    parser.add_argument("--runs", type=int, default=RUN_COUNT, help="반복 횟수")
+    parser.add_argument("--render", action="store_true", help="기존 경로에 Mermaid PNG 렌더링 포함 (네트워크 필요)")
+    args = parser.parse_args()
+
+    print(f"--- 요청당 그래프 준비 오버헤드 ({args.runs}회) ---")
+    before = measure(per_request_compile, args.runs, render=args.render)
+
+    # 레지스트리는 lifespan처럼 한 번 초기화한 뒤 조회만 측정합니다.
+    clear_graph_registry()
+    start_time = time.perf_counter()
+    get_profiling_graph()
+    startup_ms = (time.perf_counter() - start_time) * 1000
+    after = measure(registry_lookup, args.runs)
+
+    print_stats("변경 전: 요청마다 컴파일", before)
+    print_stats("변경 후: 레지스트리 조회", after)
+    print(f"레지스트리 1회 초기화 비용 (시작 시): {startup_ms:.3f} ms")
+    print(f"요청당 절감 시간 (평균): {np.mean(before) - np.mean(after):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
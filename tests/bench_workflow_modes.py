@@ -0,0 +1,90 @@
+import sys
+import os
+import json
+import time
+import glob
+import asyncio
+import argparse
+import numpy as np # 통계 계산을 위해 numpy 사용
+
+# 모드 간 비교가 캐시 적중에 왜곡되지 않도록 캐시를 끈 상태로 모듈을 임포트합니다.
+os.environ.setdefault('PROFILE_CACHE_ENABLED', 'false')
+os.environ.setdefault('LLM_CACHE_ENABLED', 'false')
+
+# 프로젝트 루트를 sys.path에 추가하여 절대 임포트가 가능하도록 합니다.
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from langchain_community.callbacks import get_openai_callback
+
+from searchright_technical_assignment.db.conn import engine
+from searchright_technical_assignment.schema.talent_dto import TalentIn
+from searchright_technical_assignment.workflows.graph_registry import build_profiling_graph
+from searchright_technical_assignment.workflows.profiling_runner import run_profiling
+from searchright_technical_assignment.workflows.profiling_workflow import WORKFLOW_MODE_FANOUT, WORKFLOW_MODE_COMBINED
+
+# 벤치마크 설정
+RUN_COUNT = 3  # 지원자별 반복 횟수
+TALENT_GLOB = os.path.join(project_root, 'example_datas', 'talent_ex*.json')
+
+
+def load_talents(pattern: str):
+    talents = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding='utf-8') as f:
+            talents.append((os.path.basename(path), TalentIn(**json.load(f))))
+    return talents
+
+
+async def measure_mode(mode: str, talents: list, run_count: int):
+    """
+    주어진 워크플로우 모드로 각 지원자를 run_count 회 프로파일링하여 지연 시간(ms), 토큰 수, 비용을 측정합니다.
+    """
+    app = build_profiling_graph(mode=mode)
+    timings, prompt_tokens, completion_tokens, costs, llm_calls = [], [], [], [], []
+    for _, talent in talents:
+        for _ in range(run_count):
+            with get_openai_callback() as cb:
+                start_time = time.perf_counter()
+                await run_profiling(talent, app=app)
+                timings.append((time.perf_counter() - start_time) * 1000)
+            prompt_tokens.append(cb.prompt_tokens)
+            completion_tokens.append(cb.completion_tokens)
+            costs.append(cb.total_cost)
+            llm_calls.append(cb.successful_requests)
+    return {"timings": timings, "prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+            "costs": costs, "llm_calls": llm_calls}
+
+
+def print_stats(label: str, result: dict):
+    timings = result["timings"]
+    print(f"[{label}] 지연 시간 평균: {np.mean(timings):.1f} ms, p50: {np.percentile(timings, 50):.1f} ms, "
+          f"p95: {np.percentile(timings, 95):.1f} ms")
+    print(f"[{label}] 요청당 LLM 호출: {np.mean(result['llm_calls']):.1f}회, "
+          f"입력 토큰: {np.mean(result['prompt_tokens']):.0f}, 출력 토큰: {np.mean(result['completion_tokens']):.0f}, "
+          f"비용: ${np.mean(result['costs']):.5f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="프로파일링 워크플로우 모드별(fanout: 노드별 LLM 호출, combined: 통합 호출) 지연 시간/토큰/비용 벤치마크")
+    parser.add_argument("--runs", type=int, default=RUN_COUNT, help="지원자별 반복 횟수")
+    parser.add_argument("--talents", default=TALENT_GLOB, help="지원자 JSON 파일 glob 패턴")
+    args = parser.parse_args()
+
+    talents = load_talents(args.talents)
+    print(f"--- 워크플로우 모드 비교 (지원자 {len(talents)}명 x {args.runs}회, DB/벤더 API 필요) ---")
+    results = {}
+    for mode in (WORKFLOW_MODE_FANOUT, WORKFLOW_MODE_COMBINED):
+        results[mode] = await measure_mode(mode, talents, args.runs)
+        print_stats(mode, results[mode])
+
+    fanout, combined = results[WORKFLOW_MODE_FANOUT], results[WORKFLOW_MODE_COMBINED]
+    print(f"통합 호출의 평균 지연 시간 변화: {np.mean(combined['timings']) - np.mean(fanout['timings']):+.1f} ms")
+    print(f"통합 호출의 평균 토큰 변화: "
+          f"{np.mean(combined['prompt_tokens']) + np.mean(combined['completion_tokens']) - np.mean(fanout['prompt_tokens']) - np.mean(fanout['completion_tokens']):+.0f}")
+    print(f"통합 호출의 평균 비용 변화: ${np.mean(combined['costs']) - np.mean(fanout['costs']):+.5f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
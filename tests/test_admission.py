@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+
+from searchright_technical_assignment.util.admission import (
+    AdmissionController, AdmissionRejected, REJECT_QUEUE_FULL, REJECT_WAIT_TOO_LONG, REJECT_DEADLINE
+)
+
+class TestAdmissionController(unittest.IsolatedAsyncioTestCase):
+
+    async def _hold(self, controller, gate):
+        async with controller.admit():
+            await gate.wait()
+
+    async def test_rejects_when_queue_is_full(self):
+        controller = AdmissionController(max_concurrency=1, max_queue=1, max_estimated_wait_seconds=100)
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(self._hold(controller, gate)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        self.assertEqual((controller.in_flight, controller.queued), (1, 1))
+        with self.assertRaises(AdmissionRejected) as ctx:
+            async with controller.admit():
+                pass
+        self.assertEqual(ctx.exception.reason, REJECT_QUEUE_FULL)
+        self.assertGreaterEqual(ctx.exception.retry_after, 1)
+
+        gate.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(controller.stats()["admitted"], 2)
+        self.assertEqual(controller.stats()["rejected"][REJECT_QUEUE_FULL], 1)
+
+    async def test_rejects_when_estimated_wait_is_too_long(self):
+        controller = AdmissionController(max_concurrency=1, max_queue=10, max_estimated_wait_seconds=5,
+                                         initial_service_time_seconds=3)
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(self._hold(controller, gate)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        # 실행 중 1건, 대기 1건 → 새 요청의 예상 대기 시간은 6초
+        with self.assertRaises(AdmissionRejected) as ctx:
+            async with controller.admit():
+                pass
+        self.assertEqual(ctx.exception.reason, REJECT_WAIT_TOO_LONG)
+        self.assertEqual(ctx.exception.retry_after, 6)
+
+        gate.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual((controller.in_flight, controller.queued), (0, 0))
+
+    async def test_wait_is_bounded_by_remaining_budget(self):
+        controller = AdmissionController(max_concurrency=1, max_queue=10, max_estimated_wait_seconds=100,
+                                         initial_service_time_seconds=3)
+        gate = asyncio.Event()
+        task = asyncio.create_task(self._hold(controller, gate))
+        await asyncio.sleep(0)
+
+        # 예상 대기 시간(3초)이 남은 예산(1초)보다 길면 기다리지 않고 거절
+        with self.assertRaises(AdmissionRejected) as ctx:
+            async with controller.admit(max_wait_seconds=1):
+                pass
+        self.assertEqual(ctx.exception.reason, REJECT_DEADLINE)
+
+        # 예상보다 오래 걸려 남은 예산 안에 슬롯을 얻지 못해도 거절
+        controller.service_time = 0.01
+        with self.assertRaises(AdmissionRejected) as ctx:
+            async with controller.admit(max_wait_seconds=0.05):
+                pass
+        self.assertEqual(ctx.exception.reason, REJECT_DEADLINE)
+        self.assertEqual(controller.queued, 0)
+
+        gate.set()
+        await task
+        async with controller.admit(max_wait_seconds=0):
+            pass
+        self.assertEqual(controller.stats()["rejected"][REJECT_DEADLINE], 2)
+
+if __name__ == '__main__':
+    unittest.main()
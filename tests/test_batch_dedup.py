@@ -0,0 +1,88 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+from searchright_technical_assignment.node.profiling_node import college_level
+from searchright_technical_assignment.state.profiling_state import ProfilingState
+from searchright_technical_assignment.util import llm_cache
+from searchright_technical_assignment.util.batch_dedup import BatchDeduplicator, dedup, dedup_scope
+
+class TestBatchDedup(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        # 프로세스 단위 LLM 응답 캐시가 다른 테스트의 결과를 돌려주지 않도록 비활성화합니다.
+        patcher = patch.object(llm_cache, "llm_cache", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_identical_keys_are_computed_once(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "결과"
+
+        with dedup_scope() as deduplicator:
+            results = await asyncio.gather(*[dedup('ns', 'key', compute) for _ in range(5)])
+
+        self.assertEqual(results, ["결과"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((deduplicator.hits, deduplicator.misses), (4, 1))
+
+    async def test_without_scope_runs_every_time(self):
+        factory = AsyncMock(return_value=1)
+        await dedup('ns', 'key', factory)
+        await dedup('ns', 'key', factory)
+        self.assertEqual(factory.await_count, 2)
+
+    async def test_nested_scope_reuses_outer(self):
+        outer = BatchDeduplicator()
+        with dedup_scope(outer):
+            with dedup_scope() as inner:
+                self.assertIs(inner, outer)
+
+    async def test_failures_are_shared(self):
+        async def fail():
+            raise RuntimeError("boom")
+
+        with dedup_scope():
+            results = await asyncio.gather(dedup('ns', 'k', fail), dedup('ns', 'k', fail), return_exceptions=True)
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    async def test_failure_is_not_replayed_to_later_callers(self):
+        factory = AsyncMock(side_effect=[RuntimeError("일시적 DB 오류"), "결과"])
+
+        with dedup_scope():
+            with self.assertRaises(RuntimeError):
+                await dedup('ns', 'k', factory)
+            self.assertEqual(await dedup('ns', 'k', factory), "결과")
+
+    async def test_completed_entries_are_bounded(self):
+        deduplicator = BatchDeduplicator(max_entries=2)
+        with dedup_scope(deduplicator):
+            for key in ['a', 'b', 'a', 'c']:
+                await dedup('ns', key, AsyncMock(return_value=key))
+
+        # 가장 오래 사용되지 않은 'b'가 제거되고 최근에 재사용한 'a'는 남습니다.
+        self.assertEqual(list(deduplicator._tasks), [('ns', 'a'), ('ns', 'c')])
+        self.assertEqual(deduplicator.evictions, 1)
+
+    async def test_college_level_shared_across_candidates(self):
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.return_value = "상위권대학교"
+
+        mock_prompt_template = MagicMock()
+        mock_prompt_template.__or__.return_value.__or__.return_value = mock_chain
+
+        states = [ProfilingState(college="테스트대학교", skills=[], titles=[], companynames_and_dates=[], descriptions=[])
+                  for _ in range(3)]
+
+        with dedup_scope():
+            results = await asyncio.gather(*[college_level(state, mock_prompt_template) for state in states])
+
+        self.assertEqual(results, [{'college_level': '상위권대학교'}] * 3)
+        mock_chain.ainvoke.assert_called_once_with({'college': '테스트대학교'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from typing import TypedDict
+from unittest.mock import patch
+
+from langgraph.graph import StateGraph, END
+
+from searchright_technical_assignment.schema.talent_dto import TalentIn
+from searchright_technical_assignment.state.profiling_state import ProfilingState
+from searchright_technical_assignment.util.checkpointer import BoundedMemorySaver, open_checkpointer, close_checkpointer
+from searchright_technical_assignment.workflows import graph_registry, profile_cache
+from searchright_technical_assignment.workflows.graph_registry import build_profiling_graph, make_graph_config, PROFILING_CHECKPOINTED_GRAPH
+from searchright_technical_assignment.workflows.profiling_runner import run_profiling
+
+class CounterState(TypedDict):
+    value: int
+
+def _increment(state: CounterState):
+    return {'value': state['value'] + 1}
+
+def _build_counter_graph(checkpointer):
+    workflow = StateGraph(CounterState)
+    workflow.add_node("increment", _increment)
+    workflow.set_entry_point("increment")
+    workflow.add_edge("increment", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestBoundedMemorySaver(unittest.IsolatedAsyncioTestCase):
+
+    async def test_evicts_least_recently_used_threads(self):
+        saver = BoundedMemorySaver(max_threads=2, ttl_seconds=None)
+        app = _build_counter_graph(saver)
+
+        for thread_id in ["t1", "t2", "t3"]:
+            await app.ainvoke({'value': 0}, {"configurable": {"thread_id": thread_id}})
+
+        self.assertEqual(saver.thread_count, 2)
+        self.assertNotIn("t1", saver.storage)
+        self.assertFalse(any(key[0] == "t1" for key in saver.blobs))
+        self.assertFalse(any(key[0] == "t1" for key in saver.writes))
+        self.assertEqual(saver.evicted_threads, 1)
+
+    async def test_evicts_expired_threads(self):
+        clock = FakeClock()
+        saver = BoundedMemorySaver(max_threads=100, ttl_seconds=10, clock=clock)
+        app = _build_counter_graph(saver)
+
+        await app.ainvoke({'value': 0}, {"configurable": {"thread_id": "old"}})
+        clock.now = 60.0
+        await app.ainvoke({'value': 0}, {"configurable": {"thread_id": "new"}})
+
+        self.assertEqual(list(saver.storage), ["new"])
+
+    async def test_open_checkpointer_modes(self):
+        self.assertIsNone(await open_checkpointer('none'))
+        self.assertIsInstance(await open_checkpointer('memory'), BoundedMemorySaver)
+        await close_checkpointer()
+        with self.assertRaises(ValueError):
+            await open_checkpointer('unknown')
+
+    def test_stateless_graph_config_has_no_thread_id(self):
+        stateless = build_profiling_graph()
+        checkpointed = build_profiling_graph(BoundedMemorySaver())
+
+        self.assertNotIn("configurable", make_graph_config(stateless))
+        self.assertEqual(make_graph_config(checkpointed, thread_id="abc")["configurable"]["thread_id"], "abc")
+
+class TestResumableProfiling(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.calls = {"college_level": 0, "company_size": 0}
+        self.fail_company_size = True
+
+        def college_level(state):
+            self.calls["college_level"] += 1
+            return {'college_level': '상위권대학교'}
+
+        def company_size(state):
+            self.calls["company_size"] += 1
+            if self.fail_company_size:
+                raise RuntimeError("LLM 오류")
+            return {'company_size_and_reason': []}
+
+        def combine(state):
+            return {'profile': {state['college_level']: state['college']}}
+
+        workflow = StateGraph(ProfilingState)
+        workflow.add_node("college_level", college_level)
+        workflow.add_node("company_size", company_size)
+        workflow.add_node("combine", combine)
+        workflow.set_entry_point("college_level")
+        workflow.add_edge("college_level", "company_size")
+        workflow.add_edge("company_size", "combine")
+        workflow.add_edge("combine", END)
+
+        for patcher in (patch.dict(graph_registry._compiled_graphs, {PROFILING_CHECKPOINTED_GRAPH: workflow.compile(checkpointer=BoundedMemorySaver())}),
+                        patch.object(profile_cache, "profile_cache", None)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_failed_run_resumes_without_rerunning_completed_nodes(self):
+        item = TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=["Go"], positions=[])
+
+        with self.assertRaises(RuntimeError):
+            await run_profiling(item, thread_id="t1")
+
+        self.fail_company_size = False
+        outputs = await run_profiling(item, thread_id="t1")
+
+        self.assertEqual(outputs['profile'], {'상위권대학교': '서울대학교'})
+        self.assertEqual(self.calls, {"college_level": 1, "company_size": 2})
+
+        # 완료된 thread는 그래프를 다시 실행하지 않고 체크포인트의 결과를 반환합니다.
+        await run_profiling(item, thread_id="t1")
+        self.assertEqual(self.calls, {"college_level": 1, "company_size": 2})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+
+from langgraph.graph import StateGraph, END
+
+from searchright_technical_assignment.node.profiling_node import combine
+from searchright_technical_assignment.schema.response_dto import CompanySizeItem
+from searchright_technical_assignment.schema.talent_dto import TalentIn
+from searchright_technical_assignment.state.profiling_state import ProfilingState
+from searchright_technical_assignment.util.deadline import deadline_node, deadline_scope
+from searchright_technical_assignment.workflows.profiling_runner import run_profiling, stream_profiling
+
+async def _college_level(state):
+    return {'college_level': '상위권대학교'}
+
+async def _leadership(state):
+    await asyncio.sleep(0.01)
+    return {'leadership': '리더쉽', 'leadership_reason': ['팀장']}
+
+async def _company_size(state):
+    await asyncio.sleep(1)
+    return {'company_size_and_reason': [CompanySizeItem(company_size="대규모 회사 경험", reasons=["네이버"])]}
+
+async def _experience(state):
+    return {'experience_and_reason': []}
+
+def _build_fake_graph():
+    workflow = StateGraph(ProfilingState)
+    workflow.add_node("input", lambda state: state)
+    for node, func in [("college_level", _college_level), ("leadership", _leadership),
+                       ("company_size", _company_size), ("experience", _experience)]:
+        workflow.add_node(node, deadline_node(node, func))
+        workflow.add_edge("input", node)
+        workflow.add_edge(node, "combine")
+    workflow.add_node("combine", combine)
+    workflow.add_edge("combine", END)
+    workflow.set_entry_point("input")
+    return workflow.compile()
+
+def _item(budget_ms=None):
+    return TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=[], positions=[],
+                    latency_budget_ms=budget_ms)
+
+class TestDeadline(unittest.IsolatedAsyncioTestCase):
+
+    async def test_slow_node_is_dropped_within_budget(self):
+        start = asyncio.get_running_loop().time()
+        outputs = await run_profiling(_item(budget_ms=200), app=_build_fake_graph())
+
+        self.assertLess(asyncio.get_running_loop().time() - start, 0.5)
+        self.assertEqual(outputs['missing_dimensions'], ['company_size'])
+        self.assertEqual(outputs['profile'], {'상위권대학교': '서울대학교', '리더쉽': ['팀장']})
+
+    async def test_stream_reports_missing_dimensions(self):
+        updates = [update async for update in stream_profiling(_item(budget_ms=200), app=_build_fake_graph())]
+
+        self.assertTrue(updates[-1]["final"])
+        self.assertEqual(updates[-1]["missing_dimensions"], ['company_size'])
+
+    async def test_without_budget_all_nodes_complete(self):
+        graph = _build_fake_graph()
+        outputs = await run_profiling(_item(), app=graph)
+
+        self.assertEqual(outputs['missing_dimensions'], [])
+        self.assertIn('대규모 회사 경험', outputs['profile'])
+
+    async def test_combined_node_timeout_marks_all_dimensions(self):
+        node = deadline_node("combined_profile", _company_size, dimensions=["college_level", "company_size"])
+        with deadline_scope(150):
+            result = await node({})
+
+        self.assertEqual(result, {'missing_dimensions': ["college_level", "company_size"]})
+
+    async def test_outer_deadline_is_reused(self):
+        # 라우터가 수락 제어 전에 연 마감 시각을 그래프 실행이 새로 시작하지 않고 이어서 사용합니다.
+        with deadline_scope(150) as outer:
+            await asyncio.sleep(0.1)
+            with deadline_scope(150) as inner:
+                self.assertEqual(inner, outer)
+            outputs = await run_profiling(_item(budget_ms=150), app=_build_fake_graph())
+
+        # 새 예산(150ms)이었다면 완료됐을 leadership 노드도 남은 예산이 없어 제외됩니다.
+        self.assertIn('leadership', outputs['missing_dimensions'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import patch
+
+from searchright_technical_assignment.prompt.profiling_prompt import leadership_prompt, experience_prompt
+from searchright_technical_assignment.schema.response_dto import LeadershipResponse, ExperienceResponse, CompanySizeResponse
+from searchright_technical_assignment.util import fake_llm, llm_router, embedding
+from searchright_technical_assignment.util.fake_llm import LatencyDistribution, fake_instance
+from searchright_technical_assignment.util.llm_cascade import with_confidence, LARGE_COMPANY, GROWTH_STARTUP
+from searchright_technical_assignment.util.llm_router import ModelRouter, LLMUsageStats, LLMUsageCallback
+from searchright_technical_assignment.util.openai_provider import OpenAIProvider
+
+class TestFakeLLMBackend(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.provider = OpenAIProvider(backend='fake')
+        for patcher in (patch.object(fake_llm, 'FAKE_LLM_LATENCY', 'none'),
+                        patch.object(fake_llm, 'FAKE_EMBEDDING_LATENCY', 'none'),
+                        patch.object(llm_router, 'openai_provider', self.provider)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_routed_structured_output_is_schema_valid_and_deterministic(self):
+        router = ModelRouter()
+        inputs = {'skills': ['멘토링'], 'titles': ['개발팀장']}
+
+        first = await (leadership_prompt | router.structured('leadership', LeadershipResponse)).ainvoke(inputs)
+        second = await (leadership_prompt | router.structured('leadership', LeadershipResponse)).ainvoke(inputs)
+
+        self.assertIsInstance(first, LeadershipResponse)
+        self.assertIn(first.leadership, ('리더쉽', '리더쉽경험없음'))
+        self.assertEqual(first, second)
+
+        experience = await (experience_prompt | router.structured('experience', ExperienceResponse)).ainvoke(
+            {'descriptions': ['검색 서비스 개발'], 'grouped_company_data': []})
+        self.assertEqual(len(experience.experience_and_reason), 1)
+
+    async def test_usage_callback_receives_fake_token_usage(self):
+        stats = LLMUsageStats()
+        model = self.provider.chat_model(model='gpt-4o-mini', callbacks=[LLMUsageCallback('gpt-4o-mini', stats)])
+
+        await model.ainvoke("서울대학교")
+
+        usage = stats.snapshot()['-']['gpt-4o-mini']
+        self.assertEqual(usage['calls'], 1)
+        self.assertEqual(usage['completion_tokens'], fake_llm.FAKE_LLM_COMPLETION_TOKENS)
+
+    async def test_embeddings_are_deterministic_vectors(self):
+        vectors = await self.provider.embeddings().aembed_documents(["회사 뉴스", "회사 뉴스"])
+
+        self.assertEqual(len(vectors[0]), 1536)
+        self.assertEqual(vectors[0], vectors[1])
+
+        with patch.object(embedding, 'openai_provider', self.provider), patch.dict(embedding.embedding_cache, clear=True):
+            generated = await embedding.generate_embedding(["회사 뉴스"])
+        self.assertEqual(generated, [vectors[0]])
+
+class TestFakeResponses(unittest.TestCase):
+
+    def test_fake_instance_uses_valid_labels(self):
+        answer = fake_instance(with_confidence(CompanySizeResponse), "key")
+
+        self.assertIn(answer.company_size_and_reason[0].company_size, (LARGE_COMPANY, GROWTH_STARTUP))
+        self.assertEqual(answer.confidence, 0.9)
+
+    def test_latency_distributions(self):
+        self.assertEqual(LatencyDistribution('fixed:0.1').sample(), 0.1)
+        self.assertTrue(0.05 <= LatencyDistribution('uniform:0.05,0.2').sample() <= 0.2)
+        self.assertGreater(LatencyDistribution('lognormal:0.8,0.4').sample(), 0)
+        with self.assertRaises(ValueError):
+            LatencyDistribution('gamma:1')
+
+if __name__ == '__main__':
+    unittest.main()
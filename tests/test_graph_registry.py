@@ -0,0 +1,40 @@
+import unittest
+
+from searchright_technical_assignment.workflows.graph_registry import (
+    get_profiling_graph, init_graph_registry, clear_graph_registry, build_profiling_graph
+)
+
+class TestGraphRegistry(unittest.TestCase):
+
+    def tearDown(self):
+        clear_graph_registry()
+
+    def test_graph_is_compiled_once(self):
+        init_graph_registry()
+        first = get_profiling_graph()
+        second = get_profiling_graph()
+
+        self.assertIs(first, second)
+        self.assertTrue({"input", "college_level", "leadership", "company_size", "experience", "combine"}
+                        <= set(first.get_graph().nodes))
+
+    def test_lazy_compile_without_lifespan(self):
+        clear_graph_registry()
+        app = get_profiling_graph()
+
+        self.assertIsNotNone(app)
+        self.assertIs(app, get_profiling_graph())
+
+    def test_combined_mode_uses_single_profile_node(self):
+        app = build_profiling_graph(mode="combined")
+
+        nodes = set(app.get_graph().nodes)
+        self.assertIn("combined_profile", nodes)
+        self.assertFalse({"college_level", "leadership", "company_size", "experience"} & nodes)
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            build_profiling_graph(mode="unknown")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import MagicMock
+
+from searchright_technical_assignment.node.profiling_node import leadership
+from searchright_technical_assignment.state.profiling_state import ProfilingState
+from searchright_technical_assignment.util.leadership_rules import match_leadership, LEADERSHIP, NO_LEADERSHIP
+
+class TestLeadershipRules(unittest.IsolatedAsyncioTestCase):
+
+    def test_leader_titles_are_decided_without_llm(self):
+        answer = match_leadership(["Python"], ["백엔드 개발자", "테크 리드", "CTO", "Head of Engineering"])
+        self.assertEqual(answer.leadership, LEADERSHIP)
+        self.assertEqual(answer.reason, ["테크 리드", "CTO", "Head of Engineering"])
+
+        self.assertEqual(match_leadership([], ["공동창업자"]).reason, ["공동창업자"])
+
+    def test_no_leadership_evidence(self):
+        answer = match_leadership(["Python", "Django"], ["Software Engineer", "백엔드 개발자"])
+        self.assertEqual((answer.leadership, answer.reason), (NO_LEADERSHIP, ["없음"]))
+
+    def test_borderline_cases_fall_back_to_llm(self):
+        self.assertIsNone(match_leadership([], ["Product Manager"]))
+        self.assertIsNone(match_leadership(["팀 리더십"], ["Software Engineer"]))
+        self.assertIsNone(match_leadership([], ["Lead Generation Specialist"]))
+        self.assertIsNone(match_leadership([], ["팀장 비서"]))
+
+    def test_common_korean_leader_titles(self):
+        for title in ["영업부장", "연구소장", "강남지점장", "편집국장", "원장"]:
+            self.assertEqual(match_leadership([], [title]).reason, [title])
+
+    def test_unlisted_titles_fall_back_to_llm(self):
+        self.assertIsNone(match_leadership([], ["Founding Engineer"]))
+        self.assertIsNone(match_leadership([], ["백엔드 개발자", "크리에이터"]))
+        self.assertIsNone(match_leadership([], ["차장"]))
+
+    def test_partial_words_do_not_match(self):
+        self.assertEqual(match_leadership([], ["Headquarters Support Engineer", "Leading-edge Researcher"]).leadership, NO_LEADERSHIP)
+        self.assertEqual(match_leadership([], ["리드타임 개선 엔지니어"]).leadership, NO_LEADERSHIP)
+
+    def test_korean_leader_terms_match_only_at_word_end(self):
+        # '리더십'은 애매한 용어이므로 '리더'로 판단하지 않고 LLM으로 넘깁니다.
+        self.assertIsNone(match_leadership([], ["리더십 교육 담당"]))
+        self.assertIsNone(match_leadership([], ["리더십팀 매니저"]))
+
+        answer = match_leadership([], ["리더십 교육 담당", "백엔드 파트 리더", "개발팀장"])
+        self.assertEqual(answer.reason, ["백엔드 파트 리더", "개발팀장"])
+
+    async def test_node_skips_llm_for_clear_titles(self):
+        mock_prompt = MagicMock()
+        state = ProfilingState(college="", skills=[], titles=["개발팀장"], companynames_and_dates=[], descriptions=[])
+
+        result = await leadership(state, mock_prompt)
+
+        self.assertEqual(result, {'leadership': LEADERSHIP, 'leadership_reason': ["개발팀장"]})
+        mock_prompt.__or__.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
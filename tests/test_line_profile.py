@@ -2,6 +2,7 @@ import sys
 import os
 import asyncio
 import json
+from contextlib import asynccontextmanager
 from line_profiler import LineProfiler
 from unittest.mock import patch, AsyncMock # patch와 AsyncMock 임포트
 
@@ -11,23 +12,15 @@ from unittest.mock import patch, AsyncMock # patch와 AsyncMock 임포트
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
+# LLM/임베딩 호출은 네트워크 없이 가짜 백엔드(util/fake_llm.py)로 실행합니다. (모듈 임포트 전에 설정)
+os.environ.setdefault('LLM_BACKEND', 'fake')
+
 # 프로파일링할 모듈과 필요한 DTO, PromptTemplate 임포트
 from searchright_technical_assignment.node import profiling_node
 from searchright_technical_assignment.state.profiling_state import ProfilingState
 from langchain_core.prompts import PromptTemplate # Mock prompt에 필요
 
-# --- PGVector 및 관련 함수들을 모의(Mock)하는 더미 클래스/함수 ---
-class MockRetriever:
-    def get_relevant_documents(self, keyword):
-        return []
-
-class MockPGVector:
-    def __init__(self, *args, **kwargs):
-        pass
-
-    def as_retriever(self, *args, **kwargs):
-        return MockRetriever()
-
+# --- 뉴스 벡터 검색을 모의(Mock)하는 더미 함수 ---
 async def mock_search_by_keyword(*args, **kwargs):
     return []
 # --- 모의 끝 ---
@@ -54,6 +47,7 @@ class MockCompanyDAO:
             ('우아한형제들', {'products': [{'name': '배달의민족'}]})
         ]
 
+@asynccontextmanager
 async def mock_get_db():
     yield MockDBSession()
 # --- 모의 끝 ---
@@ -139,36 +133,35 @@ async def run_profiling_test():
     lp.add_function(profiling_node.experience)
     lp.add_function(profiling_node.combine)
 
-    # PGVector, DB, CompanyDAO 관련 객체들을 모의(Mock)하여 외부 의존성 제거
-    with patch('searchright_technical_assignment.retriever.pgvector.PGVector', new=MockPGVector):
-        with patch('searchright_technical_assignment.retriever.pgvector.search_by_keyword', new=mock_search_by_keyword):
-            with patch('searchright_technical_assignment.db.conn.get_db', new=mock_get_db):
-                with patch('searchright_technical_assignment.crud.company_dao.CompanyDAO', new=MockCompanyDAO):
+    # 뉴스 검색, DB, CompanyDAO 관련 객체들을 모의(Mock)하여 외부 의존성 제거 (LLM은 가짜 백엔드 사용)
+    with patch.object(profiling_node, 'search_by_keyword', new=mock_search_by_keyword):
+        with patch.object(profiling_node, 'get_db', new=mock_get_db):
+            with patch.object(profiling_node, 'CompanyDAO', new=MockCompanyDAO):
 
-                    # 프로파일링 시작
-                    lp.enable_by_count()
+                # 프로파일링 시작
+                lp.enable_by_count()
 
-                    # 각 노드 함수 호출
-                    college_result = await profiling_node.college_level(test_state, mock_prompt)
-                    test_state.update(college_result)
+                # 각 노드 함수 호출
+                college_result = await profiling_node.college_level(test_state, mock_prompt)
+                test_state.update(college_result)
 
-                    leadership_result = await profiling_node.leadership(test_state, mock_leadership_prompt)
-                    test_state.update(leadership_result)
+                leadership_result = await profiling_node.leadership(test_state, mock_leadership_prompt)
+                test_state.update(leadership_result)
 
-                    company_size_result = await profiling_node.company_size(test_state, mock_company_size_prompt)
-                    test_state.update(company_size_result)
+                company_size_result = await profiling_node.company_size(test_state, mock_company_size_prompt)
+                test_state.update(company_size_result)
 
-                    experience_result = await profiling_node.experience(test_state, mock_experience_prompt)
-                    test_state.update(experience_result)
+                experience_result = await profiling_node.experience(test_state, mock_experience_prompt)
+                test_state.update(experience_result)
 
-                    combine_result = profiling_node.combine(test_state)
-                    test_state.update(combine_result)
+                combine_result = profiling_node.combine(test_state)
+                test_state.update(combine_result)
 
-                    print("--- 최종 프로파일링 결과 (test_line_profile.py) ---")
-                    print(test_state['profile'])
+                print("--- 최종 프로파일링 결과 (test_line_profile.py) ---")
+                print(test_state['profile'])
 
-                    # 프로파일링 종료
-                    lp.disable_by_count()
+                # 프로파일링 종료
+                lp.disable_by_count()
 
     # 프로파일링 통계 출력
     lp.print_stats()
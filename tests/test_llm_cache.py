@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.prompts import PromptTemplate
+
+from searchright_technical_assignment.node.profiling_node import leadership
+from searchright_technical_assignment.schema.response_dto import LeadershipResponse
+from searchright_technical_assignment.state.profiling_state import ProfilingState
+from searchright_technical_assignment.util import llm_cache
+from searchright_technical_assignment.util.cache import LRUTTLCache, SqliteCache, TieredCache
+
+_PROMPT = PromptTemplate(template="{skills} {titles}", input_variables=["skills", "titles"])
+
+class TestLLMCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        patcher = patch.object(llm_cache, "llm_cache", TieredCache(LRUTTLCache()))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_structured_answer_is_restored_from_cache(self):
+        factory = AsyncMock(return_value=LeadershipResponse(leadership="리더쉽", reason=["CTO"]))
+        inputs = {'skills': [], 'titles': ['CTO']}
+
+        first = await llm_cache.cached_llm_call('leadership', 'gpt-4o', _PROMPT, inputs, factory, LeadershipResponse)
+        second = await llm_cache.cached_llm_call('leadership', 'gpt-4o', _PROMPT, inputs, factory, LeadershipResponse)
+
+        factory.assert_awaited_once()
+        self.assertIsInstance(second, LeadershipResponse)
+        self.assertEqual(first, second)
+
+    def test_key_depends_on_model_prompt_and_inputs(self):
+        inputs = {'skills': [], 'titles': ['CTO']}
+        other_prompt = PromptTemplate(template="{titles}: {skills}", input_variables=["skills", "titles"])
+        key = llm_cache.llm_cache_key('leadership', 'gpt-4o', _PROMPT, inputs, LeadershipResponse)
+
+        self.assertEqual(key, llm_cache.llm_cache_key('leadership', 'gpt-4o', _PROMPT, dict(inputs), LeadershipResponse))
+        self.assertNotEqual(key, llm_cache.llm_cache_key('leadership', 'gpt-4o-mini', _PROMPT, inputs, LeadershipResponse))
+        self.assertNotEqual(key, llm_cache.llm_cache_key('leadership', 'gpt-4o', other_prompt, inputs, LeadershipResponse))
+        self.assertNotEqual(key, llm_cache.llm_cache_key('leadership', 'gpt-4o', _PROMPT, {'skills': [], 'titles': ['팀장']}, LeadershipResponse))
+
+    def test_node_ttl_override(self):
+        self.assertEqual(llm_cache.node_ttl_seconds('company_size'), 86400)
+        with patch.dict(os.environ, {'LLM_CACHE_TTL_SECONDS_COMPANY_SIZE': '60'}):
+            self.assertEqual(llm_cache.node_ttl_seconds('company_size'), 60)
+
+    async def test_sqlite_tier_stores_structured_answer(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "llm.sqlite")
+            factory = AsyncMock(return_value=LeadershipResponse(leadership="리더쉽", reason=["CTO"]))
+            with patch.object(llm_cache, "llm_cache", TieredCache(LRUTTLCache(), SqliteCache(path))) as cache:
+                await llm_cache.cached_llm_call('leadership', 'gpt-4o', _PROMPT, {'titles': ['CTO']}, factory, LeadershipResponse)
+                cache.disk.close()
+            with patch.object(llm_cache, "llm_cache", TieredCache(LRUTTLCache(), SqliteCache(path))) as cache:
+                answer = await llm_cache.cached_llm_call('leadership', 'gpt-4o', _PROMPT, {'titles': ['CTO']}, factory, LeadershipResponse)
+                cache.disk.close()
+
+        factory.assert_awaited_once()
+        self.assertEqual(answer.reason, ["CTO"])
+
+    async def test_leadership_node_calls_llm_once_for_identical_input(self):
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.return_value = LeadershipResponse(leadership="리더쉽", reason=["팀장"])
+        mock_prompt = MagicMock()
+        mock_prompt.template = "leadership prompt"
+        mock_prompt.__or__.return_value = mock_chain
+        state = ProfilingState(college="", skills=[], titles=["매니저"], companynames_and_dates=[], descriptions=[])
+
+        first = await leadership(state, mock_prompt)
+        second = await leadership(state, mock_prompt)
+
+        mock_chain.ainvoke.assert_called_once()
+        self.assertEqual(first, second)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+from langchain_core.runnables import RunnableLambda
+
+from searchright_technical_assignment.prompt.profiling_prompt import leadership_prompt, company_size_prompt
+from searchright_technical_assignment.schema.response_dto import LeadershipResponse, CompanySizeResponse, CompanySizeItem
+from searchright_technical_assignment.util.llm_cascade import LLMCascade, with_confidence, check_company_size
+
+class FakeRouter:
+    """
+    모델 이름별로 정해진 응답을 반환하는 모델 라우터 대역입니다.
+    """
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def structured_for_model(self, model, response_model, fallback=None):
+        def _answer(_):
+            self.calls.append(model)
+            return response_model.model_validate(self.answers[model])
+        return RunnableLambda(_answer)
+
+_LEADERSHIP_INPUTS = {'skills': ['멘토링'], 'titles': ['프로젝트 매니저']}
+
+class TestLLMCascade(unittest.IsolatedAsyncioTestCase):
+
+    def _cascade(self, answers):
+        router = FakeRouter(answers)
+        return LLMCascade(router=router, cheap_model='cheap', strong_model='strong', min_confidence=0.7,
+                          nodes=['leadership', 'company_size'], enabled=True), router
+
+    async def test_confident_cheap_answer_is_accepted(self):
+        cascade, router = self._cascade({'cheap': {'leadership': '리더쉽', 'reason': ['멘토링'], 'confidence': 0.9}})
+
+        answer = await cascade.ainvoke('leadership', leadership_prompt, _LEADERSHIP_INPUTS, LeadershipResponse)
+
+        self.assertIsInstance(answer, LeadershipResponse)
+        self.assertEqual(answer.reason, ['멘토링'])
+        self.assertEqual(router.calls, ['cheap'])
+        self.assertEqual(cascade.stats.snapshot()['leadership']['escalation_rate'], 0.0)
+
+    async def test_low_confidence_escalates(self):
+        cascade, router = self._cascade({
+            'cheap': {'leadership': '리더쉽', 'reason': ['멘토링'], 'confidence': 0.4},
+            'strong': {'leadership': '리더쉽경험없음', 'reason': ['없음']},
+        })
+
+        answer = await cascade.ainvoke('leadership', leadership_prompt, _LEADERSHIP_INPUTS, LeadershipResponse)
+
+        self.assertEqual(answer.leadership, '리더쉽경험없음')
+        self.assertEqual(router.calls, ['cheap', 'strong'])
+        self.assertEqual(cascade.stats.snapshot()['leadership']['reasons'], {'low_confidence': 1})
+
+    async def test_disagreement_with_title_rules_escalates(self):
+        cascade, router = self._cascade({
+            'cheap': {'leadership': '리더쉽경험없음', 'reason': ['없음'], 'confidence': 0.95},
+            'strong': {'leadership': '리더쉽', 'reason': ['팀장']},
+        })
+
+        answer = await cascade.ainvoke('leadership', leadership_prompt, {'skills': [], 'titles': ['개발팀장']}, LeadershipResponse)
+
+        self.assertEqual(answer.leadership, '리더쉽')
+        self.assertEqual(cascade.stats.snapshot()['leadership']['reasons'], {'disagreement': 1})
+
+    async def test_invalid_cheap_answer_escalates(self):
+        cascade, router = self._cascade({
+            'cheap': {'company_size_and_reason': [{'company_size': '중소기업', 'reasons': ['A']}], 'confidence': 0.9},
+            'strong': {'company_size_and_reason': [{'company_size': '대규모 회사 경험', 'reasons': ['네이버']}]},
+        })
+        inputs = {'companynames_and_dates': [], 'grouped_company_data': [], 'company_news_contents': {}}
+
+        answer = await cascade.ainvoke('company_size', company_size_prompt, inputs, CompanySizeResponse)
+
+        self.assertEqual(answer.company_size_and_reason[0].reasons, ['네이버'])
+        self.assertEqual(cascade.stats.snapshot()['company_size']['reasons'], {'invalid': 1})
+
+class TestCascadeChecks(unittest.TestCase):
+
+    def test_company_size_disagrees_with_db_organization(self):
+        answer = with_confidence(CompanySizeResponse)(
+            company_size_and_reason=[CompanySizeItem(company_size="성장기스타트업 경험", reasons=["조직 2배 확장"])], confidence=0.9)
+        inputs = {'grouped_company_data': [{'name': '네이버', 'investment': None, 'organization': {'value': 4000}}]}
+
+        self.assertEqual(check_company_size(answer, inputs), 'disagreement')
+
+    def test_company_size_normalizes_investment_level(self):
+        answer = with_confidence(CompanySizeResponse)(
+            company_size_and_reason=[CompanySizeItem(company_size="대규모 회사 경험", reasons=["대기업"])], confidence=0.9)
+
+        for level in ("Series A (추정)", "SERIES B", "Series-C", "Series B2"):
+            inputs = {'grouped_company_data': [{'name': '토스', 'investment': {'level': level}, 'organization': {'value': 120}}]}
+            self.assertEqual(check_company_size(answer, inputs), 'disagreement', level)
+
+        inputs = {'grouped_company_data': [{'name': '토스', 'investment': {'level': 'Seed (추정)'}, 'organization': {'value': 120}}]}
+        self.assertIsNone(check_company_size(answer, inputs))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from searchright_technical_assignment.prompt.profiling_prompt import leadership_prompt
+from searchright_technical_assignment.schema.response_dto import LeadershipResponse
+from searchright_technical_assignment.util.llm_cassette import Cassette, CassetteEmbeddings, CassetteMiss
+
+_INPUTS = {'skills': ['멘토링'], 'titles': ['개발팀장']}
+
+class TestCassette(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'cassette.jsonl')
+
+    async def test_recorded_llm_calls_are_replayed_in_order(self):
+        recorder = Cassette(self.path, mode='record')
+        answers = [LeadershipResponse(leadership='리더쉽', reason=['팀장']),
+                   LeadershipResponse(leadership='리더쉽', reason=['개발팀장'])]
+        for answer in answers:
+            await recorder.llm_call('leadership', 'gpt-4o-mini', leadership_prompt, _INPUTS,
+                                    AsyncMock(return_value=answer), LeadershipResponse)
+
+        player = Cassette(self.path, mode='replay', replay_latency=False)
+        factory = AsyncMock()
+        replayed = [await player.llm_call('leadership', 'gpt-4o-mini', leadership_prompt, _INPUTS, factory, LeadershipResponse)
+                    for _ in range(3)]
+
+        self.assertEqual(replayed, answers + answers[-1:])
+        factory.assert_not_awaited()
+        self.assertEqual(player.stats()['hits'], 3)
+
+    async def test_replay_miss_raises(self):
+        player = Cassette(self.path, mode='replay', replay_latency=False)
+
+        with self.assertRaises(CassetteMiss):
+            await player.llm_call('leadership', 'gpt-4o-mini', leadership_prompt, _INPUTS, AsyncMock(), LeadershipResponse)
+
+    def test_query_embeddings_are_recorded_and_replayed(self):
+        inner = DeterministicFakeEmbedding(size=8)
+        vector = CassetteEmbeddings(inner, 'text-embedding-ada-002', Cassette(self.path, mode='record')).embed_query("네이버")
+
+        player = CassetteEmbeddings(None, 'text-embedding-ada-002', Cassette(self.path, mode='replay', replay_latency=False))
+
+        self.assertEqual(player.embed_query("네이버"), vector)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+
+from searchright_technical_assignment.util.llm_resilience import LLMResilience
+
+def _factory(*behaviours):
+    """
+    호출 순서대로 (대기 시간, 결과 또는 예외)를 수행하는 LLM 호출 대역을 만듭니다.
+    """
+    calls = []
+
+    def _make():
+        delay, outcome = behaviours[len([c for c in calls if c == 'started'])]
+        calls.append('started')
+
+        async def _call():
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                calls.append('cancelled')
+                raise
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return _call()
+    return _make, calls
+
+class TestLLMResilience(unittest.IsolatedAsyncioTestCase):
+
+    async def test_timeout_is_retried(self):
+        resilience = LLMResilience(retries=1, base_delay=0, timeout=lambda node: 0.05)
+        factory, _ = _factory((1, 'slow'), (0, 'fast'))
+
+        self.assertEqual(await resilience.ainvoke('leadership', factory), 'fast')
+
+        counters = resilience.snapshot()['leadership']
+        self.assertEqual((counters['timeouts'], counters['retries'], counters['errors']), (1, 1, 0))
+
+    async def test_non_transient_error_is_not_retried(self):
+        resilience = LLMResilience(retries=2, base_delay=0, timeout=lambda node: None)
+        factory, calls = _factory((0, ValueError("bad")), (0, 'unused'))
+
+        with self.assertRaises(ValueError):
+            await resilience.ainvoke('leadership', factory)
+        self.assertEqual(calls, ['started'])
+
+    async def test_hedge_after_observed_latency_wins_and_cancels_loser(self):
+        resilience = LLMResilience(retries=0, hedging=True, hedge_min_samples=1, hedge_min_delay=0.02,
+                                   timeout=lambda node: None)
+        warmup, _ = _factory((0, 'warmup'))
+        await resilience.ainvoke('experience', warmup)
+
+        factory, calls = _factory((1, 'stuck'), (0, 'hedged'))
+        self.assertEqual(await resilience.ainvoke('experience', factory), 'hedged')
+        await asyncio.sleep(0)
+
+        counters = resilience.snapshot()['experience']
+        self.assertEqual((counters['hedges_fired'], counters['hedges_won']), (1, 1))
+        self.assertIn('cancelled', calls)
+
+    async def test_no_hedge_without_enough_samples(self):
+        resilience = LLMResilience(retries=0, hedging=True, hedge_min_samples=5, timeout=lambda node: None)
+        factory, calls = _factory((0.05, 'primary'))
+
+        self.assertEqual(await resilience.ainvoke('experience', factory), 'primary')
+        self.assertEqual(resilience.snapshot()['experience']['hedges_fired'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import os
+import unittest
+import uuid
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.runnables import RunnableLambda
+
+from searchright_technical_assignment.util.llm_router import ModelRouter, LLMUsageCallback, LLMUsageStats, estimate_cost
+from searchright_technical_assignment.util.llm_resilience import node_call_timeout
+
+def _timeout(_):
+    raise asyncio.TimeoutError()
+
+class TestModelRouter(unittest.TestCase):
+
+    def test_node_model_defaults_and_env_override(self):
+        router = ModelRouter()
+
+        self.assertEqual(router.model_name('college_level'), 'gpt-4o-mini')
+        self.assertEqual(router.model_name('company_size'), 'gpt-4o')
+        self.assertEqual(router.fallback_model_name('college_level'), 'gpt-4o')
+        with patch.dict(os.environ, {'LLM_MODEL_COMPANY_SIZE': 'gpt-4.1', 'LLM_FALLBACK_MODEL_COMPANY_SIZE': 'none'}):
+            self.assertEqual(router.model_name('company_size'), 'gpt-4.1')
+            self.assertIsNone(router.fallback_model_name('company_size'))
+
+    def test_llm_is_shared_per_model(self):
+        router = ModelRouter()
+
+        self.assertIs(router.llm('gpt-4o-mini'), router.llm('gpt-4o-mini'))
+
+    def test_fallback_fits_inside_node_timeout(self):
+        llm = ModelRouter().llm('gpt-4o')
+
+        # 재시도는 노드 단위에서만 하고, 주 모델 시간 초과 후 대체 모델까지 노드 타임아웃 안에 시도됩니다.
+        self.assertEqual(llm.max_retries, 0)
+        self.assertLessEqual(2 * llm.request_timeout, node_call_timeout('company_size'))
+
+class TestModelRouterFallback(unittest.IsolatedAsyncioTestCase):
+
+    async def test_timeout_falls_back_to_alternate_model(self):
+        router = ModelRouter()
+        router._llms = {'gpt-4o-mini': RunnableLambda(_timeout), 'gpt-4o': RunnableLambda(lambda _: "상위권대학교")}
+
+        answer = await router.chat('college_level').ainvoke("서울대학교")
+
+        self.assertEqual(answer, "상위권대학교")
+
+    async def test_other_errors_are_not_retried_on_fallback(self):
+        router = ModelRouter()
+        router._llms = {'gpt-4o-mini': RunnableLambda(lambda _: 1 / 0), 'gpt-4o': RunnableLambda(lambda _: "상위권대학교")}
+
+        with self.assertRaises(ZeroDivisionError):
+            await router.chat('college_level').ainvoke("서울대학교")
+
+class TestLLMUsageCallback(unittest.IsolatedAsyncioTestCase):
+
+    async def test_records_tokens_and_cost(self):
+        stats = LLMUsageStats()
+        callback = LLMUsageCallback('gpt-4o', stats)
+        run_id = uuid.uuid4()
+        message = AIMessage(content="", usage_metadata={'input_tokens': 1000, 'output_tokens': 100, 'total_tokens': 1100})
+
+        await callback.on_chat_model_start({}, [], run_id=run_id)
+        await callback.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]), run_id=run_id)
+
+        usage = stats.snapshot()['-']['gpt-4o']
+        self.assertEqual((usage['calls'], usage['prompt_tokens'], usage['completion_tokens']), (1, 1000, 100))
+        self.assertAlmostEqual(usage['cost_usd'], estimate_cost('gpt-4o', 1000, 100))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import time
+import asyncio
+import unittest
+
+from searchright_technical_assignment.util.llm_scheduler import (
+    RateLimitScheduler, parse_reset_duration, priority_scope, PRIORITY_BULK
+)
+
+class TestRateLimitScheduler(unittest.IsolatedAsyncioTestCase):
+
+    async def test_interactive_calls_are_scheduled_before_bulk(self):
+        scheduler = RateLimitScheduler(default_rpm=0, default_tpm=0, model_limits={}, enabled=True)
+        scheduler.observe_response('gpt-4o', 429, {'retry-after-ms': '50'})
+        order = []
+
+        async def _call(name):
+            async with scheduler.slot('gpt-4o', 10):
+                order.append(name)
+
+        async def _bulk_call(name):
+            with priority_scope(PRIORITY_BULK):
+                await _call(name)
+
+        bulk = asyncio.create_task(_bulk_call('bulk'))
+        await asyncio.sleep(0.01)
+        await asyncio.gather(bulk, _call('interactive'))
+
+        self.assertEqual(order, ['interactive', 'bulk'])
+        self.assertEqual(set(scheduler.stats()['priorities']), {'interactive', 'bulk'})
+
+    async def test_waits_for_token_bucket_refill(self):
+        scheduler = RateLimitScheduler(default_rpm=0, default_tpm=6000, model_limits={}, enabled=True)
+
+        start_time = time.perf_counter()
+        async with scheduler.slot('gpt-4o', 6000):
+            pass
+        async with scheduler.slot('gpt-4o', 10):
+            pass
+
+        # 분당 6000토큰 = 초당 100토큰이므로 10토큰이 다시 채워질 때까지 약 0.1초 기다립니다.
+        self.assertGreaterEqual(time.perf_counter() - start_time, 0.08)
+
+    async def test_backoff_on_one_model_does_not_block_another(self):
+        scheduler = RateLimitScheduler(default_rpm=0, default_tpm=0, model_limits={}, enabled=True)
+        scheduler.observe_response('gpt-4o', 429, {'retry-after': '30'})
+
+        async def _call(model):
+            async with scheduler.slot(model, 10):
+                return model
+
+        self.assertEqual(await asyncio.wait_for(_call('gpt-4o-mini'), timeout=1), 'gpt-4o-mini')
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(_call('gpt-4o'), timeout=0.05)
+        self.assertEqual(scheduler.stats()['queue_depth'], 0)
+
+    def test_provider_headers_update_limits_and_backoff(self):
+        scheduler = RateLimitScheduler(default_rpm=0, default_tpm=0, model_limits={}, enabled=True)
+
+        scheduler.observe_response('gpt-4o', 200, {'x-ratelimit-limit-requests': '500', 'x-ratelimit-limit-tokens': '30000',
+                                                   'x-ratelimit-remaining-tokens': '0', 'x-ratelimit-reset-tokens': '6m0s'})
+
+        self.assertEqual(scheduler.stats()['limits']['gpt-4o'], {'rpm': 500.0, 'tpm': 30000.0})
+        self.assertEqual(scheduler.stats()['backoffs'], 1)
+        self.assertGreater(scheduler._delay('gpt-4o', 1), 300)
+
+    def test_parse_reset_duration(self):
+        self.assertEqual(parse_reset_duration("6m0s"), 360.0)
+        self.assertEqual(parse_reset_duration("20ms"), 0.02)
+        self.assertEqual(parse_reset_duration("1.5"), 1.5)
+        self.assertIsNone(parse_reset_duration(None))
+
+if __name__ == '__main__':
+    unittest.main()
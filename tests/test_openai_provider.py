@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from searchright_technical_assignment.util import embedding
+from searchright_technical_assignment.util.openai_provider import OpenAIProvider, openai_provider
+from searchright_technical_assignment.util.llm_router import model_router
+
+class TestOpenAIProvider(unittest.IsolatedAsyncioTestCase):
+
+    def test_clients_share_one_connection_pool(self):
+        provider = OpenAIProvider()
+
+        chat = provider.chat_model(model='gpt-4o-mini')
+        embeddings = provider.embeddings()
+
+        self.assertIs(provider.http_async_client(), provider.http_async_client())
+        self.assertIs(chat.http_async_client, provider.http_async_client())
+        self.assertIs(embeddings.http_async_client, provider.http_async_client())
+        self.assertIs(provider.embeddings(), embeddings)
+        self.assertIs(provider.async_client(), provider.async_client())
+
+    def test_routed_models_use_process_provider(self):
+        self.assertIs(model_router.llm('gpt-4o').http_async_client, openai_provider.http_async_client())
+
+    async def test_generate_embedding_reuses_shared_client(self):
+        client = MagicMock()
+        client.embeddings.create = AsyncMock(return_value=MagicMock(data=[MagicMock(embedding=[0.1, 0.2])]))
+
+        with patch.object(embedding.openai_provider, 'async_client', return_value=client) as async_client, \
+                patch.dict(embedding.embedding_cache, clear=True):
+            first = await embedding.generate_embedding(["회사 뉴스"])
+            await embedding.generate_embedding(["다른 뉴스"])
+
+        self.assertEqual(first, [[0.1, 0.2]])
+        self.assertEqual(async_client.call_count, 2)
+        self.assertEqual(client.embeddings.create.await_count, 2)
+
+    async def test_aclose_releases_pool(self):
+        provider = OpenAIProvider()
+        first = provider.http_async_client()
+
+        await provider.aclose()
+
+        self.assertTrue(first.is_closed)
+        self.assertIsNot(provider.http_async_client(), first)
+
+    async def test_routed_models_are_rebuilt_after_pool_is_closed(self):
+        before = model_router.llm('gpt-4o')
+
+        await openai_provider.aclose()
+        after = model_router.llm('gpt-4o')
+
+        self.assertIsNot(after, before)
+        self.assertFalse(after.http_async_client.is_closed)
+        self.assertIs(after.http_async_client, openai_provider.http_async_client())
+
+if __name__ == '__main__':
+    unittest.main()
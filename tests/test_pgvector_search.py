@@ -0,0 +1,98 @@
+import asyncio
+import datetime
+import unittest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from searchright_technical_assignment.retriever import pgvector
+from searchright_technical_assignment.retriever.pgvector import date_window
+
+def _row(news_id, news_date, distance):
+    return SimpleNamespace(id=news_id, company_id=1, title=f"뉴스{news_id}", content=f"본문{news_id}", chunk_index=0,
+                           original_link=None, news_date=news_date, distance=distance)
+
+class TestAsyncVectorSearch(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.session = MagicMock()
+        self.session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[
+            _row(1, datetime.date(2019, 5, 1), 0.1),
+            _row(3, datetime.date(2020, 1, 15), 0.3),
+        ])))
+        self.session.begin_nested = MagicMock(return_value=MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)))
+
+        @asynccontextmanager
+        async def _get_db():
+            yield self.session
+
+        for patcher in (patch.object(pgvector, 'get_db', _get_db),
+                        patch.object(pgvector.openai_provider, 'embeddings', return_value=MagicMock(aembed_query=AsyncMock(return_value=[0.1] * 1536)))):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _search_sql(self):
+        statement = self.session.execute.call_args_list[-1].args[0]
+        return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": False}))
+
+    async def test_single_cosine_distance_query_on_shared_engine(self):
+        docs = await pgvector.search_by_keyword("네이버", k=2)
+
+        self.assertEqual([doc.metadata['id'] for doc in docs], [1, 3])
+        sql = self._search_sql()
+        self.assertIn("combined_embedding <=>", sql)
+        self.assertNotIn("company_news.combined_embedding,", sql)
+        self.assertNotIn("news_date >=", sql)
+
+    async def test_company_and_period_are_filtered_in_sql(self):
+        await pgvector.search_by_keyword("네이버의 투자 규모", k=3, start_date_obj={'year': 2019, 'month': 1},
+                                         end_date_obj={'year': 2020}, company_name="네이버")
+
+        statement = self.session.execute.call_args_list[-1].args[0]
+        sql = self._search_sql()
+        params = statement.compile(dialect=postgresql.dialect()).params
+        self.assertIn("company_news.company_id IN (SELECT company.id", sql)
+        self.assertIn("company_news.news_date >=", sql)
+        self.assertIn("company_news.news_date <=", sql)
+        self.assertIn("네이버", params.values())
+        self.assertIn(datetime.date(2020, 12, 31), params.values())
+        self.assertIn(3, params.values())
+
+    async def test_iterative_scan_is_enabled_for_the_transaction(self):
+        await pgvector.search_by_keyword("네이버", k=3, company_name="네이버")
+
+        settings = [str(call.args[0]) for call in self.session.execute.call_args_list[:-1]]
+        self.assertTrue(any("hnsw.iterative_scan" in sql for sql in settings))
+
+    async def test_concurrent_searches_share_a_session_cap(self):
+        open_sessions, peak = 0, 0
+
+        @asynccontextmanager
+        async def _get_db():
+            nonlocal open_sessions, peak
+            open_sessions += 1
+            peak = max(peak, open_sessions)
+            try:
+                await asyncio.sleep(0.01)
+                yield self.session
+            finally:
+                open_sessions -= 1
+
+        with patch.object(pgvector, 'get_db', _get_db), patch.object(pgvector, 'PGVECTOR_MAX_CONCURRENT_SEARCHES', 2), \
+                patch.object(pgvector, '_search_semaphore', None):
+            results = await asyncio.gather(*[pgvector.search_by_keyword(f"회사{i}", k=2) for i in range(6)])
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(peak, 2)
+
+class TestDateWindow(unittest.TestCase):
+
+    def test_employment_period_to_news_date_bounds(self):
+        self.assertEqual(date_window({'year': 2019, 'month': 2}, {'year': 2020, 'month': 2}),
+                         (datetime.date(2019, 2, 1), datetime.date(2020, 2, 29)))
+        self.assertEqual(date_window({'year': 2019}, None), (datetime.date(2019, 1, 1), None))
+
+if __name__ == '__main__':
+    unittest.main()
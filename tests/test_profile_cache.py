@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from searchright_technical_assignment.router import profilling_router
+from searchright_technical_assignment.schema.talent_dto import TalentIn
+from searchright_technical_assignment.util import leadership_rules
+from searchright_technical_assignment.util.admission import AdmissionController
+from searchright_technical_assignment.util.school_tier_index import SchoolTierIndex
+from searchright_technical_assignment.util.cache import LRUTTLCache, SqliteCache, TieredCache
+from searchright_technical_assignment.workflows import profile_cache
+from searchright_technical_assignment.workflows.profiling_runner import build_profiling_inputs, run_profiling
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestCache(unittest.IsolatedAsyncioTestCase):
+
+    def test_lru_eviction_and_ttl(self):
+        clock = _Clock()
+        cache = LRUTTLCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)  # 가장 오래 사용되지 않은 b 제거
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+        clock.now = 11
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 1)
+
+    async def test_sqlite_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite")
+            first = TieredCache(LRUTTLCache(), SqliteCache(path))
+            await first.aset("key", {"리더쉽": ["CTO"]})
+            first.disk.close()
+
+            second = TieredCache(LRUTTLCache(), SqliteCache(path))
+            self.assertEqual(await second.aget("key"), {"리더쉽": ["CTO"]})
+            self.assertEqual(len(second.memory), 1)
+            second.disk.close()
+
+class TestProfileCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        patcher = patch.object(profile_cache, "profile_cache", TieredCache(LRUTTLCache()))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_key_ignores_whitespace_and_skill_order(self):
+        a = TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=["Python", "Go"])
+        b = TalentIn(educations=[{"schoolName": " 서울대학교 ", "startEndDate": "2010 - 2014"}], skills=["Go", "Python", "Go"])
+        c = TalentIn(educations=[{"schoolName": "연세대학교", "startEndDate": "2010 - 2014"}], skills=["Python", "Go"])
+
+        key = lambda item: profile_cache.profile_cache_key(build_profiling_inputs(item))
+        self.assertEqual(key(a), key(b))
+        self.assertNotEqual(key(a), key(c))
+
+    def test_key_changes_with_node_model_routing(self):
+        item = TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=["Python"])
+        key = lambda: profile_cache.profile_cache_key(build_profiling_inputs(item))
+
+        before = key()
+        with patch.dict(os.environ, {"LLM_MODEL_LEADERSHIP": "gpt-4o"}):
+            routed = key()
+
+        self.assertNotEqual(before, routed)
+        self.assertEqual(before, key())
+
+    def test_key_changes_with_local_rules_and_school_index(self):
+        item = TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=["Python"])
+        key = lambda: profile_cache.profile_cache_key(build_profiling_inputs(item))
+        before = key()
+
+        with patch.object(leadership_rules, "LEADERSHIP_RULES_ENABLED", not leadership_rules.LEADERSHIP_RULES_ENABLED):
+            self.assertNotEqual(key(), before)
+
+        relabeled = SchoolTierIndex(seed={"상위권대학교": ["서울대학교"], "중위권대학교": ["가나다대학교"]})
+        with patch.object(profile_cache, "school_tier_index", relabeled):
+            first = key()
+            relabeled.add("가나다대학교", "하위권대학교")
+            self.assertNotEqual(key(), first)
+
+    async def test_second_run_skips_graph(self):
+        app = AsyncMock()
+        app.checkpointer = None
+        app.ainvoke.return_value = {'profile': {'상위권대학교': '서울대학교'}}
+        item = TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=[], positions=[])
+
+        with patch("searchright_technical_assignment.workflows.profiling_runner.get_profiling_graph", return_value=app):
+            first = await run_profiling(item)
+            second = await run_profiling(item)
+
+        app.ainvoke.assert_called_once()
+        self.assertEqual(first['profile'], second['profile'])
+
+    async def test_cache_hit_bypasses_admission(self):
+        app = AsyncMock()
+        app.checkpointer = None
+        app.ainvoke.return_value = {'profile': {'상위권대학교': '서울대학교'}}
+        item = TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=[], positions=[])
+        admission = AdmissionController(max_concurrency=1, initial_service_time_seconds=5)
+
+        with patch("searchright_technical_assignment.workflows.profiling_runner.get_profiling_graph", return_value=app), \
+                patch.object(profilling_router, "profiling_admission", admission):
+            await profilling_router.profilling(item, timings=False, x_latency_budget_ms=None)
+            service_time = admission.service_time
+            second = await profilling_router.profilling(item, timings=False, x_latency_budget_ms=None)
+
+        app.ainvoke.assert_called_once()
+        self.assertEqual(second.status, "success")
+        self.assertEqual(admission.admitted, 1)
+        self.assertEqual(admission.service_time, service_time)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import json
+import tempfile
+import unittest
+
+from searchright_technical_assignment.workflows.profiling_bulk import run_bulk_profiling
+
+def _read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+class TestProfilingBulk(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.input_path = os.path.join(self.tmp.name, "talents.jsonl")
+        self.output_path = os.path.join(self.tmp.name, "profiles.jsonl")
+        with open(self.input_path, 'w', encoding='utf-8') as f:
+            for i in range(5):
+                f.write(json.dumps({"id": f"t{i}", "skills": [f"skill{i}"]}) + "\n")
+
+    async def test_resume_skips_completed_and_retries_failed(self):
+        calls = []
+
+        async def flaky_runner(item, thread_id=None):
+            calls.append(item.skills[0])
+            if item.skills[0] == "skill3":
+                raise RuntimeError("LLM 오류")
+            return {'profile': {'skills': item.skills}}
+
+        stats = await run_bulk_profiling(self.input_path, self.output_path, concurrency=2, runner=flaky_runner)
+        self.assertEqual((stats["succeeded"], stats["failed"]), (4, 1))
+        self.assertEqual(len(calls), 5)
+
+        # 비정상 종료로 마지막 줄이 잘린 상황을 만듭니다.
+        with open(self.output_path, 'a', encoding='utf-8') as f:
+            f.write('{"id": "t9", "sta')
+
+        calls.clear()
+
+        async def runner(item, thread_id=None):
+            calls.append((item.skills[0], thread_id))
+            return {'profile': {'skills': item.skills}}
+
+        stats = await run_bulk_profiling(self.input_path, self.output_path, concurrency=2, runner=runner)
+        # 실패한 지원자는 지원자 ID를 thread_id로 다시 실행되어 체크포인트에서 이어서 처리됩니다.
+        self.assertEqual(calls, [("skill3", "t3")])
+        self.assertEqual(stats["skipped"], 4)
+
+        lines = [line for line in open(self.output_path, encoding='utf-8').read().splitlines() if line.startswith('{"id": "t3"')]
+        self.assertEqual(json.loads(lines[-1])["status"], "success")
+
+    async def test_repeated_id_runs_once(self):
+        with open(self.input_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"id": "t1", "skills": ["skill1-again"]}) + "\n")
+        calls = []
+
+        async def runner(item, thread_id=None):
+            calls.append((item.skills[0], thread_id))
+            return {'profile': {'skills': item.skills}}
+
+        stats = await run_bulk_profiling(self.input_path, self.output_path, concurrency=4, runner=runner)
+
+        self.assertEqual(stats["duplicates"], 1)
+        self.assertEqual([call for call in calls if call[1] == "t1"], [("skill1", "t1")])
+        self.assertEqual(sorted(record["id"] for record in _read_jsonl(self.output_path)), ["t0", "t1", "t2", "t3", "t4"])
+
+    async def test_invalid_line_is_reported(self):
+        with open(self.input_path, 'a', encoding='utf-8') as f:
+            f.write("not json\n")
+
+        async def runner(item, thread_id=None):
+            return {'profile': {}, 'missing_dimensions': ['company_size']}
+
+        stats = await run_bulk_profiling(self.input_path, self.output_path, concurrency=3, runner=runner)
+        records = {record["id"]: record for record in _read_jsonl(self.output_path)}
+
+        self.assertEqual(stats["processed"], 6)
+        self.assertEqual(records["line:6"]["status"], "error")
+        self.assertEqual(records["t0"]["status"], "partial")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+
+from searchright_technical_assignment.schema.talent_dto import TalentIn
+from searchright_technical_assignment.workflows.profiling_jobs import (
+    ProfilingJobQueue, JobQueueFull, JOB_SUCCEEDED, JOB_FAILED, JOB_QUEUED
+)
+
+class TestProfilingJobQueue(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self):
+        await self.queue.stop()
+
+    async def test_jobs_run_with_bounded_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def runner(item, thread_id=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {'profile': {'skills': item.skills}}
+
+        self.queue = ProfilingJobQueue(workers=2, runner=runner)
+        jobs = [await self.queue.submit(TalentIn(skills=[str(i)])) for i in range(6)]
+
+        for job in jobs:
+            self.assertTrue(await self.queue.wait(job, timeout=1))
+
+        self.assertEqual(peak, 2)
+        self.assertTrue(all(job.status == JOB_SUCCEEDED for job in jobs))
+        self.assertEqual(jobs[3].outputs, {'profile': {'skills': ['3']}})
+        self.assertEqual(self.queue.stats()["jobs"][JOB_SUCCEEDED], 6)
+
+    async def test_failed_job_records_error(self):
+        async def runner(item, thread_id=None):
+            raise RuntimeError("LLM 오류")
+
+        self.queue = ProfilingJobQueue(workers=1, runner=runner)
+        job = await self.queue.submit(TalentIn())
+
+        self.assertTrue(await self.queue.wait(job, timeout=1))
+        self.assertEqual(job.status, JOB_FAILED)
+        self.assertEqual(job.error, "LLM 오류")
+
+    async def test_full_queue_rejects_and_wait_times_out(self):
+        gate = asyncio.Event()
+
+        async def runner(item, thread_id=None):
+            await gate.wait()
+            return {'profile': {}}
+
+        self.queue = ProfilingJobQueue(workers=1, max_queue_size=1, runner=runner)
+        first = await self.queue.submit(TalentIn())
+        await asyncio.sleep(0)  # 워커가 첫 작업을 꺼내도록 양보
+        second = await self.queue.submit(TalentIn())
+
+        with self.assertRaises(JobQueueFull):
+            await self.queue.submit(TalentIn())
+        self.assertFalse(await self.queue.wait(second, timeout=0.01))
+        self.assertEqual(second.status, JOB_QUEUED)
+
+        gate.set()
+        self.assertTrue(await self.queue.wait(first, timeout=1))
+        self.assertTrue(await self.queue.wait(second, timeout=1))
+
+    async def test_expired_results_are_purged(self):
+        async def runner(item, thread_id=None):
+            return {'profile': {}}
+
+        self.queue = ProfilingJobQueue(workers=1, result_ttl_seconds=0, runner=runner)
+        job = await self.queue.submit(TalentIn())
+        await self.queue.wait(job, timeout=1)
+        await asyncio.sleep(0.01)
+
+        self.assertIsNone(self.queue.get(job.job_id))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,24 @@
+import datetime
 import unittest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, AsyncMock
 
-from searchright_technical_assignment.node.profiling_node import college_level, leadership, company_size, experience, combine
+from searchright_technical_assignment.node.profiling_node import college_level, leadership, company_size, experience, combine, combined_profile
 from searchright_technical_assignment.state.profiling_state import ProfilingState
-from searchright_technical_assignment.schema.response_dto import LeadershipResponse, CompanySizeResponse, ExperienceResponse, CompanySizeItem, ExperienceItem
+from searchright_technical_assignment.util import llm_cache
+from searchright_technical_assignment.retriever import pgvector
+from searchright_technical_assignment.schema.response_dto import LeadershipResponse, CompanySizeResponse, ExperienceResponse, CompanySizeItem, ExperienceItem, CombinedProfileResponse
 from langchain.schema import Document
 
 class TestProfilingNode(unittest.IsolatedAsyncioTestCase):
 
+    def setUp(self):
+        # 프로세스 단위 LLM 응답 캐시가 다른 테스트의 결과를 돌려주지 않도록 비활성화합니다.
+        patcher = patch.object(llm_cache, "llm_cache", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     async def test_college_level(self):
         # Mock chain
         mock_chain = AsyncMock()
@@ -18,7 +29,7 @@ class TestProfilingNode(unittest.IsolatedAsyncioTestCase):
 
         state = ProfilingState(
             talent_id="test_id",
-            college="서울대학교",
+            college="테스트대학교",
             skills=[],
             titles=[],
             companynames_and_dates=[],
@@ -29,7 +40,24 @@ class TestProfilingNode(unittest.IsolatedAsyncioTestCase):
             result = await college_level(state, mock_prompt_template)
 
             self.assertEqual(result, {'college_level': '상위권 대학'})
-            mock_chain.ainvoke.assert_called_once_with({'college': '서울대학교'})
+            mock_chain.ainvoke.assert_called_once_with({'college': '테스트대학교'})
+
+    async def test_college_level_uses_school_tier_index(self):
+        mock_prompt_template = MagicMock()
+
+        state = ProfilingState(
+            talent_id="test_id",
+            college="서울대학교 (Seoul National University)",
+            skills=[],
+            titles=[],
+            companynames_and_dates=[],
+            descriptions=[]
+        )
+
+        result = await college_level(state, mock_prompt_template)
+
+        self.assertEqual(result, {'college_level': '상위권대학교'})
+        mock_prompt_template.__or__.assert_not_called()
 
     async def test_leadership(self):
         mock_leadership_response = LeadershipResponse(leadership="리더십 경험 있음", reason=["팀 프로젝트 리더 경험"])
@@ -43,8 +71,8 @@ class TestProfilingNode(unittest.IsolatedAsyncioTestCase):
         state = ProfilingState(
             talent_id="test_id",
             college="",
-            skills=["팀 리더", "프로젝트 관리"],
-            titles=["팀장"],
+            skills=["프로젝트 관리", "멘토링"],
+            titles=["프로젝트 매니저"],
             companynames_and_dates=[],
             descriptions=[]
         )
@@ -57,7 +85,7 @@ class TestProfilingNode(unittest.IsolatedAsyncioTestCase):
                 'leadership_reason': ['팀 프로젝트 리더 경험']
             })
             mock_chain.ainvoke.assert_called_once_with(
-                {'skills': ['팀 리더', '프로젝트 관리'], 'titles': ['팀장']}
+                {'skills': ['프로젝트 관리', '멘토링'], 'titles': ['프로젝트 매니저']}
             )
 
     @patch('searchright_technical_assignment.node.profiling_node.get_db')
@@ -113,6 +141,83 @@ class TestProfilingNode(unittest.IsolatedAsyncioTestCase):
         })
         mock_chain.ainvoke.assert_called_once()
 
+    def _patch_vector_search(self, rows):
+        # 질의 임베딩과 벡터 검색 쿼리를 모의하여 company_size 노드 → search_by_keyword 경로 전체를 실행합니다.
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=rows)))
+        session.begin_nested = MagicMock(return_value=MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)))
+
+        @asynccontextmanager
+        async def _get_db():
+            yield session
+
+        aembed_query = AsyncMock(return_value=[0.1] * 1536)
+        for patcher in (patch.object(pgvector, 'get_db', _get_db),
+                        patch.object(pgvector.openai_provider, 'embeddings', return_value=MagicMock(aembed_query=aembed_query))):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return session, aembed_query
+
+    @patch('searchright_technical_assignment.node.profiling_node.get_db')
+    @patch('searchright_technical_assignment.node.profiling_node.CompanyDAO')
+    async def test_company_size_skips_news_search_for_company_missing_from_db(self, MockCompanyDAO, MockGetDb):
+        MockGetDb.return_value.__aenter__.return_value = AsyncMock()
+        MockCompanyDAO.return_value.get_data_by_names = AsyncMock(return_value=[
+            ("네이버", {"mae": "대기업",
+                      "investment": {"data": [{"level": "IPO", "announcedAt": {"value": "2020-06-01T00:00:00"}}]},
+                      "organization": {"data": [{"referenceMonth": "2020-06", "value": 4000}]}}),
+        ])
+        session, aembed_query = self._patch_vector_search([])
+
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.return_value = CompanySizeResponse(company_size_and_reason=[])
+        mock_prompt_template = MagicMock()
+        mock_prompt_template.__or__.return_value = mock_chain
+
+        period = [{"start": {"year": 2020, "month": 1}, "end": {"year": 2021, "month": 12}}]
+        state = ProfilingState(
+            talent_id="test_id", college="", skills=[], titles=[], descriptions=[],
+            companynames_and_dates=[{"companyName": "네이버", "startEndDates": period},
+                                    {"companyName": "스타트업B", "startEndDates": period}]
+        )
+
+        await company_size(state, mock_prompt_template)
+
+        # company 행이 없는 회사는 저장된 뉴스가 없으므로 임베딩/벡터 쿼리 없이 LLM이 판단합니다.
+        aembed_query.assert_not_awaited()
+        session.execute.assert_not_awaited()
+        self.assertEqual(mock_chain.ainvoke.call_args.args[0]['company_news_contents'], {})
+
+    @patch('searchright_technical_assignment.node.profiling_node.get_db')
+    @patch('searchright_technical_assignment.node.profiling_node.CompanyDAO')
+    async def test_company_size_searches_own_news_when_period_info_is_missing(self, MockCompanyDAO, MockGetDb):
+        MockGetDb.return_value.__aenter__.return_value = AsyncMock()
+        MockCompanyDAO.return_value.get_data_by_names = AsyncMock(return_value=[
+            ("스타트업A", {"mae": None, "investment": {"data": []}, "organization": {"data": []}}),
+        ])
+        news_row = SimpleNamespace(id=7, company_id=1, title="스타트업A 시리즈A", content="스타트업A는 2020년 50억 투자 유치.",
+                                   chunk_index=0, original_link=None, news_date=datetime.date(2020, 3, 1), distance=0.2)
+        session, aembed_query = self._patch_vector_search([news_row])
+
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.return_value = CompanySizeResponse(company_size_and_reason=[])
+        mock_prompt_template = MagicMock()
+        mock_prompt_template.__or__.return_value = mock_chain
+
+        state = ProfilingState(
+            talent_id="test_id", college="", skills=[], titles=[], descriptions=[],
+            companynames_and_dates=[{"companyName": "스타트업A",
+                                     "startEndDates": [{"start": {"year": 2020, "month": 1}, "end": {"year": 2021, "month": 12}}]}]
+        )
+
+        await company_size(state, mock_prompt_template)
+
+        aembed_query.assert_awaited_once()
+        params = session.execute.call_args_list[-1].args[0].compile().params
+        self.assertIn("스타트업A", params.values())
+        news = mock_chain.ainvoke.call_args.args[0]['company_news_contents']
+        self.assertEqual([doc.page_content for doc in news["스타트업A"]], ["스타트업A는 2020년 50억 투자 유치."])
+
     @patch('searchright_technical_assignment.node.profiling_node.get_db')
     @patch('searchright_technical_assignment.node.profiling_node.CompanyDAO')
     async def test_experience(self, MockCompanyDAO, MockGetDb):
@@ -161,6 +266,53 @@ class TestProfilingNode(unittest.IsolatedAsyncioTestCase):
         })
         mock_chain.ainvoke.assert_called_once()
 
+    @patch('searchright_technical_assignment.node.profiling_node.get_db')
+    @patch('searchright_technical_assignment.node.profiling_node.CompanyDAO')
+    @patch('searchright_technical_assignment.node.profiling_node.search_by_keyword', new_callable=AsyncMock)
+    async def test_combined_profile(self, MockSearchByKeyword, MockCompanyDAO, MockGetDb):
+        MockGetDb.return_value.__aenter__.return_value = AsyncMock()
+        MockCompanyDAO.return_value.get_data_by_names = AsyncMock(return_value=[
+            ("네이버", {"products": [{"name": "네이버 검색"}]}),
+        ])
+
+        expected_llm_response = CombinedProfileResponse(
+            college_level="중위권대학교",
+            leadership="리더쉽",
+            leadership_reason=["테크 리드"],
+            company_size_and_reason=[CompanySizeItem(company_size="대규모 회사 경험", reasons=["네이버"])],
+            experience_and_reason=[ExperienceItem(experience="검색 서비스 개발", reasons="네이버 검색")]
+        )
+
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.return_value = expected_llm_response
+
+        mock_prompt_template = MagicMock()
+        mock_prompt_template.__or__.return_value = mock_chain
+
+        state = ProfilingState(
+            talent_id="test_id",
+            college="테스트대학교",
+            skills=["Python"],
+            titles=["테크 리드"],
+            companynames_and_dates=[{"companyName": "네이버", "startEndDates": []}],
+            descriptions=["네이버에서 검색 서비스 개발"]
+        )
+
+        result = await combined_profile(state, mock_prompt_template)
+
+        self.assertEqual(result, {
+            'college_level': '중위권대학교',
+            'leadership': '리더쉽',
+            'leadership_reason': ['테크 리드'],
+            'company_size_and_reason': [CompanySizeItem(company_size="대규모 회사 경험", reasons=["네이버"])],
+            'experience_and_reason': [ExperienceItem(experience="검색 서비스 개발", reasons="네이버 검색")]
+        })
+        # DB 조회는 회사 규모/경험 판단이 공유하고, LLM은 한 번만 호출됩니다.
+        mock_chain.ainvoke.assert_called_once()
+        inputs = mock_chain.ainvoke.call_args.args[0]
+        self.assertEqual(inputs['company_products'], [{"name": "네이버", "products": ["네이버 검색"]}])
+        MockSearchByKeyword.assert_not_called()
+
     def test_combine(self):
         state = ProfilingState(
             talent_id="test_id",
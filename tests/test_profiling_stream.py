@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+
+from langgraph.graph import StateGraph, END
+
+from searchright_technical_assignment.node.profiling_node import build_profile, combine
+from searchright_technical_assignment.schema.response_dto import CompanySizeItem, ExperienceItem
+from searchright_technical_assignment.schema.talent_dto import TalentIn
+from searchright_technical_assignment.state.profiling_state import ProfilingState
+from searchright_technical_assignment.workflows.profiling_runner import stream_profiling
+
+async def _college_level(state):
+    await asyncio.sleep(0.01)
+    return {'college_level': '상위권대학교'}
+
+async def _leadership(state):
+    await asyncio.sleep(0.03)
+    return {'leadership': '리더쉽', 'leadership_reason': ['팀장']}
+
+async def _company_size(state):
+    await asyncio.sleep(0.05)
+    return {'company_size_and_reason': [CompanySizeItem(company_size="대규모 회사 경험", reasons=["네이버"])]}
+
+async def _experience(state):
+    await asyncio.sleep(0.02)
+    return {'experience_and_reason': [ExperienceItem(experience="검색 서비스 경험", reasons="네이버 검색 개발")]}
+
+def _build_fake_graph():
+    workflow = StateGraph(ProfilingState)
+    workflow.add_node("input", lambda state: state)
+    workflow.add_node("college_level", _college_level)
+    workflow.add_node("leadership", _leadership)
+    workflow.add_node("company_size", _company_size)
+    workflow.add_node("experience", _experience)
+    workflow.add_node("combine", combine)
+    for node in ["college_level", "leadership", "company_size", "experience"]:
+        workflow.add_edge("input", node)
+        workflow.add_edge(node, "combine")
+    workflow.add_edge("combine", END)
+    workflow.set_entry_point("input")
+    return workflow.compile()
+
+class TestProfilingStream(unittest.IsolatedAsyncioTestCase):
+
+    async def test_nodes_are_streamed_in_completion_order(self):
+        item = TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=[], positions=[])
+
+        updates = [update async for update in stream_profiling(item, app=_build_fake_graph())]
+
+        self.assertEqual([u["node"] for u in updates],
+                         ["college_level", "experience", "leadership", "company_size", "combine"])
+        self.assertEqual(updates[0]["profile"], {"상위권대학교": "서울대학교"})
+        self.assertFalse(updates[0]["final"])
+        self.assertTrue(updates[-1]["final"])
+        self.assertEqual(updates[-1]["profile"], {
+            "상위권대학교": "서울대학교",
+            "리더쉽": ["팀장"],
+            "대규모 회사 경험": ["네이버"],
+            "검색 서비스 경험": "네이버 검색 개발",
+        })
+
+    def test_build_profile_skips_missing_dimensions(self):
+        self.assertEqual(build_profile({'college': '서울대학교'}), {})
+        self.assertEqual(build_profile({'leadership': '리더쉽', 'leadership_reason': ['CTO']}), {'리더쉽': ['CTO']})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import patch
+
+from langchain_core.documents import Document
+
+from searchright_technical_assignment.util import prompt_budget
+from searchright_technical_assignment.util.prompt_budget import (
+    count_tokens, truncate_tokens, compact_company_news, compact_company_size_inputs, compact_experience_inputs
+)
+
+class TestPromptBudget(unittest.TestCase):
+
+    def setUp(self):
+        # 인코딩 파일 다운로드 없이 결정적인 추정치로 검증합니다.
+        patcher = patch.object(prompt_budget, '_encoding', lambda model: None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_count_and_truncate(self):
+        self.assertEqual(count_tokens("abcdefgh", "gpt-4o"), 2)
+        self.assertEqual(count_tokens("회사규모", "gpt-4o"), 4)
+        self.assertLessEqual(count_tokens(truncate_tokens("가" * 100, 10, "gpt-4o"), "gpt-4o"), 10)
+
+    def test_small_inputs_are_unchanged(self):
+        inputs = {'companynames_and_dates': [{'companyName': '네이버'}], 'grouped_company_data': [],
+                  'company_news_contents': {'스타트업A': [Document(page_content="투자 유치")]}}
+
+        self.assertIs(compact_company_size_inputs(inputs, "gpt-4o", budget=1000), inputs)
+
+    def test_news_is_deduplicated_and_top_ranked_kept_per_company(self):
+        news = {
+            'A': [Document(page_content="A 1순위 " + "가" * 100), Document(page_content="A 1순위 " + "가" * 100),
+                  Document(page_content="A 2순위 " + "나" * 100)],
+            'B': [Document(page_content="B 1순위 " + "다" * 100), Document(page_content="B 2순위 " + "라" * 100)],
+        }
+
+        compacted = compact_company_news(news, budget=230, model="gpt-4o")
+
+        self.assertEqual([d.page_content[:5] for d in compacted['A']], ["A 1순위"])
+        self.assertEqual([d.page_content[:5] for d in compacted['B']], ["B 1순위"])
+
+    def test_experience_keeps_recent_descriptions_within_budget(self):
+        inputs = {'descriptions': ["최근 경력 " + "가" * 300, "최근 경력 " + "가" * 300, "오래된 경력 " + "나" * 300],
+                  'grouped_company_data': [{'name': '네이버', 'products': ["검색"] * 3 + [f"제품{i}" for i in range(20)]}]}
+
+        compacted = compact_experience_inputs(inputs, "gpt-4o", budget=500)
+
+        self.assertTrue(compacted['descriptions'][0].startswith("최근 경력"))
+        self.assertEqual(len(compacted['descriptions']), 2)
+        self.assertEqual(compacted['grouped_company_data'][0]['products'][:2], ["검색", "제품0"])
+        self.assertEqual(len(compacted['grouped_company_data'][0]['products']), prompt_budget.PRODUCTS_MAX_PER_COMPANY)
+        self.assertLessEqual(count_tokens(str(compacted['descriptions']), "gpt-4o")
+                             + count_tokens(str(compacted['grouped_company_data']), "gpt-4o"), 500)
+
+if __name__ == '__main__':
+    unittest.main()
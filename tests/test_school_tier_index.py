@@ -0,0 +1,53 @@
+import os
+import json
+import tempfile
+import unittest
+
+from searchright_technical_assignment.util.school_tier_index import (
+    SchoolTierIndex, normalize_school_name, TIER_TOP, TIER_MID, TIER_LOW, NO_EDUCATION
+)
+from searchright_technical_assignment.workflows.label_school_tiers import label_unseen_schools, parse_tier
+
+class TestSchoolTierIndex(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.index = SchoolTierIndex()
+
+    def test_normalization(self):
+        self.assertEqual(normalize_school_name("서울대학교"), normalize_school_name("서울대"))
+        self.assertEqual(normalize_school_name("University of Chicago"), normalize_school_name("the university of  chicago"))
+
+    def test_spelling_variants_and_abbreviations(self):
+        for name in ["서울대학교", "서울대", "Seoul National University", "서울대학교 (Seoul National University)",
+                     "KAIST", "한국과학기술원", "postech", "포항공대", "Standford University"]:
+            self.assertEqual(self.index.lookup(name), TIER_TOP, name)
+        self.assertEqual(self.index.lookup("이화여대"), TIER_MID)
+        self.assertEqual(self.index.lookup("Penn State"), TIER_MID)
+        self.assertEqual(self.index.lookup("OO사이버대학교"), TIER_LOW)
+        self.assertEqual(self.index.lookup("최종 학력 정보 없음"), NO_EDUCATION)
+
+    def test_similar_names_are_not_confused(self):
+        self.assertIsNone(self.index.lookup("서울시립대학교"))
+        self.assertIsNone(self.index.lookup("고려대학교 세종캠퍼스"))
+        self.assertIsNone(self.index.lookup("Emory University - Goizueta Business School"))
+
+    async def test_offline_labeling_adds_unseen_schools(self):
+        async def labeler(name):
+            return {"에모리대학교": "중위권대학교", "알수없음대학교": "모르겠습니다"}[name]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "school_tiers.json")
+            labels = await label_unseen_schools(["서울대학교", "에모리대학교", "알수없음대학교"], self.index, labeler=labeler)
+            self.assertEqual(labels, {"에모리대학교": TIER_MID})
+
+            self.index.save_overlay(labels, path)
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), {"에모리대학교": TIER_MID})
+            self.assertEqual(SchoolTierIndex(overlay_path=path).lookup("에모리대"), TIER_MID)
+
+    def test_parse_tier(self):
+        self.assertEqual(parse_tier("상위권대학교"), TIER_TOP)
+        self.assertIsNone(parse_tier("상위권대학교 또는 중위권대학교"))
+
+if __name__ == '__main__':
+    unittest.main()
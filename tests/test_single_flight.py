@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from searchright_technical_assignment.schema.talent_dto import TalentIn
+from searchright_technical_assignment.util.single_flight import SingleFlight
+from searchright_technical_assignment.util.timing import TimingRecorder, timing_scope
+from searchright_technical_assignment.util.llm_scheduler import priority_scope, PRIORITY_BULK
+from searchright_technical_assignment.workflows import profile_cache
+from searchright_technical_assignment.workflows.profiling_runner import run_profiling
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {'profile': {}}
+
+        results = await asyncio.gather(*[flight.do("key", factory) for _ in range(5)])
+
+        self.assertEqual(calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flight.stats(), {"inflight": 0, "leaders": 1, "followers": 4})
+
+    async def test_failure_is_shared_and_not_kept(self):
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("LLM 오류")
+
+        results = await asyncio.gather(flight.do("key", failing), flight.do("key", failing), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+        # 실행이 끝나면 키가 제거되어 다음 호출은 새로 실행됩니다.
+        async def succeeding():
+            return "ok"
+        self.assertEqual(await flight.do("key", succeeding), "ok")
+
+    async def test_identical_profiling_requests_run_graph_once(self):
+        async def slow_ainvoke(inputs, config):
+            await asyncio.sleep(0.01)
+            return {'profile': {'상위권대학교': '서울대학교'}}
+
+        app = AsyncMock()
+        app.checkpointer = None
+        app.ainvoke.side_effect = slow_ainvoke
+        item = TalentIn(educations=[{"schoolName": "서울대학교", "startEndDate": "2010 - 2014"}], skills=["Go"], positions=[])
+
+        with patch.object(profile_cache, "profile_cache", None), \
+             patch("searchright_technical_assignment.workflows.profiling_runner.get_profiling_graph", return_value=app):
+            results = await asyncio.gather(*[run_profiling(item) for _ in range(3)])
+
+        app.ainvoke.assert_called_once()
+        self.assertTrue(all(result['profile'] == {'상위권대학교': '서울대학교'} for result in results))
+
+    async def test_timed_and_different_priority_requests_are_not_coalesced(self):
+        async def slow_ainvoke(inputs, config):
+            await asyncio.sleep(0.01)
+            return {'profile': {}}
+
+        app = AsyncMock()
+        app.checkpointer = None
+        app.ainvoke.side_effect = slow_ainvoke
+        item = TalentIn(skills=["Go"], positions=[])
+
+        async def timed_request():
+            with timing_scope(TimingRecorder()):
+                return await run_profiling(item)
+
+        async def bulk_request():
+            with priority_scope(PRIORITY_BULK):
+                return await run_profiling(item)
+
+        with patch.object(profile_cache, "profile_cache", None), \
+             patch("searchright_technical_assignment.workflows.profiling_runner.get_profiling_graph", return_value=app):
+            # 실행 시간 측정 요청은 각자 실행하고, 대화형 요청은 대량 작업의 실행에 합류하지 않습니다.
+            await asyncio.gather(timed_request(), timed_request())
+            self.assertEqual(app.ainvoke.await_count, 2)
+            await asyncio.gather(bulk_request(), run_profiling(item))
+            self.assertEqual(app.ainvoke.await_count, 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import asyncio
+import unittest
+
+from searchright_technical_assignment.util.timing import TimingRecorder, TimingStats, timed, timed_node, timing_scope, timing_stats
+
+async def _fake_node(state):
+    async with timed("db.get_data_by_names"):
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*[_search() for _ in range(2)])
+    return {}
+
+async def _search():
+    async with timed("vector.search_by_keyword"):
+        await asyncio.sleep(0.01)
+
+class TestTiming(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        timing_stats.reset()
+
+    async def test_node_and_dependency_timings_are_recorded(self):
+        recorder = TimingRecorder()
+        node = timed_node("company_size", _fake_node)
+
+        with timing_scope(recorder):
+            await node({})
+
+        summary = recorder.summary()["company_size"]
+        self.assertGreaterEqual(summary["wall_ms"], 20)
+        self.assertEqual(summary["dependencies"]["db.get_data_by_names"]["count"], 1)
+        self.assertEqual(summary["dependencies"]["vector.search_by_keyword"]["count"], 2)
+
+        snapshot = timing_stats.snapshot()
+        self.assertEqual(snapshot["company_size"]["wall"]["count"], 1)
+        self.assertEqual(snapshot["company_size"]["vector.search_by_keyword"]["count"], 2)
+
+    async def test_without_recorder_only_stats_are_updated(self):
+        await timed_node("leadership", _fake_node)({})
+        self.assertIn("leadership", timing_stats.snapshot())
+
+    def test_percentiles(self):
+        stats = TimingStats()
+        for i in range(1, 101):
+            stats.record("college_level", "llm", i / 1000)
+        self.assertAlmostEqual(stats.percentile("college_level", "llm", 0.5), 0.051)
+        self.assertAlmostEqual(stats.percentile("college_level", "llm", 0.95), 0.096)
+        self.assertIsNone(stats.percentile("experience", "llm", 0.5))
+
+if __name__ == '__main__':
+    unittest.main()